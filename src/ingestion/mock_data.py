@@ -249,6 +249,14 @@ class RetailMockDataGenerator:
 
         return products
 
+    def add_products(self, products: List[Dict[str, Any]]) -> None:
+        """
+        Register an existing product catalog (e.g. generate_products output
+        cached by an earlier run), so generate_orders picks and prices items
+        from it without generating the products again.
+        """
+        self._product_cache.update((product["product_id"], product) for product in products)
+
     def generate_stores(self, count: int) -> List[Dict[str, Any]]:
         """
         Generate Brazilian retail store locations.
@@ -41,7 +41,12 @@ from pyspark.sql.types import (
     TimestampType,
 )
 
-from src.ingestion.bronze_writer import BronzeWriter, WriteMode, get_spark_session
+from src.ingestion.bronze_writer import (
+    BronzeWriter,
+    WriteMode,
+    get_spark_session,
+    records_to_dataframe,
+)
 from src.ingestion.mock_data import RetailMockDataGenerator
 from src.utils.config import get_settings
 from src.utils.logging import PipelineContext, get_logger
@@ -314,7 +319,7 @@ class OracleIngestion:
             raise ValueError(f"Unknown entity: {entity}")
 
         # Convert to DataFrame
-        df = self.spark.createDataFrame(data, schema=schema)
+        df = records_to_dataframe(self.spark, data, schema)
         return df
 
     def ingest_customers(
@@ -24,22 +24,31 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from pyspark.sql import DataFrame, SparkSession
+from pyspark import StorageLevel
+from pyspark.sql import Column, DataFrame, SparkSession
 from pyspark.sql import functions as F
 from pyspark.sql.types import (
     DecimalType,
     IntegerType,
+    LongType,
     StringType,
     StructField,
     StructType,
     TimestampType,
 )
 
-from src.ingestion.bronze_writer import BronzeWriter, WriteMode, get_spark_session
+from src.ingestion.bronze_writer import (
+    BronzeWriter,
+    WriteMode,
+    get_spark_session,
+    records_to_dataframe,
+)
 from src.ingestion.mock_data import RetailMockDataGenerator
 from src.utils.config import get_settings
 from src.utils.logging import PipelineContext, get_logger
@@ -82,6 +91,50 @@ ORDER_ITEMS_SCHEMA = StructType(
     ]
 )
 
+# Schemas for the entities served by the mock-data path
+MOCK_ENTITY_SCHEMAS = {
+    "orders": ORDERS_SCHEMA,
+    "order_items": ORDER_ITEMS_SCHEMA,
+}
+
+# Number of hash buckets used to split the OrderItems JDBC read across executors
+ORDER_ITEMS_READ_PARTITIONS = 32
+
+# Synthetic bucket column added to the source query for hash-partitioned reads
+HASH_PARTITION_COLUMN = "_pk"
+
+# Applied once per JDBC session (one per read partition). READ COMMITTED uses
+# row versioning when the database has READ_COMMITTED_SNAPSHOT enabled.
+SESSION_INIT_STATEMENT = (
+    "SET NOCOUNT ON; SET ARITHABORT ON; SET TRANSACTION ISOLATION LEVEL READ COMMITTED;"
+)
+
+# Table/column names are interpolated into JDBC SQL, so only plain
+# (optionally schema-qualified) identifiers are accepted
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+
+def _validate_identifier(name: str) -> str:
+    """
+    Ensure a table or column name is safe to embed in SQL.
+
+    Raises:
+        ValueError: If the name is not a plain identifier
+    """
+    if not _IDENTIFIER_PATTERN.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+def _to_custom_schema(schema: StructType) -> str:
+    """Render a StructType as a JDBC customSchema DDL string."""
+    return ", ".join(f"{field.name} {field.dataType.simpleString()}" for field in schema.fields)
+
+
+def _cents(column: str) -> Column:
+    """Convert a 2-decimal monetary column to whole cents as a long."""
+    return (F.col(column) * 100).cast(LongType())
+
 
 @dataclass
 class SQLServerConnectionConfig:
@@ -161,6 +214,12 @@ class SQLServerIngestion:
 
         self.bronze_writer = BronzeWriter(self.spark)
         self._mock_generator = None
+        self._mock_frames: Dict[str, DataFrame] = {}
+
+        # Cached order_id keys from the most recent ingest_orders run, reused
+        # by ingest_order_items for referential-integrity validation (None
+        # unless the run read every order: mock data or a full load)
+        self._last_orders_keys: Optional[DataFrame] = None
 
         logger.info(
             "SQLServerIngestion initialized",
@@ -185,6 +244,10 @@ class SQLServerIngestion:
         schema: StructType,
         partition_column: Optional[str] = None,
         num_partitions: int = 8,
+        lower_bound: Optional[int] = None,
+        upper_bound: Optional[int] = None,
+        hash_partition_key: Optional[str] = None,
+        fetch_size: int = 10000,
         watermark_column: Optional[str] = None,
         watermark_value: Optional[datetime] = None,
     ) -> DataFrame:
@@ -195,68 +258,123 @@ class SQLServerIngestion:
         - Higher partition count for transactional tables
         - Optimized fetch size for network efficiency
         - Predicate pushdown for watermark filtering
+        - Hash partitioning for tables without a numeric key
+        - Session defaults applied at connect time (sessionInitStatement)
+        - Column types pinned to the contract schema (customSchema)
+
+        HASH PARTITIONING:
+        Spark can only split a JDBC read on a numeric/date column. For tables
+        keyed by strings (e.g. order_item_id), pass hash_partition_key and a
+        synthetic bucket column ABS(CHECKSUM(key) % num_partitions) is added
+        to the query, so each executor pulls a disjoint slice concurrently.
+        (The modulo comes first: ABS(-2147483648) overflows in SQL Server.)
+        The bucket column is dropped after load.
 
         Args:
             table: Table name (schema.table format)
             schema: Expected PySpark schema
             partition_column: Column for parallel reads
             num_partitions: Number of parallel reads
+            lower_bound: Minimum partition_column value for stride calculation
+            upper_bound: Maximum partition_column value for stride calculation
+            hash_partition_key: String key to hash into num_partitions buckets
+            fetch_size: Rows fetched per JDBC round-trip
             watermark_column: Column for incremental sync
             watermark_value: Cutoff timestamp for incremental
         """
         jdbc_url = self.connection_config.jdbc_url
         password = self._get_password()
 
-        # Build query with optional watermark
+        _validate_identifier(table)
+
+        columns = "*"
+        if hash_partition_key:
+            columns = (
+                f"*, ABS(CHECKSUM({_validate_identifier(hash_partition_key)}) "
+                f"% {int(num_partitions)}) AS {HASH_PARTITION_COLUMN}"
+            )
+            partition_column = HASH_PARTITION_COLUMN
+            lower_bound, upper_bound = 0, num_partitions
+
+        select_sql = f"SELECT {columns} FROM {table}"
+
+        # Watermark is bound as a typed DATETIME2 literal built from a datetime
+        # object (never a caller-supplied string), so the predicate stays
+        # sargable and SQL Server can use an index seek on the column
         if watermark_column and watermark_value:
-            query = f"""
-                (SELECT * FROM {table}
-                 WHERE {watermark_column} > '{watermark_value.strftime('%Y-%m-%d %H:%M:%S')}'
-                ) AS incremental_query
-            """
-        else:
-            query = f"(SELECT * FROM {table}) AS full_query"
+            if not isinstance(watermark_value, datetime):
+                raise TypeError("watermark_value must be a datetime")
+            select_sql += (
+                f" WHERE {_validate_identifier(watermark_column)} > "
+                f"CAST('{watermark_value.strftime('%Y-%m-%dT%H:%M:%S.%f')}' AS DATETIME2)"
+            )
 
         logger.info(
             "Reading from SQL Server",
             table=table,
-            partitions=num_partitions,
+            partitions=num_partitions if partition_column else 1,
             has_watermark=watermark_value is not None,
         )
 
         reader = (
             self.spark.read.format("jdbc")
             .option("url", jdbc_url)
-            .option("dbtable", query)
             .option("user", self.connection_config.user)
             .option("password", password)
             .option("driver", "com.microsoft.sqlserver.jdbc.SQLServerDriver")
-            .option("fetchsize", "10000")
+            .option("fetchsize", str(fetch_size))
+            # Every partition opens its own session; set read defaults in the
+            # same round-trip as the login instead of per statement
+            .option("sessionInitStatement", SESSION_INIT_STATEMENT)
+            .option("queryTimeout", "0")
+            # Map source columns straight to the contract types
+            .option("customSchema", _to_custom_schema(schema))
         )
 
-        if partition_column:
-            reader = reader.option("partitionColumn", partition_column).option(
-                "numPartitions", str(num_partitions)
+        if not partition_column:
+            # Single-connection read: hand the statement to the driver as-is
+            # instead of wrapping it in a derived table
+            return reader.option("query", select_sql).load()
+
+        # Partitioned reads must use dbtable so Spark can append the
+        # per-partition stride predicates (bounds are required by Spark)
+        reader = (
+            reader.option("dbtable", f"({select_sql}) AS source_query")
+            .option("partitionColumn", _validate_identifier(partition_column))
+            .option("numPartitions", str(num_partitions))
+            .option("lowerBound", str(lower_bound if lower_bound is not None else 0))
+            .option(
+                "upperBound",
+                str(upper_bound if upper_bound is not None else num_partitions),
             )
+        )
 
-        return reader.load()
+        df = reader.load()
 
-    def _read_mock_data(self, entity: str) -> DataFrame:
-        """Load mock data for development."""
-        logger.info("Using mock data (development mode)", entity=entity)
+        if hash_partition_key:
+            df = df.drop(HASH_PARTITION_COLUMN)
 
-        all_data = self.mock_generator.generate_all()
+        return df
 
-        if entity == "orders":
-            data = all_data["orders"]
-            schema = ORDERS_SCHEMA
-        elif entity == "order_items":
-            data = all_data["order_items"]
-            schema = ORDER_ITEMS_SCHEMA
-        else:
+    def _read_mock_data(self, entity: str) -> DataFrame:
+        """
+        Load mock data for development.
+
+        The generator reseeds on every generate_all call, so its output is
+        fixed; the DataFrame for each entity is built once per instance and
+        reused, skipping regeneration and the schema hand-off to the JVM.
+        """
+        if entity not in MOCK_ENTITY_SCHEMAS:
             raise ValueError(f"Unknown entity: {entity}")
 
-        return self.spark.createDataFrame(data, schema=schema)
+        if entity not in self._mock_frames:
+            logger.info("Using mock data (development mode)", entity=entity)
+            all_data = self.mock_generator.generate_all()
+            self._mock_frames[entity] = records_to_dataframe(
+                self.spark, all_data[entity], MOCK_ENTITY_SCHEMAS[entity]
+            )
+
+        return self._mock_frames[entity]
 
     def _validate_referential_integrity(
         self,
@@ -276,27 +394,116 @@ class SQLServerIngestion:
         Returns:
             Tuple of (valid_records, quarantined_records)
         """
-        order_ids = orders_df.select("order_id").distinct()
+        # Empty-relation short-circuits: nothing to join, so skip the
+        # join jobs entirely
+        if not order_items_df.take(1):
+            return order_items_df, order_items_df.limit(0)
+
+        if not orders_df.take(1):
+            return order_items_df.limit(0), order_items_df
+
+        # Semi/anti joins emit each item at most once regardless of duplicate
+        # order keys, so no distinct (and its shuffle) is needed
+        order_ids = orders_df.select("order_id")
+
+        # No broadcast hints: adaptive query execution (enabled in
+        # get_spark_session) picks the strategy per join from the runtime
+        # size of each side, broadcasting it only below
+        # spark.sql.adaptive.autoBroadcastJoinThreshold. Shuffle joins that
+        # remain get runtime bloom filters that prune item rows at scan time.
+
+        # Column pruning: resolve orphans on the key columns only, so the
+        # wide item rows (prices, totals, timestamps) never enter the join
+        valid_keys = (
+            order_items_df.select("order_item_id", "order_id")
+            .join(order_ids, on="order_id", how="left_semi")
+            .select("order_item_id")
+        )
+
+        # Split the full frame by the surviving item keys
+        valid_items = order_items_df.join(valid_keys, on="order_item_id", how="left_semi")
+
+        invalid_items = order_items_df.join(valid_keys, on="order_item_id", how="left_anti")
+
+        return valid_items, invalid_items
+
+    def _prepare_orders(self, watermark: Optional[datetime] = None) -> Tuple[DataFrame, int]:
+        """
+        Read and validate orders ahead of the Bronze write.
 
-        # Join to find orphan items
-        valid_items = order_items_df.join(order_ids, on="order_id", how="inner")
+        Also caches the order_id keys (see _last_orders_keys) so order items
+        can be validated without waiting for the orders write. Keys are only
+        cached for mock or full loads; after an incremental real read
+        _last_orders_keys is None and the items check is skipped.
 
-        invalid_items = order_items_df.join(order_ids, on="order_id", how="left_anti")
+        Returns:
+            Tuple of (validated orders, invalid total count)
+        """
+        if self.settings.enable_real_database_connections:
+            df = self._read_from_sqlserver(
+                table="dbo.Orders",
+                schema=ORDERS_SCHEMA,
+                watermark_column="updated_at",
+                watermark_value=watermark,
+            )
+        else:
+            df = self._read_mock_data("orders")
+
+        # Data quality check: total calculation.
+        # Both the JDBC read (customSchema) and the mock frames use the
+        # contract schema, which pins every amount to DECIMAL(_, 2), so
+        # comparing whole cents as longs is exact and avoids per-row
+        # BigDecimal arithmetic
+        df_validated = df.withColumn(
+            "_total_valid",
+            _cents("total_amount")
+            == (_cents("subtotal") - _cents("discount_amount") + _cents("shipping_cost")),
+        )
 
-        invalid_count = invalid_items.count()
-        if invalid_count > 0:
+        invalid_totals = df_validated.filter(~F.col("_total_valid")).count()
+        if invalid_totals > 0:
             logger.warning(
-                "Found orphan order items",
-                orphan_count=invalid_count,
-                action="quarantined",
+                "Orders with invalid totals detected",
+                count=invalid_totals,
             )
 
-        return valid_items, invalid_items
+        # Remove validation column before write
+        df_clean = df_validated.drop("_total_valid")
+
+        # Keep the order keys around so order items can be validated
+        # without re-reading (or re-generating) the orders source. An
+        # incremental real read only holds orders updated since the
+        # watermark, and validating against it would quarantine new items of
+        # older orders, so keys are only kept when they cover every order.
+        if self._last_orders_keys is not None:
+            self._last_orders_keys.unpersist()
+            self._last_orders_keys = None
+        if watermark is None or not self.settings.enable_real_database_connections:
+            self._last_orders_keys = df_clean.select("order_id").cache()
+            # Materialize now, while the source is being read anyway
+            self._last_orders_keys.count()
+
+        return df_clean, invalid_totals
+
+    def _run_in_scheduler_pool(self, pool: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a Spark action in a named FAIR scheduler pool on this thread.
+
+        Spark local properties are per-thread, so concurrent ingestions each
+        get their own pool and share the cluster instead of queueing FIFO.
+        """
+        sc = self.spark.sparkContext
+        sc.setLocalProperty("spark.scheduler.pool", pool)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sc.setLocalProperty("spark.scheduler.pool", None)
 
     def ingest_orders(
         self,
         watermark: Optional[datetime] = None,
         mode: WriteMode = WriteMode.MERGE,
+        prepared_orders: Optional[Tuple[DataFrame, int]] = None,
     ) -> Dict[str, Any]:
         """
         Ingest orders from e-commerce platform.
@@ -315,41 +522,16 @@ class SQLServerIngestion:
         Args:
             watermark: Cutoff for incremental ingestion
             mode: Write mode (MERGE recommended)
+            prepared_orders: Output of _prepare_orders, if already computed
 
         Returns:
             Ingestion statistics
         """
         with PipelineContext("sqlserver_orders_ingestion", source_table="dbo.Orders"):
 
-            if self.settings.enable_real_database_connections:
-                df = self._read_from_sqlserver(
-                    table="dbo.Orders",
-                    schema=ORDERS_SCHEMA,
-                    watermark_column="updated_at",
-                    watermark_value=watermark,
-                )
-            else:
-                df = self._read_mock_data("orders")
-
-            # Data quality check: total calculation
-            df_validated = df.withColumn(
-                "_total_valid",
-                F.abs(
-                    F.col("total_amount")
-                    - (F.col("subtotal") - F.col("discount_amount") + F.col("shipping_cost"))
-                )
-                < 0.01,
-            )
-
-            invalid_totals = df_validated.filter(~F.col("_total_valid")).count()
-            if invalid_totals > 0:
-                logger.warning(
-                    "Orders with invalid totals detected",
-                    count=invalid_totals,
-                )
-
-            # Remove validation column before write
-            df_clean = df_validated.drop("_total_valid")
+            if prepared_orders is None:
+                prepared_orders = self._prepare_orders(watermark)
+            df_clean, invalid_totals = prepared_orders
 
             result = self.bronze_writer.write(
                 df=df_clean,
@@ -358,6 +540,7 @@ class SQLServerIngestion:
                 business_keys=["order_id"],
                 mode=mode,
                 expected_schema=ORDERS_SCHEMA,
+                distribute_by=["order_id"],
             )
 
             result["invalid_totals"] = invalid_totals
@@ -368,6 +551,7 @@ class SQLServerIngestion:
         watermark: Optional[datetime] = None,
         mode: WriteMode = WriteMode.MERGE,
         validate_orders: bool = True,
+        orders_keys_df: Optional[DataFrame] = None,
     ) -> Dict[str, Any]:
         """
         Ingest order line items.
@@ -381,11 +565,14 @@ class SQLServerIngestion:
         REFERENTIAL INTEGRITY:
         By default, validates that all order_items reference valid orders.
         Set validate_orders=False to skip (e.g., if orders ingested separately).
+        Pass orders_keys_df (an order_id frame, typically from ingest_orders)
+        to validate against already-loaded orders instead of re-reading them.
 
         Args:
             watermark: Cutoff for incremental ingestion
             mode: Write mode (MERGE recommended)
             validate_orders: Whether to check order references
+            orders_keys_df: Known order_id keys to validate against
 
         Returns:
             Ingestion statistics including quarantine count
@@ -393,50 +580,80 @@ class SQLServerIngestion:
         with PipelineContext("sqlserver_order_items_ingestion", source_table="dbo.OrderItems"):
 
             if self.settings.enable_real_database_connections:
+                # Largest table in the workload: split the read into hash
+                # buckets on order_item_id and use a larger fetch for wide rows
                 items_df = self._read_from_sqlserver(
                     table="dbo.OrderItems",
                     schema=ORDER_ITEMS_SCHEMA,
+                    num_partitions=ORDER_ITEMS_READ_PARTITIONS,
+                    hash_partition_key="order_item_id",
+                    fetch_size=50000,
                     watermark_column="created_at",
                     watermark_value=watermark,
                 )
             else:
                 items_df = self._read_mock_data("order_items")
 
-            quarantined_count = 0
-
-            # Optional referential integrity check
-            if validate_orders:
-                # Read existing orders to validate
-                orders_df = (
-                    self._read_mock_data("orders")
-                    if not self.settings.enable_real_database_connections
-                    else None
-                )
-
-                if orders_df:
-                    items_df, quarantined = self._validate_referential_integrity(
-                        items_df, orders_df
-                    )
-                    quarantined_count = quarantined.count()
-
-                    # Write quarantined records for investigation
-                    if quarantined_count > 0:
-                        self.bronze_writer.write(
-                            df=quarantined,
-                            table_name="order_items_quarantine",
-                            source_system=self.SOURCE_SYSTEM,
-                            business_keys=["order_item_id"],
-                            mode=WriteMode.APPEND,
+            # Validation splits the source into two frames and the write scans
+            # it again; persist so the JDBC read executes exactly once
+            source_df = items_df.persist(StorageLevel.MEMORY_AND_DISK)
+            source_df.count()
+            quarantined: Optional[DataFrame] = None
+
+            try:
+                quarantined_count = 0
+
+                # Optional referential integrity check
+                if validate_orders:
+                    # Prefer keys already loaded by ingest_orders; fall back to
+                    # reading orders only when none are available
+                    orders_df = orders_keys_df
+                    if orders_df is None and not self.settings.enable_real_database_connections:
+                        orders_df = self._read_mock_data("orders")
+
+                    if orders_df is not None:
+                        items_df, quarantined = self._validate_referential_integrity(
+                            source_df, orders_df
                         )
-
-            result = self.bronze_writer.write(
-                df=items_df,
-                table_name="order_items",
-                source_system=self.SOURCE_SYSTEM,
-                business_keys=["order_item_id"],
-                mode=mode,
-                expected_schema=ORDER_ITEMS_SCHEMA,
-            )
+                        # Orphans are few: move them to one partition so the
+                        # quarantine append writes a single file, and persist so
+                        # the count and the write share one join execution.
+                        # repartition (not coalesce) keeps the anti-join itself
+                        # parallel; only its small output is shuffled.
+                        quarantined = quarantined.repartition(1).persist(
+                            StorageLevel.MEMORY_AND_DISK
+                        )
+                        quarantined_count = quarantined.count()
+
+                        # Write quarantined records for investigation
+                        if quarantined_count > 0:
+                            logger.warning(
+                                "Found orphan order items",
+                                orphan_count=quarantined_count,
+                                action="quarantined",
+                            )
+                            self.bronze_writer.write(
+                                df=quarantined,
+                                table_name="order_items_quarantine",
+                                source_system=self.SOURCE_SYSTEM,
+                                business_keys=["order_item_id"],
+                                mode=WriteMode.APPEND,
+                            )
+
+                result = self.bronze_writer.write(
+                    df=items_df,
+                    table_name="order_items",
+                    source_system=self.SOURCE_SYSTEM,
+                    business_keys=["order_item_id"],
+                    mode=mode,
+                    expected_schema=ORDER_ITEMS_SCHEMA,
+                    # Clustered on order_id so lookups by order skip unrelated files
+                    distribute_by=["order_id"],
+                )
+            finally:
+                if quarantined is not None:
+                    quarantined.unpersist()
+                source_df.unpersist()
 
             result["quarantined_count"] = quarantined_count
             return result
@@ -449,8 +666,9 @@ class SQLServerIngestion:
         Run full SQL Server ingestion pipeline.
 
         ORDER MATTERS:
-        Orders must be ingested before OrderItems for referential
-        integrity validation to work correctly.
+        Orders must be read before OrderItems for referential integrity
+        validation to work correctly. Once the order keys are cached, both
+        Bronze writes run in parallel in separate FAIR scheduler pools.
 
         PRODUCTION ORCHESTRATION:
         In production, this would be orchestrated by:
@@ -472,12 +690,29 @@ class SQLServerIngestion:
 
         results = {}
 
-        # CRITICAL: Orders before OrderItems for referential integrity
-        results["orders"] = self.ingest_orders(watermark=watermark)
-        results["order_items"] = self.ingest_order_items(
-            watermark=watermark,
-            validate_orders=True,
-        )
+        # CRITICAL: Orders are read and validated before OrderItems so their
+        # keys are available for referential integrity. The two Bronze MERGEs
+        # target independent tables and run concurrently.
+        prepared_orders = self._prepare_orders(watermark)
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="sqlserver_ingest") as pool:
+            orders_future = pool.submit(
+                self._run_in_scheduler_pool,
+                "orders",
+                self.ingest_orders,
+                watermark=watermark,
+                prepared_orders=prepared_orders,
+            )
+            items_future = pool.submit(
+                self._run_in_scheduler_pool,
+                "order_items",
+                self.ingest_order_items,
+                watermark=watermark,
+                validate_orders=True,
+                orders_keys_df=self._last_orders_keys,
+            )
+            results["orders"] = orders_future.result()
+            results["order_items"] = items_future.result()
 
         total_rows = sum(r["rows_affected"] for r in results.values())
         total_quarantined = sum(r.get("quarantined_count", 0) for r in results.values())
@@ -26,11 +26,22 @@ SAFETY:
 - Human review before publication
 """
 
-import json
+import asyncio
+import fnmatch
+import hashlib
+import mmap
+import os
+import re
+import sqlite3
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+import msgspec
+import orjson
 
 from src.utils.config import get_settings
 from src.utils.logging import get_logger
@@ -38,38 +49,397 @@ from src.utils.security import SecretProvider
 
 logger = get_logger(__name__)
 
+# Medallion layers in documentation order
+LAYER_ORDER = ("bronze", "silver", "gold")
 
-class ModelDocumentation(BaseModel):
-    """Documentation for a single dbt model."""
+# Markdown export skeleton
+MARKDOWN_HEADER = (
+    "# EDP-IO Data Model Documentation\n\n"
+    "*Auto-generated documentation for dbt models*\n\n"
+    "---\n\n"
+)
+SCHEMA_HEADER_TEMPLATE = "\n## {schema} Layer\n\n"
+MODEL_TEMPLATE = (
+    "\n### {model_name}\n\n"
+    "**{summary}**\n\n"
+    "\n{description}\n\n"
+    "\n**Business Purpose:** {business_purpose}\n\n"
+)
+EXAMPLE_TEMPLATE = "\n**Example Usage:**\n```sql\n{example}\n```\n\n"
 
-    model_name: str = Field(description="Name of the model")
-    schema: str = Field(description="Schema/layer (bronze, silver, gold)")
+# Model count from which markdown rendering is spread across processes
+PARALLEL_RENDER_MIN_MODELS = 200
 
-    summary: str = Field(description="One-line business summary")
+# Models rendered per worker task, and tasks in flight per worker process
+PARALLEL_RENDER_CHUNK_SIZE = 32
+PARALLEL_RENDER_TASKS_PER_WORKER = 2
 
-    description: str = Field(description="Detailed description of what the model does")
+# Manifests larger than this are streamed with ijson instead of decoded whole
+MANIFEST_STREAM_THRESHOLD_BYTES = 20 * 1024 * 1024
 
-    business_purpose: str = Field(description="Why this model exists from a business perspective")
+# Token budget for model SQL in documentation prompts
+SQL_PROMPT_MAX_TOKENS = 1500
+SQL_PROMPT_ENCODING = "o200k_base"  # GPT-4o family tokenizer
 
-    key_transformations: List[str] = Field(
-        default_factory=list, description="List of key transformations applied"
+# SQL line/block comments and Jinja comments carry no signal for the LLM
+_SQL_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/|\{#.*?#\}", re.DOTALL)
+_BLANK_LINES_PATTERN = re.compile(r"\n\s*\n+")
+
+# Slim model nodes cached next to manifest.json, keyed by its mtime and size
+MANIFEST_CACHE_TEMPLATE = ".manifest_slim.{signature}.msgpack"
+
+# SQLite file (under the dbt target/ directory) holding cached LLM docs
+DOC_CACHE_FILENAME = "doc_cache.sqlite"
+
+# Retries the OpenAI SDK makes on 429/5xx/connection errors (exponential
+# backoff with jitter, honoring Retry-After) before we fall back to mock docs
+LLM_MAX_RETRIES = 5
+
+# HTTP connection pool shared by all requests of one client; the timeout
+# mirrors the openai SDK default since a custom httpx client replaces it
+LLM_HTTP_MAX_CONNECTIONS = 64
+LLM_HTTP_MAX_KEEPALIVE = 32
+LLM_HTTP_TIMEOUT_SECONDS = 600.0
+
+# Azure OpenAI Batch API endpoint for chat completions
+BATCH_ENDPOINT = "/chat/completions"
+
+# Batch states after which no further progress will happen
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class _LLMDocPayload(msgspec.Struct, frozen=True, kw_only=True, gc=False):
+    """
+    The part of a model's documentation written by the LLM.
+
+    Decoding the JSON response straight into this Struct parses and
+    type-checks it in a single pass; keys outside the schema are ignored.
+    """
+
+    summary: str  # One-line business summary
+    description: str  # Detailed description of what the model does
+    business_purpose: str  # Why this model exists from a business perspective
+    key_transformations: List[str] = []
+    business_rules: List[str] = []
+    columns: List[Dict[str, str]] = []  # Column documentation
+    usage_examples: List[str] = []
+    sla: Optional[str] = None  # Service level agreement for freshness
+    owner: Optional[str] = None  # Team or person responsible
+
+
+class ModelDocumentation(_LLMDocPayload, frozen=True, kw_only=True, gc=False):
+    """
+    Documentation for a single dbt model.
+
+    A frozen msgspec Struct: slotted, untracked by the GC (fields hold only
+    strings and containers of strings) and cheap to construct for every model
+    in large projects. Identity and lineage come from the manifest.
+    """
+
+    model_name: str  # Name of the model
+    schema: str  # Schema/layer (bronze, silver, gold)
+    dependencies: List[str] = []  # Upstream models/sources
+
+
+_LLM_DOC_DECODER = msgspec.json.Decoder(_LLMDocPayload)
+
+
+class DocCache:
+    """
+    Persistent exact-match cache of LLM documentation payloads.
+
+    Keys are hashes of the full chat-completion request (prompt, SQL,
+    columns, dependencies, deployment and sampling settings), so a model is
+    only re-documented when something that would change the answer changes.
+    Backed by a single SQLite file; values are the raw JSON payloads.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS docs (key TEXT PRIMARY KEY, payload TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key_for(params: Dict[str, Any]) -> str:
+        """Hash a chat-completion request body into a cache key."""
+        return hashlib.blake2b(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached payload for a key, if any."""
+        row = self._conn.execute("SELECT payload FROM docs WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, payload: str) -> None:
+        """Store a payload under a key, replacing any previous value."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO docs (key, payload) VALUES (?, ?)", (key, payload)
+        )
+        self._conn.commit()
+
+
+def _slim_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the manifest node fields used for documentation."""
+    return {
+        "name": node.get("name"),
+        "schema": node.get("schema"),
+        "raw_code": node.get("raw_code", ""),
+        "depends_on": {"nodes": list(node.get("depends_on", {}).get("nodes", []))},
+        "columns": {name: {} for name in node.get("columns", {})},
+    }
+
+
+def _mock_stg(
+    model_name: str,
+    entity: str,
+    schema: str,
+    columns: Tuple[str, ...],
+    dependencies: Tuple[str, ...],
+) -> ModelDocumentation:
+    """Mock docs for a Silver staging model (stg_<entity>)."""
+    return ModelDocumentation(
+        model_name=model_name,
+        schema=schema,
+        summary=f"Staged {entity} data with cleansing and SCD2",
+        description=f"This Silver layer model cleanses and standardizes {entity} data from the Bronze layer. It implements SCD Type 2 for historical tracking.",
+        business_purpose=f"Provides clean, historized {entity} data for downstream analytics and reporting.",
+        key_transformations=[
+            "Data type standardization",
+            "Null handling and default values",
+            "SCD Type 2 historization",
+            "Row-level deduplication",
+        ],
+        business_rules=[
+            "Business key uniqueness enforced",
+            "Historical versions tracked with valid_from/valid_to",
+            "Current record identified by is_current=true",
+        ],
+        dependencies=list(dependencies),
+        columns=[{"name": col, "description": f"Cleaned {col} from source"} for col in columns],
+        usage_examples=[
+            f"-- Get current {entity}\nSELECT * FROM {schema}.{model_name} WHERE is_current = true",
+        ],
     )
 
-    business_rules: List[str] = Field(
-        default_factory=list, description="Business rules implemented in the model"
+
+def _mock_dim(
+    model_name: str,
+    entity: str,
+    schema: str,
+    columns: Tuple[str, ...],
+    dependencies: Tuple[str, ...],
+) -> ModelDocumentation:
+    """Mock docs for a Gold dimension (dim_<entity>)."""
+    return ModelDocumentation(
+        model_name=model_name,
+        schema=schema,
+        summary=f"{entity.title()} dimension for star schema analytics",
+        description=f"Gold layer dimension table containing current-state {entity} attributes for analytical queries.",
+        business_purpose=f"Enables slicing and filtering of fact data by {entity} attributes.",
+        key_transformations=[
+            "Surrogate key generation",
+            "Current-state flattening from SCD2",
+            "Derived attribute calculation",
+        ],
+        business_rules=[
+            "One row per entity (current state only)",
+            "Surrogate key used for fact table joins",
+        ],
+        dependencies=list(dependencies),
+        columns=[{"name": col, "description": f"Dimension attribute: {col}"} for col in columns],
+        usage_examples=[
+            f"-- Join with fact table\nSELECT d.*, SUM(f.revenue)\nFROM {model_name} d\nJOIN fact_sales f ON d.dim_{entity}_key = f.dim_{entity}_key\nGROUP BY 1",
+        ],
     )
 
-    dependencies: List[str] = Field(default_factory=list, description="Upstream models/sources")
 
-    columns: List[Dict[str, str]] = Field(default_factory=list, description="Column documentation")
+def _mock_fact(
+    model_name: str,
+    entity: str,
+    schema: str,
+    columns: Tuple[str, ...],
+    dependencies: Tuple[str, ...],
+) -> ModelDocumentation:
+    """Mock docs for a Gold fact table (fact_<entity>)."""
+    return ModelDocumentation(
+        model_name=model_name,
+        schema=schema,
+        summary=f"{entity.title()} fact table for business metrics",
+        description=f"Gold layer fact table containing {entity} transactions at grain level with all measures and dimension keys.",
+        business_purpose=f"Central source of truth for {entity} analytics, enabling revenue, volume, and profitability analysis.",
+        key_transformations=[
+            "Dimension key lookup",
+            "Measure calculation (revenue, cost, profit)",
+            "Date dimension integration",
+        ],
+        business_rules=[
+            "Grain: one row per transaction line item",
+            "Additive measures can be aggregated across all dimensions",
+            "Dimension keys enable star schema joins",
+        ],
+        dependencies=list(dependencies),
+        columns=[{"name": col, "description": f"Fact measure or key: {col}"} for col in columns],
+        usage_examples=[
+            f"-- Total revenue by segment\nSELECT c.customer_segment, SUM(f.net_revenue) as revenue\nFROM {model_name} f\nJOIN dim_customer c ON f.dim_customer_key = c.dim_customer_key\nGROUP BY 1",
+        ],
+    )
+
 
-    usage_examples: List[str] = Field(
-        default_factory=list, description="Example queries using this model"
+def _mock_default(
+    model_name: str,
+    entity: str,
+    schema: str,
+    columns: Tuple[str, ...],
+    dependencies: Tuple[str, ...],
+) -> ModelDocumentation:
+    """Placeholder docs for models that follow no naming convention."""
+    return ModelDocumentation(
+        model_name=model_name,
+        schema=schema,
+        summary=f"Data model: {model_name}",
+        description="Auto-generated documentation. Please add detailed description.",
+        business_purpose="Document the business purpose of this model.",
+        key_transformations=[],
+        business_rules=[],
+        dependencies=list(dependencies),
+        columns=[],
     )
 
-    sla: Optional[str] = Field(default=None, description="Service level agreement for freshness")
 
-    owner: Optional[str] = Field(default=None, description="Team or person responsible")
+# Mock documentation builders keyed by model-name prefix (stg_, dim_, fact_)
+_MOCK_BUILDERS = {
+    "stg": _mock_stg,
+    "dim": _mock_dim,
+    "fact": _mock_fact,
+}
+
+
+@lru_cache(maxsize=4096)
+def _mock_doc_cached(
+    model_name: str,
+    schema: str,
+    columns: Tuple[str, ...],
+    dependencies: Tuple[str, ...],
+) -> ModelDocumentation:
+    """
+    Build pattern-based mock documentation for a model.
+
+    Memoized on the hashable projection of the manifest node. Frozen
+    Structs still hold mutable lists, so callers get a _copy_doc() of the
+    cached instance rather than the instance itself.
+    """
+    prefix, sep, entity = model_name.partition("_")
+    builder = _MOCK_BUILDERS.get(prefix, _mock_default) if sep else _mock_default
+    return builder(model_name, entity, schema, columns, dependencies)
+
+
+def _copy_doc(doc: ModelDocumentation) -> ModelDocumentation:
+    """Copy of a ModelDocumentation that shares none of its lists or dicts."""
+    return msgspec.structs.replace(
+        doc,
+        key_transformations=list(doc.key_transformations),
+        business_rules=list(doc.business_rules),
+        columns=[dict(column) for column in doc.columns],
+        usage_examples=list(doc.usage_examples),
+        dependencies=list(doc.dependencies),
+    )
+
+
+def _compile_selectors(patterns: List[str]) -> Optional["re.Pattern[str]"]:
+    """Compile shell-style model name patterns into one anchored regex."""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+@lru_cache(maxsize=1)
+def _get_sql_encoder() -> Any:
+    """Load the GPT-4o tokenizer once; None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(SQL_PROMPT_ENCODING)
+    except Exception as e:
+        logger.warning("Tokenizer unavailable, truncating SQL by characters", error=str(e))
+        return None
+
+
+def _truncate_sql(sql: str, max_tokens: int = SQL_PROMPT_MAX_TOKENS) -> str:
+    """
+    Fit model SQL into the prompt's token budget.
+
+    Comments and blank lines are stripped first so the budget is spent on
+    logic, then the SQL is cut on a token boundary rather than at an
+    arbitrary character offset.
+    """
+    sql = _SQL_COMMENT_PATTERN.sub("", sql)
+    sql = _BLANK_LINES_PATTERN.sub("\n", sql).strip()
+
+    encoder = _get_sql_encoder()
+    if encoder is None:
+        return sql[: max_tokens * 4]  # ~4 characters per token
+
+    tokens = encoder.encode(sql)
+    if len(tokens) <= max_tokens:
+        return sql
+    return encoder.decode(tokens[:max_tokens])
+
+
+def _render_models(docs: List[ModelDocumentation]) -> List[str]:
+    """Render a chunk of models; the unit of work sent to render processes."""
+    return [_render_model(doc) for doc in docs]
+
+
+def _render_parallel(
+    pool: ProcessPoolExecutor, docs: List[ModelDocumentation], max_in_flight: int
+) -> Iterator[str]:
+    """
+    Render models across processes, yielding sections in input order.
+
+    Unlike Executor.map, which submits every task up front, at most
+    `max_in_flight` chunks are pending at a time, so sections that are
+    rendered but not yet written never pile up in memory.
+    """
+    pending: deque = deque()
+    for start in range(0, len(docs), PARALLEL_RENDER_CHUNK_SIZE):
+        chunk = docs[start : start + PARALLEL_RENDER_CHUNK_SIZE]
+        pending.append(pool.submit(_render_models, chunk))
+        if len(pending) >= max_in_flight:
+            yield from pending.popleft().result()
+
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _render_model(doc: ModelDocumentation) -> str:
+    """Render one model's markdown section."""
+    parts = [
+        MODEL_TEMPLATE.format(
+            model_name=doc.model_name,
+            summary=doc.summary,
+            description=doc.description,
+            business_purpose=doc.business_purpose,
+        )
+    ]
+
+    if doc.key_transformations:
+        parts.append("\n**Key Transformations:**\n")
+        parts.extend(f"- {t}\n" for t in doc.key_transformations)
+        parts.append("\n")
+
+    if doc.business_rules:
+        parts.append("\n**Business Rules:**\n")
+        parts.extend(f"- {r}\n" for r in doc.business_rules)
+        parts.append("\n")
+
+    if doc.usage_examples:
+        parts.append(EXAMPLE_TEMPLATE.format(example=doc.usage_examples[0]))
+
+    return "".join(parts)
 
 
 class DocGenerator:
@@ -123,16 +493,21 @@ GUIDELINES:
 - Be concise but complete
 - Highlight important business rules"""
 
-    def __init__(self, dbt_project_path: Optional[str] = None):
+    def __init__(self, dbt_project_path: Optional[str] = None, use_cache: bool = True):
         """
         Initialize the doc generator.
 
         Args:
             dbt_project_path: Path to dbt project (default: dbt_project/)
+            use_cache: Reuse previously generated LLM docs for unchanged models
+                and the parsed manifest while manifest.json is unchanged
         """
         self.settings = get_settings()
         self.dbt_path = Path(dbt_project_path or "dbt_project")
         self._manifest = None
+        self.use_cache = use_cache
+        self._cache: Optional[DocCache] = None
+        self._client = None
 
         logger.info(
             "DocGenerator initialized",
@@ -145,6 +520,41 @@ GUIDELINES:
         """Check if LLM is enabled."""
         return self.settings.enable_llm_observability
 
+    @property
+    def cache(self) -> Optional[DocCache]:
+        """Lazily open the on-disk doc cache (None when caching is disabled)."""
+        if self.use_cache and self._cache is None:
+            self._cache = DocCache(self.dbt_path / "target" / DOC_CACHE_FILENAME)
+        return self._cache
+
+    def _cached_doc(
+        self,
+        model_name: str,
+        model_info: Dict,
+        params: Dict[str, Any],
+    ) -> Optional[ModelDocumentation]:
+        """Return cached documentation for an identical request, if any."""
+        if self.cache is None:
+            return None
+        payload = self.cache.get(DocCache.key_for(params))
+        if payload is None:
+            return None
+        logger.info("Documentation served from cache", model=model_name)
+        return self._parse_llm_response(model_name, model_info, payload)
+
+    def _store_doc(
+        self,
+        model_name: str,
+        model_info: Dict,
+        params: Dict[str, Any],
+        payload: str,
+    ) -> ModelDocumentation:
+        """Parse an LLM payload and cache it once it is known to be valid."""
+        doc = self._parse_llm_response(model_name, model_info, payload)
+        if self.cache is not None:
+            self.cache.put(DocCache.key_for(params), payload)
+        return doc
+
     def _load_manifest(self) -> Dict[str, Any]:
         """Load dbt manifest.json."""
         if self._manifest is not None:
@@ -156,11 +566,80 @@ GUIDELINES:
             logger.warning("manifest.json not found, using mock data")
             return self._get_mock_manifest()
 
-        with open(manifest_path) as f:
-            self._manifest = json.load(f)
+        self._manifest = {"nodes": self._load_model_nodes(manifest_path)}
 
         return self._manifest
 
+    def _load_model_nodes(self, manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the slim model nodes of a manifest, via the on-disk cache.
+
+        Like dbt's partial_parse.msgpack: the slimmed nodes are written next
+        to manifest.json as msgpack, named after the manifest's mtime and
+        size, so later processes skip JSON parsing until dbt rewrites it.
+        """
+        stat = manifest_path.stat()
+        cache_path = manifest_path.parent / MANIFEST_CACHE_TEMPLATE.format(
+            signature=f"{stat.st_mtime_ns}-{stat.st_size}"
+        )
+
+        if self.use_cache and cache_path.exists():
+            try:
+                return msgspec.msgpack.decode(cache_path.read_bytes())
+            except (OSError, msgspec.DecodeError) as e:
+                logger.warning("Ignoring unreadable manifest cache", error=str(e))
+
+        nodes = dict(self._read_model_nodes(manifest_path))
+
+        if self.use_cache:
+            try:
+                for stale in manifest_path.parent.glob(
+                    MANIFEST_CACHE_TEMPLATE.format(signature="*")
+                ):
+                    stale.unlink(missing_ok=True)
+
+                # Write-then-rename so concurrent readers never see a partial file
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_bytes(msgspec.msgpack.encode(nodes))
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning("Could not write manifest cache", error=str(e))
+
+        return nodes
+
+    @staticmethod
+    def _read_model_nodes(manifest_path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (node_key, slim_node) for each dbt model in a manifest.
+
+        Manifests up to MANIFEST_STREAM_THRESHOLD_BYTES are memory-mapped and
+        decoded by orjson straight from the page cache, with no intermediate
+        bytes copy. Larger ones are streamed with ijson (when installed) one
+        node at a time, skipping macros, docs and tests without building
+        Python objects, so peak memory stays flat regardless of project size.
+        """
+        with open(manifest_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+
+            if size > MANIFEST_STREAM_THRESHOLD_BYTES:
+                try:
+                    import ijson
+
+                    for node_key, node in ijson.kvitems(f, "nodes"):
+                        if node_key.startswith("model."):
+                            yield node_key, _slim_node(node)
+                    return
+                except ImportError:
+                    pass
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    nodes = orjson.loads(view).get("nodes", {})
+
+        for node_key, node in nodes.items():
+            if node_key.startswith("model."):
+                yield node_key, _slim_node(node)
+
     def _get_mock_manifest(self) -> Dict[str, Any]:
         """Return mock manifest for demo purposes."""
         return {
@@ -192,102 +671,14 @@ GUIDELINES:
 
     def _get_mock_doc(self, model_name: str, model_info: Dict) -> ModelDocumentation:
         """Generate mock documentation based on model patterns."""
-        schema = model_info.get("schema", "unknown")
-
-        # Pattern-based documentation
-        if model_name.startswith("stg_"):
-            return ModelDocumentation(
-                model_name=model_name,
-                schema=schema,
-                summary=f"Staged {model_name[4:]} data with cleansing and SCD2",
-                description=f"This Silver layer model cleanses and standardizes {model_name[4:]} data from the Bronze layer. It implements SCD Type 2 for historical tracking.",
-                business_purpose=f"Provides clean, historized {model_name[4:]} data for downstream analytics and reporting.",
-                key_transformations=[
-                    "Data type standardization",
-                    "Null handling and default values",
-                    "SCD Type 2 historization",
-                    "Row-level deduplication",
-                ],
-                business_rules=[
-                    "Business key uniqueness enforced",
-                    "Historical versions tracked with valid_from/valid_to",
-                    "Current record identified by is_current=true",
-                ],
-                dependencies=list(model_info.get("depends_on", {}).get("nodes", [])),
-                columns=[
-                    {"name": col, "description": f"Cleaned {col} from source"}
-                    for col in model_info.get("columns", {}).keys()
-                ],
-                usage_examples=[
-                    f"-- Get current {model_name[4:]}\nSELECT * FROM {schema}.{model_name} WHERE is_current = true",
-                ],
-            )
-
-        elif model_name.startswith("dim_"):
-            return ModelDocumentation(
-                model_name=model_name,
-                schema=schema,
-                summary=f"{model_name[4:].title()} dimension for star schema analytics",
-                description=f"Gold layer dimension table containing current-state {model_name[4:]} attributes for analytical queries.",
-                business_purpose=f"Enables slicing and filtering of fact data by {model_name[4:]} attributes.",
-                key_transformations=[
-                    "Surrogate key generation",
-                    "Current-state flattening from SCD2",
-                    "Derived attribute calculation",
-                ],
-                business_rules=[
-                    "One row per entity (current state only)",
-                    "Surrogate key used for fact table joins",
-                ],
-                dependencies=list(model_info.get("depends_on", {}).get("nodes", [])),
-                columns=[
-                    {"name": col, "description": f"Dimension attribute: {col}"}
-                    for col in model_info.get("columns", {}).keys()
-                ],
-                usage_examples=[
-                    f"-- Join with fact table\nSELECT d.*, SUM(f.revenue)\nFROM {model_name} d\nJOIN fact_sales f ON d.dim_{model_name[4:]}_key = f.dim_{model_name[4:]}_key\nGROUP BY 1",
-                ],
-            )
-
-        elif model_name.startswith("fact_"):
-            return ModelDocumentation(
-                model_name=model_name,
-                schema=schema,
-                summary=f"{model_name[5:].title()} fact table for business metrics",
-                description=f"Gold layer fact table containing {model_name[5:]} transactions at grain level with all measures and dimension keys.",
-                business_purpose=f"Central source of truth for {model_name[5:]} analytics, enabling revenue, volume, and profitability analysis.",
-                key_transformations=[
-                    "Dimension key lookup",
-                    "Measure calculation (revenue, cost, profit)",
-                    "Date dimension integration",
-                ],
-                business_rules=[
-                    "Grain: one row per transaction line item",
-                    "Additive measures can be aggregated across all dimensions",
-                    "Dimension keys enable star schema joins",
-                ],
-                dependencies=list(model_info.get("depends_on", {}).get("nodes", [])),
-                columns=[
-                    {"name": col, "description": f"Fact measure or key: {col}"}
-                    for col in model_info.get("columns", {}).keys()
-                ],
-                usage_examples=[
-                    f"-- Total revenue by segment\nSELECT c.customer_segment, SUM(f.net_revenue) as revenue\nFROM {model_name} f\nJOIN dim_customer c ON f.dim_customer_key = c.dim_customer_key\nGROUP BY 1",
-                ],
-            )
-
-        else:
-            return ModelDocumentation(
-                model_name=model_name,
-                schema=schema,
-                summary=f"Data model: {model_name}",
-                description="Auto-generated documentation. Please add detailed description.",
-                business_purpose="Document the business purpose of this model.",
-                key_transformations=[],
-                business_rules=[],
-                dependencies=list(model_info.get("depends_on", {}).get("nodes", [])),
-                columns=[],
+        return _copy_doc(
+            _mock_doc_cached(
+                model_name,
+                model_info.get("schema", "unknown"),
+                tuple(model_info.get("columns", {}).keys()),
+                tuple(model_info.get("depends_on", {}).get("nodes", [])),
             )
+        )
 
     def generate_model_doc(
         self,
@@ -328,128 +719,479 @@ GUIDELINES:
         # LLM-powered documentation
         return self._llm_generate(model_name, model_info, model_sql)
 
-    def _llm_generate(
+    def _build_messages(
         self,
         model_name: str,
         model_info: Dict,
         model_sql: str,
-    ) -> ModelDocumentation:
-        """Use LLM to generate rich documentation."""
-        try:
-            from openai import AzureOpenAI
-
-            api_key = SecretProvider.get("AZURE_OPENAI_KEY")
-
-            client = AzureOpenAI(
-                api_key=api_key,
-                api_version=self.settings.azure_openai_api_version,
-                azure_endpoint=self.settings.azure_openai_endpoint,
-            )
-
-            user_message = f"""Document this dbt model:
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for documenting one model."""
+        user_message = f"""Document this dbt model:
 
 Model Name: {model_name}
 Schema: {model_info.get('schema', 'unknown')}
 
 SQL Code:
 ```sql
-{model_sql[:2000]}  # Truncate for token limit
+{_truncate_sql(model_sql)}
 ```
 
-Dependencies: {model_info.get('depends_on', {}).get('nodes', [])}
+Dependencies: {", ".join(model_info.get('depends_on', {}).get('nodes', []))}
 
-Columns: {list(model_info.get('columns', {}).keys())}
+Columns: {", ".join(model_info.get('columns', {}))}
 """
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ]
+
+    def _completion_params(
+        self,
+        model_name: str,
+        model_info: Dict,
+        model_sql: str,
+    ) -> Dict[str, Any]:
+        """Chat-completion request body shared by the online and batch paths."""
+        return {
+            "model": self.settings.azure_openai_deployment_name,
+            "messages": self._build_messages(model_name, model_info, model_sql),
+            "temperature": 0.5,
+            "max_tokens": 1500,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _parse_llm_response(
+        self,
+        model_name: str,
+        model_info: Dict,
+        content: str,
+    ) -> ModelDocumentation:
+        """Turn the LLM JSON payload into a ModelDocumentation."""
+        payload = _LLM_DOC_DECODER.decode(content)
+
+        return ModelDocumentation(
+            model_name=model_name,
+            schema=model_info.get("schema", "unknown"),
+            dependencies=model_info.get("depends_on", {}).get("nodes", []),
+            **msgspec.structs.asdict(payload),
+        )
+
+    def _get_client(self):
+        """
+        Lazy-initialize the Azure OpenAI client.
+
+        One client (and its keep-alive connection pool) is reused for every
+        request instead of paying TLS and pool set-up per model.
+        """
+        if self._client is None:
+            import httpx
+            from openai import AzureOpenAI
 
-            response = client.chat.completions.create(
-                model=self.settings.azure_openai_deployment_name,
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_message},
-                ],
-                temperature=0.5,
-                max_tokens=1500,
-                response_format={"type": "json_object"},
+            self._client = AzureOpenAI(
+                api_key=SecretProvider.get("AZURE_OPENAI_KEY"),
+                api_version=self.settings.azure_openai_api_version,
+                azure_endpoint=self.settings.azure_openai_endpoint,
+                max_retries=LLM_MAX_RETRIES,
+                http_client=httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+                    ),
+                    timeout=LLM_HTTP_TIMEOUT_SECONDS,
+                ),
             )
 
-            result = json.loads(response.choices[0].message.content)
+        return self._client
 
-            return ModelDocumentation(
-                model_name=model_name,
-                schema=model_info.get("schema", "unknown"),
-                dependencies=model_info.get("depends_on", {}).get("nodes", []),
-                **result,
+    def _new_async_client(self):
+        """
+        Create an AsyncAzureOpenAI client for one generate_all_async run.
+
+        Async connection pools are bound to the event loop that opened them,
+        so the client is shared across a run's requests but not cached.
+        """
+        import httpx
+        from openai import AsyncAzureOpenAI
+
+        return AsyncAzureOpenAI(
+            api_key=SecretProvider.get("AZURE_OPENAI_KEY"),
+            api_version=self.settings.azure_openai_api_version,
+            azure_endpoint=self.settings.azure_openai_endpoint,
+            max_retries=LLM_MAX_RETRIES,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+                ),
+                timeout=LLM_HTTP_TIMEOUT_SECONDS,
+            ),
+        )
+
+    def _llm_generate(
+        self,
+        model_name: str,
+        model_info: Dict,
+        model_sql: str,
+    ) -> ModelDocumentation:
+        """Use LLM to generate rich documentation."""
+        try:
+            params = self._completion_params(model_name, model_info, model_sql)
+            cached = self._cached_doc(model_name, model_info, params)
+            if cached is not None:
+                return cached
+
+            response = self._get_client().chat.completions.create(**params)
+
+            return self._store_doc(
+                model_name, model_info, params, response.choices[0].message.content
             )
 
         except Exception as e:
             logger.error("LLM doc generation failed", error=str(e))
             return self._get_mock_doc(model_name, model_info)
 
-    def generate_all(self) -> List[ModelDocumentation]:
-        """Generate documentation for all models in manifest."""
+    async def _llm_generate_async(
+        self,
+        client: Any,
+        model_name: str,
+        model_info: Dict,
+        model_sql: str,
+    ) -> ModelDocumentation:
+        """Async variant of _llm_generate using a shared AsyncAzureOpenAI client."""
+        try:
+            params = self._completion_params(model_name, model_info, model_sql)
+            cached = self._cached_doc(model_name, model_info, params)
+            if cached is not None:
+                return cached
+
+            response = await client.chat.completions.create(**params)
+
+            return self._store_doc(
+                model_name, model_info, params, response.choices[0].message.content
+            )
+
+        except Exception as e:
+            logger.error("LLM doc generation failed", model=model_name, error=str(e))
+            return self._get_mock_doc(model_name, model_info)
+
+    def _iter_models(
+        self,
+        select: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the dbt model nodes to document, in manifest order.
+
+        Selection mirrors dbt's --select/--exclude on model names: patterns
+        are shell-style globs (``stg_*``), and a leading ``+`` also selects
+        every upstream model of the matches (``+fact_sales``). Filtering
+        happens before any mock or LLM work, so unselected models cost nothing.
+
+        Args:
+            select: Model name patterns to include (default: all models)
+            exclude: Model name patterns to drop after selection
+        """
         manifest = self._load_manifest()
-        docs = []
+        models = {
+            node_key: node_info
+            for node_key, node_info in manifest.get("nodes", {}).items()
+            if node_key.startswith("model.")
+        }
 
-        for node_key, node_info in manifest.get("nodes", {}).items():
-            if not node_key.startswith("model."):
-                continue
+        if select:
+            matches = _compile_selectors([pattern.lstrip("+") for pattern in select])
+            upstream = _compile_selectors([p[1:] for p in select if p.startswith("+")])
+
+            selected = {key for key, info in models.items() if matches.match(info.get("name", ""))}
+
+            # Walk depends_on from the "+" matches to pull in their ancestors
+            stack = [
+                key
+                for key in selected
+                if upstream is not None and upstream.match(models[key].get("name", ""))
+            ]
+            while stack:
+                for parent in models[stack.pop()].get("depends_on", {}).get("nodes", []):
+                    if parent in models and parent not in selected:
+                        selected.add(parent)
+                        stack.append(parent)
+
+            models = {key: info for key, info in models.items() if key in selected}
+
+        if exclude:
+            excluded = _compile_selectors(exclude)
+            models = {
+                key: info
+                for key, info in models.items()
+                if not excluded.match(info.get("name", ""))
+            }
 
-            model_name = node_info.get("name", "unknown")
-            doc = self.generate_model_doc(model_name)
-            docs.append(doc)
+        return list(models.values())
+
+    async def generate_all_async(
+        self,
+        concurrency: int = 20,
+        select: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> List[ModelDocumentation]:
+        """
+        Generate documentation for all models concurrently.
+
+        LLM calls are IO-bound and independent per model, so they are fanned
+        out with asyncio.gather. A semaphore caps in-flight requests to stay
+        within Azure OpenAI rate limits. Results keep manifest order; any
+        model whose call fails falls back to mock documentation.
+
+        Args:
+            concurrency: Maximum number of in-flight LLM requests
+            select: Model name patterns to document (see _iter_models)
+            exclude: Model name patterns to skip
+        """
+        models = self._iter_models(select, exclude)
+
+        if not self.is_enabled:
+            return self._mock_docs(models)
+
+        client = self._new_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(info: Dict[str, Any]) -> ModelDocumentation:
+            async with semaphore:
+                return await self._llm_generate_async(
+                    client, info.get("name", "unknown"), info, info.get("raw_code", "")
+                )
+
+        try:
+            results = await asyncio.gather(
+                *(_bounded(info) for info in models), return_exceptions=True
+            )
+        finally:
+            await client.close()
+
+        docs = [
+            (
+                result
+                if isinstance(result, ModelDocumentation)
+                else self._get_mock_doc(info.get("name", "unknown"), info)
+            )
+            for result, info in zip(results, models)
+        ]
 
+        logger.info(f"Generated docs for {len(docs)} models", concurrency=concurrency)
+        return docs
+
+    def generate_all(
+        self,
+        concurrency: int = 20,
+        select: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> List[ModelDocumentation]:
+        """
+        Generate documentation for all (or the selected) models in manifest.
+
+        Synchronous entry point for generate_all_async(). Event-loop callers
+        should await generate_all_async() directly; if this is called from
+        inside a running loop anyway, the run gets its own loop on a worker
+        thread instead of failing in asyncio.run.
+        """
+        if not self.is_enabled:
+            return self._mock_docs(self._iter_models(select, exclude))
+
+        def run() -> List[ModelDocumentation]:
+            return asyncio.run(
+                self.generate_all_async(concurrency=concurrency, select=select, exclude=exclude)
+            )
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(run).result()
+
+    def _mock_docs(self, models: List[Dict[str, Any]]) -> List[ModelDocumentation]:
+        """Mock documentation for each model, used when the LLM is disabled."""
+        docs = [self._get_mock_doc(info.get("name", "unknown"), info) for info in models]
         logger.info(f"Generated docs for {len(docs)} models")
         return docs
 
-    def export_markdown(
+    def generate_all_batch(
         self,
-        docs: List[ModelDocumentation],
-        output_path: str,
-    ) -> str:
-        """Export documentation to markdown file."""
-        lines = ["# EDP-IO Data Model Documentation\n"]
-        lines.append("*Auto-generated documentation for dbt models*\n")
-        lines.append("---\n")
+        poll_interval: float = 60.0,
+        select: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> List[ModelDocumentation]:
+        """
+        Generate documentation for all models through the Azure OpenAI Batch API.
 
-        # Group by schema
-        by_schema: Dict[str, List[ModelDocumentation]] = {}
-        for doc in docs:
-            by_schema.setdefault(doc.schema, []).append(doc)
+        Intended for offline, full-project documentation runs: all requests go
+        into one JSONL file processed asynchronously by the service (24h
+        window) at roughly half the per-token price of online calls. Blocks
+        until the batch reaches a terminal state.
 
-        for schema in ["bronze", "silver", "gold"]:
-            if schema not in by_schema:
-                continue
+        Any model without a usable result (failed line, failed/expired batch)
+        falls back to mock documentation, matching the online path.
+
+        Args:
+            poll_interval: Seconds between batch status checks
+            select: Model name patterns to document (see _iter_models)
+            exclude: Model name patterns to skip
+        """
+        models = self._iter_models(select, exclude)
+
+        if not self.is_enabled:
+            return [self._get_mock_doc(info.get("name", "unknown"), info) for info in models]
+
+        # Models whose request is unchanged are served from the cache and
+        # left out of the batch
+        params = {
+            info.get("name", "unknown"): self._completion_params(
+                info.get("name", "unknown"), info, info.get("raw_code", "")
+            )
+            for info in models
+        }
+        cached: Dict[str, ModelDocumentation] = {}
+        for info in models:
+            model_name = info.get("name", "unknown")
+            doc = self._cached_doc(model_name, info, params[model_name])
+            if doc is not None:
+                cached[model_name] = doc
+
+        pending = [info for info in models if info.get("name", "unknown") not in cached]
+        contents = self._run_batch(pending, params, poll_interval) if pending else {}
 
-            lines.append(f"\n## {schema.title()} Layer\n")
+        docs = []
+        for info in models:
+            model_name = info.get("name", "unknown")
+            if model_name in cached:
+                docs.append(cached[model_name])
+                continue
+            try:
+                docs.append(
+                    self._store_doc(model_name, info, params[model_name], contents[model_name])
+                )
+            except Exception as e:
+                logger.error("Batch doc generation failed", model=model_name, error=str(e))
+                docs.append(self._get_mock_doc(model_name, info))
 
-            for doc in by_schema[schema]:
-                lines.append(f"\n### {doc.model_name}\n")
-                lines.append(f"**{doc.summary}**\n")
-                lines.append(f"\n{doc.description}\n")
-                lines.append(f"\n**Business Purpose:** {doc.business_purpose}\n")
+        logger.info(
+            f"Generated docs for {len(docs)} models",
+            from_cache=len(cached),
+            from_llm=len(contents),
+        )
+        return docs
 
-                if doc.key_transformations:
-                    lines.append("\n**Key Transformations:**")
-                    for t in doc.key_transformations:
-                        lines.append(f"- {t}")
-                    lines.append("")
+    def _run_batch(
+        self,
+        models: List[Dict[str, Any]],
+        params: Dict[str, Dict[str, Any]],
+        poll_interval: float,
+    ) -> Dict[str, str]:
+        """
+        Submit one Batch API job for the given models and wait for it.
 
-                if doc.business_rules:
-                    lines.append("\n**Business Rules:**")
-                    for r in doc.business_rules:
-                        lines.append(f"- {r}")
-                    lines.append("")
+        Returns:
+            Raw JSON payloads keyed by model name (successful lines only)
+        """
+        client = self._get_client()
+
+        # One request per model; custom_id maps results back (model names are
+        # unique within a dbt project)
+        payload = b"\n".join(
+            orjson.dumps(
+                {
+                    "custom_id": info.get("name", "unknown"),
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": params[info.get("name", "unknown")],
+                }
+            )
+            for info in models
+        )
 
-                if doc.usage_examples:
-                    lines.append("\n**Example Usage:**")
-                    lines.append("```sql")
-                    lines.append(doc.usage_examples[0])
-                    lines.append("```\n")
+        batch_file = client.files.create(
+            file=("doc_generation.jsonl", payload),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        logger.info("Documentation batch submitted", batch_id=batch.id, models=len(models))
+
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+
+        contents: Dict[str, str] = {}
+        if batch.status == "completed" and batch.output_file_id:
+            output = client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                record = orjson.loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    continue
+                contents[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        else:
+            logger.error(
+                "Documentation batch did not complete", batch_id=batch.id, status=batch.status
+            )
 
-        content = "\n".join(lines)
+        return contents
 
-        with open(output_path, "w") as f:
-            f.write(content)
+    def export_markdown(
+        self,
+        docs: List[ModelDocumentation],
+        output_path: str,
+    ) -> str:
+        """Export documentation to markdown file."""
+        # Group by schema: medallion layers first, then any other schemas
+        # in alphabetical order so no model is left out of the export
+        by_schema: DefaultDict[str, List[ModelDocumentation]] = defaultdict(list)
+        for doc in docs:
+            by_schema[doc.schema].append(doc)
+
+        layers = [schema for schema in LAYER_ORDER if schema in by_schema]
+        schemas = layers + sorted(by_schema.keys() - set(LAYER_ORDER))
+        ordered_docs = [doc for schema in schemas for doc in by_schema[schema]]
+
+        # Rendering is pure per model; fan out to processes only when the
+        # project is large enough to amortize worker start-up and pickling
+        if len(ordered_docs) >= PARALLEL_RENDER_MIN_MODELS:
+            workers = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                rendered = _render_parallel(
+                    pool, ordered_docs, workers * PARALLEL_RENDER_TASKS_PER_WORKER
+                )
+                self._write_markdown(output_path, schemas, by_schema, rendered)
+        else:
+            self._write_markdown(output_path, schemas, by_schema, map(_render_model, ordered_docs))
 
         logger.info(f"Documentation exported to {output_path}")
         return output_path
+
+    @staticmethod
+    def _write_markdown(
+        output_path: str,
+        schemas: List[str],
+        by_schema: Dict[str, List[ModelDocumentation]],
+        rendered: Iterator[str],
+    ) -> None:
+        """
+        Write the document, consuming sections as they are rendered.
+
+        Sections stream straight to disk through a 1 MiB buffer, so peak
+        memory is one section serially, or the chunks still in flight when
+        rendering in parallel, instead of the whole document.
+        """
+        with open(output_path, "w", buffering=1 << 20) as f:
+            write = f.write
+            write(MARKDOWN_HEADER)
+
+            for schema in schemas:
+                write(SCHEMA_HEADER_TEMPLATE.format(schema=schema.title()))
+
+                for _ in by_schema[schema]:
+                    write(next(rendered))
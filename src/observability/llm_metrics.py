@@ -24,23 +24,73 @@ WHY TRACK LLM METRICS?
 STORAGE:
 -------
 In production: Azure Cosmos DB or dedicated time-series DB
-For mock: In-memory with persistence to JSON
+For mock: Bounded in-memory window with append-only, day-partitioned JSONL
+(past days zstd-compressed)
 """
 
-import json
+import atexit
+import os
+import queue
+import sys
 import threading
-from collections import defaultdict
-from dataclasses import asdict, dataclass
-from datetime import datetime, timedelta, timezone
+import time
+from collections import deque
+from dataclasses import dataclass, fields, replace
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 
+import numpy as np
+import orjson
+import zstandard
+
+from src.utils.config import get_settings
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+# Metrics are persisted as one JSONL file per UTC day under the store path
+PARTITION_FILENAME_FORMAT = "%Y-%m-%d.jsonl"
+PARTITION_GLOB = "????-??-??.jsonl"
+
+# Earlier single-file stores next to the partition directory, imported into
+# the day partitions on first load: a JSON array (".json") or a JSONL log
+# (".jsonl") of to_dict() records
+LEGACY_STORE_SUFFIXES = (".json", ".jsonl")
+LEGACY_MIGRATED_SUFFIX = ".migrated"
+
+# Once a UTC day is over its partition is sealed: compressed with zstd into
+# "<day>.jsonl.zst"; records arriving late for that day go to a fresh .jsonl
+SEALED_SUFFIX = ".zst"
+SEALED_COMPRESSION_LEVEL = 3
+
+# Background flusher: persist at most this many metrics per write, waiting
+# this long for more to arrive before writing a partial batch
+PERSIST_BATCH_SIZE = 10
+PERSIST_LINGER_SECONDS = 1.0
+# Longest wait for pending metrics at interpreter exit
+FLUSH_AT_EXIT_TIMEOUT_SECONDS = 5.0
+
+# Queued after the last metric by close(): the flusher persists what came
+# before it and exits
+_STOP_FLUSHER = object()
+
+
+def _join_queue(pending: queue.Queue, timeout: Optional[float]) -> bool:
+    """queue.join() with a timeout: True once every queued item is marked done."""
+    if timeout is None:
+        pending.join()
+        return True
+    # Queue.join() takes no timeout; wait on it from a helper thread instead,
+    # which exits by itself once the queue drains
+    joiner = threading.Thread(target=pending.join, name="llm-metrics-join", daemon=True)
+    joiner.start()
+    joiner.join(timeout)
+    return not joiner.is_alive()
+
+
 class LLMRole(str, Enum):
     """Roles/components that use LLM."""
 
@@ -69,10 +119,21 @@ MODEL_PRICING = {
     LLMModel.MOCK: {"input": 0.0, "output": 0.0},
 }
 
+# Per-token (input, output) cost, precomputed for the tracker's exit path
+_COST_COEFFS = {
+    model: (price["input"] / 1000.0, price["output"] / 1000.0)
+    for model, price in MODEL_PRICING.items()
+}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMCallMetrics:
-    """Metrics for a single LLM call."""
+    """
+    Metrics for a single LLM call.
+
+    Slotted and frozen: no per-instance __dict__ for long histories, and
+    records are immutable once handed to the store.
+    """
 
     call_id: str
     timestamp: datetime
@@ -104,83 +165,706 @@ class LLMCallMetrics:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            **asdict(self),
+            "call_id": self.call_id,
             "timestamp": self.timestamp.isoformat(),
             "role": self.role.value,
             "model": self.model.value,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+            "latency_ms": self.latency_ms,
+            "cost_usd": self.cost_usd,
+            "confidence_score": self.confidence_score,
+            "human_approved": self.human_approved,
+            "query_type": self.query_type,
+            "rag_chunks_used": self.rag_chunks_used,
+            "success": self.success,
+            "error_message": self.error_message,
         }
 
 
+# Latency SLO quantiles reported by LLMAnalytics.get_latency_percentiles
+LATENCY_PERCENTILES = (50, 95, 99)
+LATENCY_PERCENTILE_KEYS = tuple(f"p{q}" for q in LATENCY_PERCENTILES)
+
+# Dense integer codes for enum columns in the columnar index
+_ROLES = tuple(LLMRole)
+_MODELS = tuple(LLMModel)
+_ROLE_IDS = {role: i for i, role in enumerate(_ROLES)}
+_MODEL_IDS = {model: i for i, model in enumerate(_MODELS)}
+
+# Persisted value -> member, so loading skips Enum.__call__ per record
+_ROLE_BY_VALUE = {role.value: role for role in _ROLES}
+_MODEL_BY_VALUE = {model.value: model for model in _MODELS}
+_ROLE_ID_BY_VALUE = {role.value: i for i, role in enumerate(_ROLES)}
+_MODEL_ID_BY_VALUE = {model.value: i for i, model in enumerate(_MODELS)}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NS_PER_DAY = 86_400 * 10**9
+
+# human_approved is tri-state: NULL / rejected / approved
+_APPROVAL_UNKNOWN = -1
+
+_COLUMN_DTYPES = {
+    "timestamp_ns": np.int64,
+    "role_id": np.int8,
+    "model_id": np.int8,
+    "total_tokens": np.int64,
+    "cost_usd": np.float64,
+    "latency_ms": np.float64,
+    "success": np.bool_,
+    "confidence": np.float64,  # NaN when not reported
+    "approved": np.int8,  # _APPROVAL_UNKNOWN, 0 or 1
+}
+
+
+def _to_ns(ts: datetime) -> int:
+    """Exact nanoseconds since the epoch for an aware datetime."""
+    return (ts - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _now_ns() -> int:
+    """Current UTC time in nanoseconds since the epoch."""
+    return _to_ns(datetime.now(timezone.utc))
+
+
+def _from_ns(ns: int) -> datetime:
+    """Aware UTC datetime for nanoseconds since the epoch (microsecond exact)."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def _from_iso(value: str) -> datetime:
+    """Aware datetime for an ISO timestamp; naive ones are taken as local time."""
+    ts = datetime.fromisoformat(value)
+    return ts if ts.tzinfo is not None else ts.astimezone(timezone.utc)
+
+
+# Fields persisted as-is; timestamp and enums are encoded separately
+_RECORD_FIELDS = tuple(
+    f.name for f in fields(LLMCallMetrics) if f.name not in ("timestamp", "role", "model")
+)
+
+
+def _metric_to_record(m: LLMCallMetrics) -> Dict[str, Any]:
+    """Persisted form of a metric, with an integer epoch-ns timestamp."""
+    record = {name: getattr(m, name) for name in _RECORD_FIELDS}
+    record["timestamp_ns"] = _to_ns(m.timestamp)
+    record["role"] = m.role.value
+    record["model"] = m.model.value
+    return record
+
+
+def _metric_from_dict(item: Dict[str, Any]) -> LLMCallMetrics:
+    """Rebuild a metric from its persisted record (or legacy to_dict() form)."""
+    timestamp_ns = item.pop("timestamp_ns", None)
+    if timestamp_ns is not None:
+        item["timestamp"] = _from_ns(timestamp_ns)
+    else:
+        item["timestamp"] = _from_iso(item["timestamp"])
+    item["role"] = _ROLE_BY_VALUE[item["role"]]
+    item["model"] = _MODEL_BY_VALUE[item["model"]]
+    # Few distinct query types recur across many records; share one copy
+    if item.get("query_type") is not None:
+        item["query_type"] = sys.intern(item["query_type"])
+    return LLMCallMetrics(**item)
+
+
+def _record_ns(item: Dict[str, Any]) -> int:
+    """Epoch-ns timestamp of a persisted record (or legacy to_dict() form)."""
+    timestamp_ns = item.get("timestamp_ns")
+    if timestamp_ns is not None:
+        return timestamp_ns
+    return _to_ns(_from_iso(item["timestamp"]))
+
+
+def _records_to_columns(records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Columnar arrays for persisted records, without building metric objects."""
+
+    def column(name: str, values: Iterator[Any]) -> np.ndarray:
+        return np.fromiter(values, _COLUMN_DTYPES[name], count=len(records))
+
+    return {
+        "timestamp_ns": column("timestamp_ns", (_record_ns(r) for r in records)),
+        "role_id": column("role_id", (_ROLE_ID_BY_VALUE[r["role"]] for r in records)),
+        "model_id": column("model_id", (_MODEL_ID_BY_VALUE[r["model"]] for r in records)),
+        "total_tokens": column("total_tokens", (r["total_tokens"] for r in records)),
+        "cost_usd": column("cost_usd", (r["cost_usd"] for r in records)),
+        "latency_ms": column("latency_ms", (r["latency_ms"] for r in records)),
+        "success": column("success", (r.get("success", True) for r in records)),
+        "confidence": column(
+            "confidence",
+            (
+                np.nan if r.get("confidence_score") is None else r["confidence_score"]
+                for r in records
+            ),
+        ),
+        "approved": column(
+            "approved",
+            (
+                _APPROVAL_UNKNOWN if r.get("human_approved") is None else r["human_approved"]
+                for r in records
+            ),
+        ),
+    }
+
+
+class MetricColumns(NamedTuple):
+    """Structure-of-arrays view over stored metrics, one array per field."""
+
+    timestamp_ns: np.ndarray
+    role_id: np.ndarray
+    model_id: np.ndarray
+    total_tokens: np.ndarray
+    cost_usd: np.ndarray
+    latency_ms: np.ndarray
+    success: np.ndarray
+    confidence: np.ndarray
+    approved: np.ndarray
+
+
+class DailyRollup(NamedTuple):
+    """Running totals for one UTC day, maintained as metrics are indexed."""
+
+    calls: int
+    tokens: int
+    cost_usd: float
+    latency_ms_sum: float
+
+
+class _ColumnBuffer:
+    """
+    Growable columnar index of metrics for vectorized analytics.
+
+    Written by a single thread. A row is filled in before the published
+    size is advanced, and growth copies into fresh arrays before they are
+    published, so snapshot() always returns a consistent set of views
+    without locking readers or the writer. Growth is also when rows older
+    than the retention period are dropped, which keeps the index bounded.
+    """
+
+    def __init__(self, retention_days: int, capacity: int = 1024):
+        self._retention_ns = retention_days * _NS_PER_DAY
+        self._view: Tuple[int, Dict[str, np.ndarray]] = (
+            0,
+            {name: np.empty(capacity, dtype) for name, dtype in _COLUMN_DTYPES.items()},
+        )
+
+    def _reserve(self, extra: int) -> Tuple[int, Dict[str, np.ndarray]]:
+        """
+        Current size and arrays with room for `extra` more rows.
+
+        When full, rows past retention are dropped into fresh arrays that
+        are published only by the caller, after the new rows are written.
+        """
+        size, arrays = self._view
+        if size + extra <= len(arrays["timestamp_ns"]):
+            return size, arrays
+
+        keep = arrays["timestamp_ns"][:size] >= _now_ns() - self._retention_ns
+        kept = int(keep.sum())
+        grown = {}
+        for name, arr in arrays.items():
+            grown[name] = np.empty(max(2 * (kept + extra), 1024), arr.dtype)
+            grown[name][:kept] = arr[:size][keep]
+        return kept, grown
+
+    def extend(self, columns: Dict[str, np.ndarray]) -> None:
+        """Index a block of rows given as columns (single writer only)."""
+        extra = len(columns["timestamp_ns"])
+        size, arrays = self._reserve(extra)
+        for name, arr in arrays.items():
+            arr[size : size + extra] = columns[name]
+
+        self._view = (size + extra, arrays)
+
+    def append(self, m: LLMCallMetrics) -> None:
+        """Index one metric (single writer only)."""
+        size, arrays = self._reserve(1)
+
+        arrays["timestamp_ns"][size] = _to_ns(m.timestamp)
+        arrays["role_id"][size] = _ROLE_IDS[m.role]
+        arrays["model_id"][size] = _MODEL_IDS[m.model]
+        arrays["total_tokens"][size] = m.total_tokens
+        arrays["cost_usd"][size] = m.cost_usd
+        arrays["latency_ms"][size] = m.latency_ms
+        arrays["success"][size] = m.success
+        arrays["confidence"][size] = np.nan if m.confidence_score is None else m.confidence_score
+        arrays["approved"][size] = (
+            _APPROVAL_UNKNOWN if m.human_approved is None else int(m.human_approved)
+        )
+
+        self._view = (size + 1, arrays)
+
+    def snapshot(self) -> MetricColumns:
+        """Return views over every row published so far."""
+        size, arrays = self._view
+        return MetricColumns(**{name: arr[:size] for name, arr in arrays.items()})
+
+
 class LLMMetricsStore:
     """
     In-memory store for LLM metrics with persistence.
 
-    Thread-safe for concurrent access.
+    Thread-safe for concurrent access:
+    - add() indexes the metric on the caller's thread under a short lock
+      (hot window, columnar index - see columns() - and daily rollups), so
+      reads reflect it as soon as add() returns
+    - serialization and disk I/O are a queue hand-off to a single
+      background flusher thread that persists in batches; flush() waits
+      for all pending ones, and close() also stops the thread
+    - readers take no lock: they share an immutable tuple snapshot of the
+      hot window, rebuilt copy-on-write only after new metrics arrive
+
+    Memory is bounded: only the most recent METRICS_HOT_CAP records are kept
+    as objects, and the columnar index keeps METRICS_RETENTION_DAYS of data.
+    Every metric is persisted to a per-day JSONL partition, so older records
+    stay queryable through get_by_timerange without being held in memory.
+    Partitions of past days are zstd-compressed by the flusher.
     """
 
     def __init__(self, persist_path: Optional[str] = None):
-        self._metrics: List[LLMCallMetrics] = []
-        self._lock = threading.Lock()
-        self._persist_path = Path(persist_path or "data/llm_metrics.json")
+        settings = get_settings()
+        self._metrics: Deque[LLMCallMetrics] = deque(maxlen=settings.metrics_hot_cap)
+        self._version = 0  # Bumped by the single writer after each metric
+        self._snapshot: Tuple[int, Tuple[LLMCallMetrics, ...]] = (0, ())
+        self._retention_days = settings.metrics_retention_days
+        self._columns = _ColumnBuffer(self._retention_days)
+        self._daily: Dict[int, DailyRollup] = {}
+        self._persist_path = Path(persist_path or "data/llm_metrics")
+        self._durable = settings.metrics_durable
+        self._sealed_before: Optional[date] = None  # Flusher-owned
+        # Partitions known to end in a newline since the flusher last wrote them
+        self._clean_tails: Set[Path] = set()  # Flusher-owned
+        # Serializes writers of the in-memory structures (see _index)
+        self._index_lock = threading.Lock()
 
         # Load existing metrics
         self._load()
 
+        self._flush_queue: "queue.Queue[LLMCallMetrics]" = queue.Queue()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="llm-metrics-flusher", daemon=True
+        )
+        self._flusher.start()
+        self._closed = False
+        atexit.register(self._flush_at_exit)
+
     def add(self, metric: LLMCallMetrics) -> None:
-        """Add a metric to the store."""
-        with self._lock:
-            self._metrics.append(metric)
+        """
+        Add a metric to the store.
+
+        Naive timestamps are taken as local time and converted to UTC.
+        """
+        if self._closed:
+            raise RuntimeError("LLMMetricsStore is closed")
+        if metric.timestamp.tzinfo is None:
+            metric = replace(metric, timestamp=metric.timestamp.astimezone(timezone.utc))
+        with self._index_lock:
+            self._index(metric)
+        self._flush_queue.put_nowait(metric)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every metric added so far has been persisted.
+
+        Args:
+            timeout: Give up after this many seconds (None waits forever)
+
+        Returns:
+            True if everything was persisted, False on timeout
+        """
+        return _join_queue(self._flush_queue, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Persist pending metrics, then stop the flusher thread.
+
+        The atexit hook is removed too, so a closed store can be garbage
+        collected. add() must not be called afterwards; reads still work.
+
+        Args:
+            timeout: Give up waiting after this many seconds (None waits forever)
+
+        Returns:
+            True if the flusher finished, False on timeout
+        """
+        if not self._closed:
+            self._closed = True
+            atexit.unregister(self._flush_at_exit)
+            self._flush_queue.put_nowait(_STOP_FLUSHER)
+        self._flusher.join(timeout)
+        return not self._flusher.is_alive()
+
+    def _flush_at_exit(self) -> None:
+        """atexit hook: persist pending metrics without holding up shutdown."""
+        if not self.flush(timeout=FLUSH_AT_EXIT_TIMEOUT_SECONDS):
+            logger.warning(
+                f"Exiting with {self._flush_queue.qsize()} LLM metrics not yet persisted"
+            )
 
-            # Persist periodically (every 10 calls)
-            if len(self._metrics) % 10 == 0:
-                self._persist()
+    def columns(self) -> MetricColumns:
+        """Columnar snapshot of all indexed metrics (see flush())."""
+        return self._columns.snapshot()
+
+    def get_daily_rollup(self, day: int) -> Optional[DailyRollup]:
+        """Running totals for one UTC day (days since the epoch), if any."""
+        return self._daily.get(day)
+
+    def _hot(self) -> Tuple[LLMCallMetrics, ...]:
+        """
+        Immutable snapshot of the hot window.
+
+        The version is read before copying, so a snapshot is never tagged
+        newer than its contents; concurrent readers may both rebuild a stale
+        snapshot, which is harmless.
+        """
+        version, metrics = self._snapshot
+        if version != self._version:
+            # Copying the deque must not race an append in add()
+            with self._index_lock:
+                version = self._version
+                metrics = tuple(self._metrics)
+            self._snapshot = (version, metrics)
+        return metrics
 
     def get_all(self) -> List[LLMCallMetrics]:
-        """Get all metrics."""
-        with self._lock:
-            return list(self._metrics)
+        """Get all in-memory (most recent) metrics."""
+        return list(self._hot())
 
     def get_by_role(self, role: LLMRole) -> List[LLMCallMetrics]:
-        """Get metrics filtered by role."""
-        with self._lock:
-            return [m for m in self._metrics if m.role == role]
+        """Get in-memory metrics filtered by role."""
+        return [m for m in self._hot() if m.role == role]
 
     def get_by_timerange(
         self, start: datetime, end: Optional[datetime] = None
     ) -> List[LLMCallMetrics]:
-        """Get metrics within a time range."""
+        """
+        Get metrics within a time range.
+
+        Served from memory when the range starts inside the hot window.
+        Otherwise only the day partitions between start and the oldest hot
+        record are read from disk; partitions outside the range are never
+        opened.
+        """
         end = end or datetime.now(timezone.utc)
-        with self._lock:
-            return [m for m in self._metrics if start <= m.timestamp <= end]
+        hot = self._hot()
+        in_range = [m for m in hot if start <= m.timestamp <= end]
+
+        if hot and start >= hot[0].timestamp:
+            return in_range
+
+        # A partition being sealed may briefly be readable in both forms
+        seen = {m.call_id for m in hot}
+        last_day = min(end, hot[0].timestamp) if hot else end
+        cold = []
+        for day in range((last_day.date() - start.date()).days + 1):
+            path = self._partition_path(start.date() + timedelta(day))
+            try:
+                metrics = list(self._read_partition(path))
+            except Exception as e:
+                logger.warning(f"Skipping metric partition {path.name}: {e}")
+                continue
+            for m in metrics:
+                if start <= m.timestamp <= end and m.call_id not in seen:
+                    seen.add(m.call_id)
+                    cold.append(m)
+        return cold + in_range
+
+    def _partition_path(self, day: date) -> Path:
+        """JSONL file holding the metrics of one UTC day."""
+        return self._persist_path / day.strftime(PARTITION_FILENAME_FORMAT)
+
+    @classmethod
+    def _read_partition(cls, path: Path) -> Iterator[LLMCallMetrics]:
+        """Yield the metrics stored in one day partition, if it exists."""
+        for record in cls._read_records(path):
+            yield _metric_from_dict(record)
+
+    @staticmethod
+    def _read_records(path: Path) -> List[Dict[str, Any]]:
+        """
+        Persisted records of one day partition, in write order.
+
+        Each file is read in one call and split in memory: the sealed
+        (compressed) part, then any plain JSONL tail. The tail is read
+        first: sealing writes the .zst before removing the .jsonl, so no
+        record is missed mid-seal.
+
+        Lines are parsed one by one, so a corrupt or torn line (e.g. from a
+        crash mid-append) costs only that record, not the whole day.
+        """
+        try:
+            tail = path.read_bytes()
+        except FileNotFoundError:
+            tail = b""
+
+        sealed = path.with_name(path.name + SEALED_SUFFIX)
+        data = b""
+        if sealed.exists():
+            with open(sealed, "rb") as f:
+                data = zstandard.ZstdDecompressor().stream_reader(f).read()
+
+        records = []
+        skipped = 0
+        for line in data.splitlines() + tail.splitlines():
+            if not line:
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                record = None
+            if isinstance(record, dict):
+                records.append(record)
+            else:
+                skipped += 1
+        if skipped:
+            logger.warning(f"Skipped {skipped} unreadable metric records in {path.name}")
+        return records
+
+    def _seal_partitions(self, before: date) -> None:
+        """
+        Compress the plain partitions of every day before the given one.
+
+        A late tail for an already sealed day is merged into its .zst. Runs
+        on the flusher thread, the only writer of partition files.
+        """
+        cutoff = self._partition_path(before).name
+        compressor = zstandard.ZstdCompressor(level=SEALED_COMPRESSION_LEVEL)
+
+        try:
+            for path in sorted(self._persist_path.glob(PARTITION_GLOB)):
+                if path.name >= cutoff:
+                    continue
+
+                data = path.read_bytes()
+                sealed = path.with_name(path.name + SEALED_SUFFIX)
+                if sealed.exists():
+                    data = zstandard.ZstdDecompressor().decompress(sealed.read_bytes()) + data
+
+                staging = sealed.with_name(sealed.name + ".tmp")
+                staging.write_bytes(compressor.compress(data))
+                os.replace(staging, sealed)
+                path.unlink()
+        except Exception as e:
+            logger.warning(f"Failed to seal metric partitions: {e}")
+
+    def _index(self, metric: LLMCallMetrics) -> None:
+        """
+        Add a metric to the hot window, columnar index and daily rollups.
+
+        Only ever called from one thread at a time (_load, then add() under
+        _index_lock).
+        Each day's totals are replaced with a new tuple, never mutated, so
+        readers always see a consistent rollup.
+        """
+        self._metrics.append(metric)
+        self._version += 1
+        self._columns.append(metric)
+
+        self._roll_up(
+            (metric.timestamp - _EPOCH).days,
+            1,
+            metric.total_tokens,
+            metric.cost_usd,
+            metric.latency_ms,
+        )
+
+    def _roll_up(self, day: int, calls: int, tokens: int, cost: float, latency: float) -> None:
+        """Add totals to one day's rollup, publishing a new tuple."""
+        prev_calls, prev_tokens, prev_cost, prev_latency = self._daily.get(day, (0, 0, 0.0, 0.0))
+        self._daily[day] = DailyRollup(
+            prev_calls + calls,
+            prev_tokens + tokens,
+            prev_cost + cost,
+            prev_latency + latency,
+        )
+
+    def _index_columns(self, columns: Dict[str, np.ndarray]) -> None:
+        """Add a block of loaded rows to the columnar index and rollups."""
+        self._columns.extend(columns)
+
+        days = columns["timestamp_ns"] // _NS_PER_DAY
+        for day in np.unique(days):
+            in_day = days == day
+            self._roll_up(
+                int(day),
+                int(in_day.sum()),
+                int(columns["total_tokens"][in_day].sum()),
+                float(columns["cost_usd"][in_day].sum()),
+                float(columns["latency_ms"][in_day].sum()),
+            )
+
+    def _flush_loop(self) -> None:
+        """
+        Background persistence loop.
+
+        Waits for the first queued metric, then keeps collecting until the
+        batch is full or producers go quiet, and persists once per batch.
+
+        A failing batch is logged and skipped; every dequeued metric is
+        marked done regardless, so the thread keeps running and flush()
+        always returns. Exits after persisting the metrics queued before
+        close()'s stop marker.
+        """
+        stop = False
+        while not stop:
+            batch: List[LLMCallMetrics] = []
+            try:
+                item = self._flush_queue.get()
+                while True:
+                    if item is _STOP_FLUSHER:
+                        stop = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= PERSIST_BATCH_SIZE:
+                        break
+                    try:
+                        item = self._flush_queue.get(timeout=PERSIST_LINGER_SECONDS)
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    self._persist(batch)
+
+                    today = datetime.now(timezone.utc).date()
+                    if today != self._sealed_before:
+                        self._seal_partitions(today)
+                        self._sealed_before = today
+            except Exception as e:
+                logger.warning(f"Failed to flush {len(batch)} metrics: {e}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._flush_queue.task_done()
+
+    def _persist(self, batch: List[LLMCallMetrics]) -> None:
+        """
+        Append a batch of metrics to their day partitions.
+
+        Only the new records are written, so the cost of a flush is
+        proportional to the batch rather than the whole history. fsync is
+        opt-in via METRICS_DURABLE.
+
+        If a partition was left ending mid-line (a crash during an append),
+        the batch starts on a new line so that only the torn record is lost.
+        The check runs once per partition, not per write.
+        """
+        by_day: Dict[date, List[LLMCallMetrics]] = {}
+        for m in batch:
+            by_day.setdefault(m.timestamp.astimezone(timezone.utc).date(), []).append(m)
 
-    def _persist(self) -> None:
-        """Persist metrics to disk."""
         try:
-            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._persist_path, "w") as f:
-                json.dump([m.to_dict() for m in self._metrics], f, indent=2)
+            self._persist_path.mkdir(parents=True, exist_ok=True)
+            for day, metrics in by_day.items():
+                path = self._partition_path(day)
+                payload = b"".join(
+                    orjson.dumps(_metric_to_record(m), option=orjson.OPT_APPEND_NEWLINE)
+                    for m in metrics
+                )
+                clean = path in self._clean_tails
+                self._clean_tails.discard(path)  # Until this write completes
+                with open(path, "a+b") as f:
+                    if not clean and f.seek(0, os.SEEK_END):
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            payload = b"\n" + payload
+                    f.write(payload)
+                    if self._durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+                self._clean_tails.add(path)
         except Exception as e:
             logger.warning(f"Failed to persist metrics: {e}")
 
     def _load(self) -> None:
-        """Load metrics from disk."""
-        if not self._persist_path.exists():
+        """
+        Load the partitions inside the retention period from disk.
+
+        PERFORMANCE OPTIMIZATION:
+        Each partition is read and parsed in bulk, and its records go
+        straight into the columnar index and daily rollups. Metric objects
+        are built only for the most recent METRICS_HOT_CAP records.
+
+        A partition that cannot be read or indexed is logged and skipped;
+        the other days still load.
+        """
+        self._migrate_legacy()
+        if not self._persist_path.is_dir():
             return
 
-        try:
-            with open(self._persist_path) as f:
-                data = json.load(f)
+        first_day = datetime.now(timezone.utc).date() - timedelta(days=self._retention_days)
+        first_partition = self._partition_path(first_day).name
 
-            for item in data:
-                item["timestamp"] = datetime.fromisoformat(item["timestamp"])
-                item["role"] = LLMRole(item["role"])
-                item["model"] = LLMModel(item["model"])
-                self._metrics.append(LLMCallMetrics(**item))
+        try:
+            names = {path.name for path in self._persist_path.glob(PARTITION_GLOB)}
+            names.update(
+                path.name.removesuffix(SEALED_SUFFIX)
+                for path in self._persist_path.glob(PARTITION_GLOB + SEALED_SUFFIX)
+            )
 
-            logger.info(f"Loaded {len(self._metrics)} historical metrics")
+            loaded = 0
+            hot: Deque[Dict[str, Any]] = deque(maxlen=self._metrics.maxlen)
+            for name in sorted(names):
+                if name < first_partition:
+                    continue
+                try:
+                    records = self._read_records(self._persist_path / name)
+                    columns = _records_to_columns(records) if records else None
+                except Exception as e:
+                    logger.warning(f"Skipping metric partition {name}: {e}")
+                    continue
+                if columns is not None:
+                    self._index_columns(columns)
+                    hot.extend(records)
+                    loaded += len(records)
+
+            # Only the records that fit the hot window become objects
+            self._metrics.extend(_metric_from_dict(record) for record in hot)
+            self._version += len(hot)
+
+            logger.info(f"Loaded {loaded} historical metrics")
         except Exception as e:
             logger.warning(f"Failed to load metrics: {e}")
 
+    def _migrate_legacy(self) -> None:
+        """
+        One-time import of a legacy single-file store into day partitions.
+
+        Earlier versions kept all metrics in "<persist_path>.json" (a JSON
+        array) or "<persist_path>.jsonl". Their records are appended to the
+        matching day partitions and the file is renamed with
+        LEGACY_MIGRATED_SUFFIX, so it is neither imported twice nor deleted.
+        """
+        for suffix in LEGACY_STORE_SUFFIXES:
+            legacy = self._persist_path.with_name(self._persist_path.name + suffix)
+            if not legacy.is_file():
+                continue
+
+            try:
+                data = legacy.read_bytes()
+                if suffix == ".json":
+                    items = orjson.loads(data) if data.strip() else []
+                else:
+                    items = [orjson.loads(line) for line in data.splitlines() if line.strip()]
+
+                by_day: Dict[date, List[Dict[str, Any]]] = {}
+                for item in items:
+                    record = _metric_to_record(_metric_from_dict(item))
+                    day = _from_ns(record["timestamp_ns"]).date()
+                    by_day.setdefault(day, []).append(record)
+
+                self._persist_path.mkdir(parents=True, exist_ok=True)
+                for day, records in sorted(by_day.items()):
+                    with open(self._partition_path(day), "ab") as f:
+                        f.write(
+                            b"".join(
+                                orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in records
+                            )
+                        )
+                legacy.rename(legacy.with_name(legacy.name + LEGACY_MIGRATED_SUFFIX))
+                logger.info(f"Migrated {len(items)} metrics from {legacy}")
+            except Exception as e:
+                logger.warning(f"Failed to migrate legacy metrics from {legacy}: {e}")
+
 
 # Singleton store
 _metrics_store: Optional[LLMMetricsStore] = None
@@ -215,10 +899,10 @@ class LLMMetricsTracker:
     ):
         self.role = role
         self.model = model
-        self.call_id = call_id or f"{role.value}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        self.call_id = call_id or f"{role.value}_{time.time_ns()}"
 
         self._start_time: Optional[datetime] = None
-        self._end_time: Optional[datetime] = None
+        self._start_ns = 0
         self._input_tokens = 0
         self._output_tokens = 0
         self._confidence: Optional[float] = None
@@ -230,22 +914,19 @@ class LLMMetricsTracker:
 
     def __enter__(self) -> "LLMMetricsTracker":
         self._start_time = datetime.now(timezone.utc)
+        self._start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self._end_time = datetime.now(timezone.utc)
+        # Monotonic clock for latency; wall-clock time is only the timestamp
+        latency_ms = (time.perf_counter_ns() - self._start_ns) / 1e6
 
         if exc_type is not None:
             self._success = False
             self._error = str(exc_val)
 
-        # Calculate metrics
-        latency_ms = (self._end_time - self._start_time).total_seconds() * 1000
-
-        pricing = MODEL_PRICING.get(self.model, {"input": 0, "output": 0})
-        cost = (self._input_tokens / 1000) * pricing["input"] + (
-            self._output_tokens / 1000
-        ) * pricing["output"]
+        input_cost, output_cost = _COST_COEFFS.get(self.model, (0.0, 0.0))
+        cost = self._input_tokens * input_cost + self._output_tokens * output_cost
 
         # Create and store metric
         metric = LLMCallMetrics(
@@ -304,70 +985,124 @@ class LLMAnalytics:
     Compute analytics over LLM metrics.
 
     Provides aggregations for dashboard visualization.
+
+    PERFORMANCE OPTIMIZATION:
+    Rolling-window aggregations run as vectorized NumPy reductions over the
+    store's columnar index: a time-window mask, then sums or np.bincount
+    per role/model, instead of Python loops over metric objects. The daily
+    trend reads the store's incrementally maintained per-day rollups.
     """
 
     def __init__(self, store: Optional[LLMMetricsStore] = None):
         self.store = store or get_metrics_store()
 
+    def _window(self, days: int, *fields: str) -> Tuple[np.ndarray, ...]:
+        """
+        The requested columns restricted to the last N days.
+
+        Only the columns an aggregation reads are materialized, and when the
+        whole history falls inside the window the store's arrays are
+        returned as views without copying.
+        """
+        cols = self.store.columns()
+        now_ns = _now_ns()
+        ts = cols.timestamp_ns
+        mask = (ts >= now_ns - days * _NS_PER_DAY) & (ts <= now_ns)
+
+        if mask.all():
+            return tuple(getattr(cols, name) for name in fields)
+        return tuple(getattr(cols, name)[mask] for name in fields)
+
     def get_summary(self, days: int = 7) -> Dict[str, Any]:
         """Get summary statistics for the last N days."""
-        start = datetime.now(timezone.utc) - timedelta(days=days)
-        metrics = self.store.get_by_timerange(start)
+        tokens, cost, latency, success, confidence, approved = self._window(
+            days, "total_tokens", "cost_usd", "latency_ms", "success", "confidence", "approved"
+        )
+        calls = len(tokens)
 
-        if not metrics:
+        if not calls:
             return self._empty_summary()
 
         return {
-            "total_calls": len(metrics),
-            "total_tokens": sum(m.total_tokens for m in metrics),
-            "total_cost_usd": sum(m.cost_usd for m in metrics),
-            "avg_latency_ms": sum(m.latency_ms for m in metrics) / len(metrics),
-            "success_rate": sum(1 for m in metrics if m.success) / len(metrics) * 100,
-            "avg_confidence": self._avg_confidence(metrics),
-            "human_approval_rate": self._approval_rate(metrics),
+            "total_calls": calls,
+            "total_tokens": int(tokens.sum()),
+            "total_cost_usd": float(cost.sum()),
+            "avg_latency_ms": float(latency.mean()),
+            "success_rate": float(success.mean() * 100),
+            "avg_confidence": self._avg_confidence(confidence),
+            "human_approval_rate": self._approval_rate(approved),
             "period_days": days,
         }
 
     def get_by_role(self, days: int = 7) -> Dict[str, Dict[str, Any]]:
         """Get statistics grouped by role."""
-        start = datetime.now(timezone.utc) - timedelta(days=days)
-        metrics = self.store.get_by_timerange(start)
-
-        by_role = defaultdict(list)
-        for m in metrics:
-            by_role[m.role.value].append(m)
-
-        result = {}
-        for role, role_metrics in by_role.items():
-            result[role] = {
-                "calls": len(role_metrics),
-                "tokens": sum(m.total_tokens for m in role_metrics),
-                "cost_usd": sum(m.cost_usd for m in role_metrics),
-                "avg_latency_ms": sum(m.latency_ms for m in role_metrics) / len(role_metrics),
-                "avg_confidence": self._avg_confidence(role_metrics),
+        role_id, total_tokens, cost_usd, latency_ms, confidence = self._window(
+            days, "role_id", "total_tokens", "cost_usd", "latency_ms", "confidence"
+        )
+        n = len(_ROLES)
+
+        calls = np.bincount(role_id, minlength=n)
+        tokens = np.bincount(role_id, weights=total_tokens, minlength=n)
+        cost = np.bincount(role_id, weights=cost_usd, minlength=n)
+        latency = np.bincount(role_id, weights=latency_ms, minlength=n)
+
+        scored = ~np.isnan(confidence)
+        conf_calls = np.bincount(role_id[scored], minlength=n)
+        conf_sum = np.bincount(role_id[scored], weights=confidence[scored], minlength=n)
+
+        return {
+            _ROLES[i].value: {
+                "calls": int(calls[i]),
+                "tokens": int(tokens[i]),
+                "cost_usd": float(cost[i]),
+                "avg_latency_ms": float(latency[i] / calls[i]),
+                "avg_confidence": (float(conf_sum[i] / conf_calls[i]) if conf_calls[i] else None),
             }
+            for i in np.flatnonzero(calls)
+        }
+
+    def get_latency_percentiles(
+        self,
+        days: int = 7,
+        role: Optional[LLMRole] = None,
+    ) -> Dict[str, Optional[float]]:
+        """
+        Get p50/p95/p99 call latency (ms) for the last N days.
+
+        All three quantiles come from one np.percentile call, which
+        partitions the latency column once instead of fully sorting it.
+        """
+        role_id, latency_ms = self._window(days, "role_id", "latency_ms")
+        if role is not None:
+            latency_ms = latency_ms[role_id == _ROLE_IDS[role]]
+
+        if not len(latency_ms):
+            return dict.fromkeys(LATENCY_PERCENTILE_KEYS)
 
-        return result
+        values = np.percentile(latency_ms, LATENCY_PERCENTILES)
+        return {key: float(v) for key, v in zip(LATENCY_PERCENTILE_KEYS, values)}
 
     def get_daily_trend(self, days: int = 30) -> List[Dict[str, Any]]:
-        """Get daily aggregated metrics."""
-        start = datetime.now(timezone.utc) - timedelta(days=days)
-        metrics = self.store.get_by_timerange(start)
+        """
+        Get daily aggregated metrics for the last N UTC calendar days.
 
-        by_day = defaultdict(list)
-        for m in metrics:
-            day_key = m.timestamp.strftime("%Y-%m-%d")
-            by_day[day_key].append(m)
+        Served from the store's per-day rollups: O(days) lookups regardless
+        of how many metrics are stored.
+        """
+        today = (datetime.now(timezone.utc) - _EPOCH).days
 
         trend = []
-        for day, day_metrics in sorted(by_day.items()):
+        for day in range(today - days + 1, today + 1):
+            rollup = self.store.get_daily_rollup(day)
+            if rollup is None:
+                continue
             trend.append(
                 {
-                    "date": day,
-                    "calls": len(day_metrics),
-                    "tokens": sum(m.total_tokens for m in day_metrics),
-                    "cost_usd": sum(m.cost_usd for m in day_metrics),
-                    "avg_latency_ms": sum(m.latency_ms for m in day_metrics) / len(day_metrics),
+                    "date": (_EPOCH + timedelta(days=day)).strftime("%Y-%m-%d"),
+                    "calls": rollup.calls,
+                    "tokens": rollup.tokens,
+                    "cost_usd": rollup.cost_usd,
+                    "avg_latency_ms": rollup.latency_ms_sum / rollup.calls,
                 }
             )
 
@@ -375,24 +1110,23 @@ class LLMAnalytics:
 
     def get_cost_breakdown(self, days: int = 7) -> Dict[str, float]:
         """Get cost breakdown by model."""
-        start = datetime.now(timezone.utc) - timedelta(days=days)
-        metrics = self.store.get_by_timerange(start)
+        model_id, cost_usd = self._window(days, "model_id", "cost_usd")
+        n = len(_MODELS)
 
-        by_model = defaultdict(float)
-        for m in metrics:
-            by_model[m.model.value] += m.cost_usd
+        calls = np.bincount(model_id, minlength=n)
+        cost = np.bincount(model_id, weights=cost_usd, minlength=n)
 
-        return dict(by_model)
+        return {_MODELS[i].value: float(cost[i]) for i in np.flatnonzero(calls)}
 
-    def _avg_confidence(self, metrics: List[LLMCallMetrics]) -> Optional[float]:
+    def _avg_confidence(self, confidence: np.ndarray) -> Optional[float]:
         """Calculate average confidence score."""
-        scores = [m.confidence_score for m in metrics if m.confidence_score is not None]
-        return sum(scores) / len(scores) if scores else None
+        scores = confidence[~np.isnan(confidence)]
+        return float(scores.mean()) if len(scores) else None
 
-    def _approval_rate(self, metrics: List[LLMCallMetrics]) -> Optional[float]:
+    def _approval_rate(self, approved: np.ndarray) -> Optional[float]:
         """Calculate human approval rate."""
-        approvals = [m.human_approved for m in metrics if m.human_approved is not None]
-        return sum(1 for a in approvals if a) / len(approvals) * 100 if approvals else None
+        decided = approved[approved != _APPROVAL_UNKNOWN]
+        return float(decided.mean() * 100) if len(decided) else None
 
     def _empty_summary(self) -> Dict[str, Any]:
         """Return empty summary when no data."""
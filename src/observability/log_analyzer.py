@@ -29,10 +29,17 @@ PRODUCTION NOTES:
 - Token usage is monitored and capped
 """
 
+import asyncio
+import hashlib
 import json
+import re
+import threading
+import weakref
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
+import msgspec
 from pydantic import BaseModel, Field
 
 from src.utils.config import get_settings
@@ -96,6 +103,42 @@ class ErrorAnalysis(BaseModel):
     )
 
 
+class _ErrorAnalysisPayload(msgspec.Struct, kw_only=True, gc=False):
+    """
+    ErrorAnalysis fields as written by the LLM.
+
+    Decoding the response straight into this Struct parses and validates it
+    in a single pass; requires_human_approval is not read from the LLM.
+    """
+
+    error_type: ErrorType
+    root_cause: str
+    business_impact: Severity
+    affected_tables: List[str] = []
+    recommended_action: str
+    sql_fix: Optional[str] = None
+    confidence_score: Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]
+    additional_context: Optional[str] = None
+
+    def to_analysis(self) -> ErrorAnalysis:
+        """Build the public model; fields are already validated."""
+        return ErrorAnalysis.model_construct(
+            **msgspec.structs.asdict(self),
+            # Ensure human approval is required (safety enforcement)
+            requires_human_approval=True,
+        )
+
+
+class _BatchAnalysisPayload(msgspec.Struct, gc=False):
+    """Response to a multi-log request: one analysis per log, in order."""
+
+    analyses: List[_ErrorAnalysisPayload]
+
+
+_ANALYSIS_DECODER = msgspec.json.Decoder(_ErrorAnalysisPayload)
+_BATCH_ANALYSIS_DECODER = msgspec.json.Decoder(_BatchAnalysisPayload)
+
+
 # Mock responses for when LLM is disabled or for testing
 MOCK_RESPONSES: Dict[str, ErrorAnalysis] = {
     "schema": ErrorAnalysis(
@@ -141,6 +184,96 @@ MOCK_RESPONSES: Dict[str, ErrorAnalysis] = {
     ),
 }
 
+# Slack/Teams rendering used by LogAnalyzer.format_for_display
+_SEVERITY_EMOJI = {
+    Severity.LOW: "🟢",
+    Severity.MEDIUM: "🟡",
+    Severity.HIGH: "🟠",
+    Severity.CRITICAL: "🔴",
+}
+_DISPLAY_SQL_FIX = "**SQL Fix (for review):**```sql{}```"
+_DISPLAY_TEMPLATE = """
+{emoji} **{error_type}** (Confidence: {confidence:.0%})
+
+**Root Cause:**
+{root_cause}
+
+**Affected Tables:**
+{tables}
+
+**Recommended Action:**
+{action}
+
+{sql_fix}
+
+⚠️ **Human approval required before any action**
+"""
+
+# Keyword classifier for mock responses, one named group per category
+_MOCK_KEYWORD_PATTERN = re.compile(
+    r"(?P<schema>schema|column|drift)"
+    r"|(?P<connection>connection|refused|timeout)"
+    r"|(?P<data_quality>null|quality|validation)",
+    re.IGNORECASE,
+)
+_MOCK_PRECEDENCE = ("schema", "connection", "data_quality", "default")
+
+# Volatile tokens (timestamps, UUIDs, hex ids, long numbers) ignored when
+# deciding whether two logs describe the same error
+_LOG_NORMALIZE_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ][\d:.,]+(?:Z|[+-]\d{2}:?\d{2})?"
+    r"|\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"
+    r"|\b0x[0-9a-f]+\b"
+    r"|\b\d{5,}\b",
+    re.IGNORECASE,
+)
+
+# Distinct logs sent to the LLM per analyze_batch request
+ANALYZE_BATCH_SIZE = 8
+
+# Maximum LLM requests in flight per analyze_batch_async call
+ANALYZE_CONCURRENCY = 8
+
+# Successful LLM analyses remembered per LogAnalyzer, least recently used evicted
+ANALYSIS_CACHE_SIZE = 1024
+
+# Connection pool shared by concurrent analyses
+LLM_HTTP_MAX_CONNECTIONS = 64
+LLM_HTTP_MAX_KEEPALIVE = 32
+LLM_HTTP_TIMEOUT_SECONDS = 60.0
+
+
+def _log_signature(error_log: str) -> bytes:
+    """Hash of a log with volatile tokens masked, for grouping duplicates."""
+    normalized = _LOG_NORMALIZE_PATTERN.sub("#", error_log).strip()
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
+def _analysis_key(error_log: str, context: Optional[Dict[str, Any]] = None) -> bytes:
+    """Cache key for an analysis: the log signature, plus context if any."""
+    if context:
+        error_log += "\n" + json.dumps(context, sort_keys=True, default=str)
+    return _log_signature(error_log)
+
+
+def _group_logs(error_logs: List[str]) -> Dict[bytes, List[int]]:
+    """Indices of the logs sharing each signature, in first-seen order."""
+    groups: Dict[bytes, List[int]] = {}
+    for i, log in enumerate(error_logs):
+        groups.setdefault(_log_signature(log), []).append(i)
+    return groups
+
+
+def _spread_analyses(
+    groups: Dict[bytes, List[int]], analyses: List[ErrorAnalysis], count: int
+) -> List[ErrorAnalysis]:
+    """One analysis per input log, from one analysis per group."""
+    results: List[Optional[ErrorAnalysis]] = [None] * count
+    for analysis, indices in zip(analyses, groups.values()):
+        for i in indices:
+            results[i] = analysis
+    return results
+
 
 class LogAnalyzer:
     """
@@ -202,6 +335,12 @@ Respond ONLY with valid JSON matching this schema:
         """Initialize the log analyzer."""
         self.settings = get_settings()
         self._client = None
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_clients_lock = threading.Lock()
+        self._analysis_cache: "OrderedDict[bytes, ErrorAnalysis]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         logger.info(
             "LogAnalyzer initialized",
@@ -217,6 +356,7 @@ Respond ONLY with valid JSON matching this schema:
         """Lazy-initialize the OpenAI client."""
         if self._client is None and self.is_enabled:
             try:
+                import httpx
                 from openai import AzureOpenAI
 
                 api_key = SecretProvider.get("AZURE_OPENAI_KEY")
@@ -225,6 +365,13 @@ Respond ONLY with valid JSON matching this schema:
                     api_key=api_key,
                     api_version=self.settings.azure_openai_api_version,
                     azure_endpoint=self.settings.azure_openai_endpoint,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                            max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+                        ),
+                        timeout=LLM_HTTP_TIMEOUT_SECONDS,
+                    ),
                 )
 
                 logger.info("Azure OpenAI client initialized")
@@ -238,22 +385,63 @@ Respond ONLY with valid JSON matching this schema:
 
         return self._client
 
+    def _get_async_client(self):
+        """
+        Lazy-initialize the AsyncAzureOpenAI client for the running loop.
+
+        Each event loop gets its own client, reused by every coroutine on
+        that loop. A connection pool belongs to the loop that opened it, so
+        clients are never shared across loops, and closing one loop's client
+        (see aclose()) leaves the others untouched.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+        if client is None:
+            import httpx
+            from openai import AsyncAzureOpenAI
+
+            client = AsyncAzureOpenAI(
+                api_key=SecretProvider.get("AZURE_OPENAI_KEY"),
+                api_version=self.settings.azure_openai_api_version,
+                azure_endpoint=self.settings.azure_openai_endpoint,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+                    ),
+                    timeout=LLM_HTTP_TIMEOUT_SECONDS,
+                ),
+            )
+            with self._async_clients_lock:
+                self._async_clients[loop] = client
+
+            logger.info("Async Azure OpenAI client initialized")
+
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client and its pooled connections."""
+        with self._async_clients_lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
     def _get_mock_response(self, error_log: str) -> ErrorAnalysis:
         """
         Return a mock response based on error keywords.
 
         Used when LLM is disabled or for testing.
         """
-        error_lower = error_log.lower()
-
-        if "schema" in error_lower or "column" in error_lower or "drift" in error_lower:
-            return MOCK_RESPONSES["schema"]
-        elif "connection" in error_lower or "refused" in error_lower or "timeout" in error_lower:
-            return MOCK_RESPONSES["connection"]
-        elif "null" in error_lower or "quality" in error_lower or "validation" in error_lower:
-            return MOCK_RESPONSES["data_quality"]
-        else:
-            return MOCK_RESPONSES["default"]
+        # Single case-insensitive scan; categories keep their precedence
+        # (schema > connection > data_quality) wherever they occur in the log
+        best = len(_MOCK_PRECEDENCE) - 1
+        for match in _MOCK_KEYWORD_PATTERN.finditer(error_log):
+            best = min(best, _MOCK_PRECEDENCE.index(match.lastgroup))
+            if best == 0:
+                break  # Nothing outranks a schema keyword
+
+        return MOCK_RESPONSES[_MOCK_PRECEDENCE[best]]
 
     def analyze(
         self,
@@ -274,6 +462,10 @@ Respond ONLY with valid JSON matching this schema:
         The returned analysis ALWAYS has requires_human_approval=True.
         The LLM never has authority to auto-execute fixes.
 
+        PERFORMANCE OPTIMIZATION:
+        Successful LLM analyses are memoized (LRU, ANALYSIS_CACHE_SIZE) by
+        the normalized log, so a repeated error skips the round-trip.
+
         EXAMPLE:
             result = analyzer.analyze(
                 error_log="Column 'loyalty_points' not found in schema",
@@ -292,53 +484,126 @@ Respond ONLY with valid JSON matching this schema:
             logger.info("LLM disabled, returning mock response")
             return self._get_mock_response(error_log)
 
-        # Build the prompt
-        user_message = f"Analyze this error and suggest remediation:\n\n{error_log}"
-
-        if context:
-            user_message += f"\n\nAdditional context:\n{json.dumps(context, indent=2)}"
+        key = _analysis_key(error_log, context)
+        cached = self._cached_analysis(key)
+        if cached is not None:
+            return cached
 
         try:
-            client = self._get_client()
-
-            response = client.chat.completions.create(
-                model=self.settings.azure_openai_deployment_name,
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_message},
-                ],
-                temperature=0.3,  # Lower temperature for consistent analysis
-                max_tokens=1000,
-                response_format={"type": "json_object"},
+            response = self._get_client().chat.completions.create(
+                **self._analysis_params(error_log, context)
             )
+            analysis = self._parse_analysis(response.choices[0].message.content)
 
-            # Parse response
-            response_text = response.choices[0].message.content
-            response_data = json.loads(response_text)
+        except Exception as e:
+            return self._fallback_analysis(error_log, e)
 
-            # Ensure human approval is required (safety enforcement)
-            response_data["requires_human_approval"] = True
+        self._remember_analysis(key, analysis)
+        return analysis
 
-            analysis = ErrorAnalysis(**response_data)
+    async def analyze_async(
+        self,
+        error_log: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> ErrorAnalysis:
+        """
+        Async variant of analyze() for event-loop callers.
 
-            logger.info(
-                "Error analysis completed",
-                error_type=analysis.error_type,
-                confidence=analysis.confidence_score,
-            )
+        Requests share the pooled AsyncAzureOpenAI client, so concurrent
+        analyses run over kept-alive connections instead of blocking.
+        """
+        logger.info(
+            "Analyzing error log",
+            llm_enabled=self.is_enabled,
+            log_length=len(error_log),
+        )
+
+        if not self.is_enabled:
+            logger.info("LLM disabled, returning mock response")
+            return self._get_mock_response(error_log)
 
-            return analysis
+        key = _analysis_key(error_log, context)
+        cached = self._cached_analysis(key)
+        if cached is not None:
+            return cached
 
-        except Exception as e:
-            logger.error(
-                "LLM analysis failed, returning fallback",
-                error=str(e),
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                **self._analysis_params(error_log, context)
             )
-            # Fallback to mock on error
-            fallback = self._get_mock_response(error_log)
-            fallback.additional_context = f"LLM analysis failed: {str(e)}. Using fallback analysis."
-            fallback.confidence_score = 0.2
-            return fallback
+            analysis = self._parse_analysis(response.choices[0].message.content)
+
+        except Exception as e:
+            return self._fallback_analysis(error_log, e)
+
+        self._remember_analysis(key, analysis)
+        return analysis
+
+    def _analysis_params(
+        self,
+        error_log: str,
+        context: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the chat completion parameters for a single log."""
+        user_message = f"Analyze this error and suggest remediation:\n\n{error_log}"
+
+        if context:
+            user_message += f"\n\nAdditional context:\n{json.dumps(context, indent=2)}"
+
+        return {
+            "model": self.settings.azure_openai_deployment_name,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": user_message},
+            ],
+            "temperature": 0.3,  # Lower temperature for consistent analysis
+            "max_tokens": 1000,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _parse_analysis(self, response_text: str) -> ErrorAnalysis:
+        """Validate an LLM response into an ErrorAnalysis."""
+        analysis = _ANALYSIS_DECODER.decode(response_text).to_analysis()
+
+        logger.info(
+            "Error analysis completed",
+            error_type=analysis.error_type,
+            confidence=analysis.confidence_score,
+        )
+
+        return analysis
+
+    def _cached_analysis(self, key: bytes) -> Optional[ErrorAnalysis]:
+        """Return a remembered analysis for this key, marking it recently used."""
+        with self._cache_lock:
+            analysis = self._analysis_cache.get(key)
+            if analysis is not None:
+                self._analysis_cache.move_to_end(key)
+        if analysis is not None:
+            logger.debug("Analysis cache hit")
+        return analysis
+
+    def _remember_analysis(self, key: bytes, analysis: ErrorAnalysis) -> None:
+        """Store a successful LLM analysis, evicting the least recently used."""
+        with self._cache_lock:
+            self._analysis_cache[key] = analysis
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+
+    def _fallback_analysis(self, error_log: str, error: Exception) -> ErrorAnalysis:
+        """Mock analysis returned when the LLM call fails."""
+        logger.error(
+            "LLM analysis failed, returning fallback",
+            error=str(error),
+        )
+        # Copy so the shared MOCK_RESPONSES templates stay untouched
+        return self._get_mock_response(error_log).model_copy(
+            update={
+                "additional_context": f"LLM analysis failed: {str(error)}. Using fallback analysis.",
+                "confidence_score": 0.2,
+            }
+        )
 
     def analyze_batch(
         self,
@@ -347,39 +612,157 @@ Respond ONLY with valid JSON matching this schema:
         """
         Analyze multiple error logs.
 
-        For efficiency, similar errors are grouped and analyzed once.
+        Synchronous entry point for analyze_batch_async(). Similar logs are
+        grouped the same way, but an event loop is only started when it
+        pays off: without the LLM, or with at most one distinct log not
+        already cached, the batch is analyzed inline. Called from inside a
+        running event loop (where asyncio.run is not allowed), the distinct
+        logs are analyzed one at a time with analyze().
+
+        Returns:
+            One ErrorAnalysis per input log, in input order
         """
-        results = []
-        for log in error_logs:
-            results.append(self.analyze(log))
-        return results
+        groups = _group_logs(error_logs)
 
-    def format_for_display(self, analysis: ErrorAnalysis) -> str:
+        if self.is_enabled:
+            pending = sum(self._cached_analysis(key) is None for key in groups)
+            if pending > 1:
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    return asyncio.run(self._run_batch(error_logs))
+
+        analyses = [self.analyze(error_logs[indices[0]]) for indices in groups.values()]
+
+        logger.info(
+            "Batch analysis completed",
+            logs=len(error_logs),
+            unique_logs=len(groups),
+        )
+        return _spread_analyses(groups, analyses, len(error_logs))
+
+    async def _run_batch(self, error_logs: List[str]) -> List[ErrorAnalysis]:
+        """Run one batch on a private event loop, then release its client."""
+        try:
+            return await self.analyze_batch_async(error_logs)
+        finally:
+            await self.aclose()
+
+    async def analyze_batch_async(
+        self,
+        error_logs: List[str],
+        concurrency: int = ANALYZE_CONCURRENCY,
+    ) -> List[ErrorAnalysis]:
         """
-        Format analysis for human-readable display.
+        Analyze multiple error logs concurrently.
 
-        Returns a formatted string suitable for Slack/Teams notifications.
+        For efficiency, similar errors are grouped and analyzed once: logs
+        that differ only in timestamps, hex/UUID identifiers or long numbers
+        share a signature. With the LLM enabled, the unique logs are sent
+        ANALYZE_BATCH_SIZE at a time as a single request returning a JSON
+        array of analyses, with up to `concurrency` requests in flight.
+
+        Args:
+            error_logs: Logs to analyze
+            concurrency: Maximum number of in-flight LLM requests, including
+                per-log fallbacks for chunks whose batched request failed
+
+        Returns:
+            One ErrorAnalysis per input log, in input order
         """
-        severity_emoji = {
-            Severity.LOW: "🟢",
-            Severity.MEDIUM: "🟡",
-            Severity.HIGH: "🟠",
-            Severity.CRITICAL: "🔴",
-        }
+        groups = _group_logs(error_logs)
+        unique_logs = [error_logs[indices[0]] for indices in groups.values()]
+
+        if self.is_enabled:
+            analyses = [self._cached_analysis(key) for key in groups]
+            misses = [i for i, analysis in enumerate(analyses) if analysis is None]
+            semaphore = asyncio.Semaphore(concurrency)
+            chunks = await asyncio.gather(
+                *(
+                    self._analyze_chunk(
+                        [unique_logs[i] for i in misses[start : start + ANALYZE_BATCH_SIZE]],
+                        semaphore,
+                    )
+                    for start in range(0, len(misses), ANALYZE_BATCH_SIZE)
+                )
+            )
+            for i, analysis in zip(misses, (a for chunk in chunks for a in chunk)):
+                analyses[i] = analysis
+        else:
+            analyses = [self._get_mock_response(log) for log in unique_logs]
 
-        return f"""
-{severity_emoji.get(analysis.business_impact, "⚪")} **{analysis.error_type.value}** (Confidence: {analysis.confidence_score:.0%})
+        logger.info(
+            "Batch analysis completed",
+            logs=len(error_logs),
+            unique_logs=len(unique_logs),
+        )
+        return _spread_analyses(groups, analyses, len(error_logs))
 
-**Root Cause:**
-{analysis.root_cause}
+    async def _analyze_chunk(
+        self, error_logs: List[str], semaphore: asyncio.Semaphore
+    ) -> List[ErrorAnalysis]:
+        """
+        Analyze several distinct logs with one LLM request.
 
-**Affected Tables:**
-{', '.join(analysis.affected_tables) or 'None identified'}
+        Falls back to per-log analyze_async() if the response is unusable.
+        Every request, fallbacks included, holds a slot of `semaphore`.
+        """
 
-**Recommended Action:**
-{analysis.recommended_action}
+        async def _bounded(log: str) -> ErrorAnalysis:
+            async with semaphore:
+                return await self.analyze_async(log)
 
-{f"**SQL Fix (for review):**```sql{analysis.sql_fix}```" if analysis.sql_fix else ""}
+        if len(error_logs) == 1:
+            return [await _bounded(error_logs[0])]
 
-⚠️ **Human approval required before any action**
-"""
+        numbered = "\n\n".join(f"[{i}]\n{log}" for i, log in enumerate(error_logs))
+        user_message = (
+            f"Analyze each of these {len(error_logs)} errors independently and suggest "
+            'remediation. Respond with a JSON object {"analyses": [...]} containing one '
+            "analysis per error, in the same order as the errors.\n\n" + numbered
+        )
+
+        try:
+            async with semaphore:
+                response = await self._get_async_client().chat.completions.create(
+                    model=self.settings.azure_openai_deployment_name,
+                    messages=[
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": user_message},
+                    ],
+                    temperature=0.3,
+                    max_tokens=1000 * len(error_logs),
+                    response_format={"type": "json_object"},
+                )
+
+            items = _BATCH_ANALYSIS_DECODER.decode(response.choices[0].message.content).analyses
+            if len(items) != len(error_logs):
+                raise ValueError(f"expected {len(error_logs)} analyses, got {len(items)}")
+
+            analyses = [item.to_analysis() for item in items]
+
+        except Exception as e:
+            logger.warning("Batched analysis failed, analyzing individually", error=str(e))
+            return list(await asyncio.gather(*(_bounded(log) for log in error_logs)))
+
+        for log, analysis in zip(error_logs, analyses):
+            self._remember_analysis(_log_signature(log), analysis)
+        return analyses
+
+    def format_for_display(self, analysis: ErrorAnalysis) -> str:
+        """
+        Format analysis for human-readable display.
+
+        Returns a formatted string suitable for Slack/Teams notifications.
+        """
+        sql_fix = _DISPLAY_SQL_FIX.format(analysis.sql_fix) if analysis.sql_fix else ""
+
+        return _DISPLAY_TEMPLATE.format(
+            emoji=_SEVERITY_EMOJI.get(analysis.business_impact, "⚪"),
+            error_type=analysis.error_type.value,
+            confidence=analysis.confidence_score,
+            root_cause=analysis.root_cause,
+            tables=", ".join(analysis.affected_tables) or "None identified",
+            action=analysis.recommended_action,
+            sql_fix=sql_fix,
+        )
@@ -38,18 +38,51 @@ MOCK MODE:
 When ENABLE_LLM_OBSERVABILITY=false, returns mock context.
 """
 
-import json
+import copy
+import hashlib
+import heapq
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
+import numpy as np
+import orjson
 from pydantic import BaseModel, Field
 
-from src.utils.config import get_settings
+from src.observability.doc_generator import MANIFEST_STREAM_THRESHOLD_BYTES
+from src.observability.log_analyzer import _log_signature
+from src.utils.config import get_settings, user_cache_dir
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Semantic retrieval (LLM mode only): local Chroma store, one HNSW
+# collection per chunk type, filled with precomputed embeddings
+RAG_VECTOR_STORE_PATH = ".rag_cache"
+RAG_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+RAG_EMBED_BATCH_SIZE = 64  # Texts per encoder forward pass
+RAG_UPSERT_BATCH_SIZE = 200  # Records per Chroma write (it favours 50-250)
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+# Assembled prompt contexts kept for repeated top-k chunk sets
+PROMPT_CONTEXT_CACHE_SIZE = 1024
+
+# Cold loads of independent sources (see _load_sources), shared by all
+# providers so creating providers never leaves threads behind. Loaders never
+# submit to the pool themselves, so sharing it cannot deadlock.
+_LOADER_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rag-loader")
+
+# Parsed YAML cached as JSON (see _load_yaml_cached) in this per-user cache
+# subdirectory (see user_cache_dir), outside the source tree
+YAML_CACHE_SUBDIR = "yaml"
+
 
 class QueryType(str, Enum):
     """Types of queries for routing to appropriate context."""
@@ -61,14 +94,66 @@ class QueryType(str, Enum):
     GENERAL = "general"
 
 
-class ContextChunk(BaseModel):
-    """A chunk of context retrieved for RAG."""
+@dataclass(slots=True, frozen=True)
+class ContextChunk:
+    """
+    A chunk of context retrieved for RAG.
+
+    Slotted and frozen: chunks are built for every loaded document and
+    cached and shared between queries, so ranking works on scored() copies.
+    The score range is checked at construction, not on every copy.
+    """
 
-    content: str = Field(description="The text content")
-    source: str = Field(description="Source of the content (file path, table name)")
-    chunk_type: str = Field(description="Type: contract, manifest, log, doc")
-    relevance_score: float = Field(default=0.0, ge=0.0, le=1.0)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    content: str
+    source: str  # Source of the content (file path, table name)
+    chunk_type: str  # Type: contract, manifest, log, doc
+    relevance_score: float = 0.0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    # Derived from content when the chunk is built; scored() copies share them
+    tokens: FrozenSet[str] = field(init=False, repr=False, compare=False)  # For keyword ranking
+    prompt_block: str = field(init=False, repr=False, compare=False)  # As rendered in a prompt
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.relevance_score <= 1.0:
+            raise ValueError(f"relevance_score must be within [0, 1], got {self.relevance_score}")
+
+        object.__setattr__(self, "tokens", frozenset(self.content.lower().split()))
+        object.__setattr__(
+            self,
+            "prompt_block",
+            f"Source: {self.source}\nType: {self.chunk_type}\nContent:\n{self.content}\n",
+        )
+
+    def scored(self, relevance_score: float) -> "ContextChunk":
+        """Copy of this chunk carrying a relevance score in [0, 1]."""
+        chunk = copy.copy(self)
+        object.__setattr__(chunk, "relevance_score", relevance_score)
+        return chunk
+
+
+# Keyword routes for classify_query, highest precedence first; keywords
+# match as case-insensitive substrings anywhere in the query
+_QUERY_ROUTES = (
+    (QueryType.ERROR_ANALYSIS, ("error", "fail", "exception", "traceback")),
+    (QueryType.SCHEMA_QUESTION, ("schema", "column", "field", "type")),
+    (QueryType.LINEAGE_QUESTION, ("lineage", "upstream", "downstream", "depends")),
+    (QueryType.DOCUMENTATION, ("what is", "explain", "document", "how does")),
+)
+_QUERY_PRECEDENCE = {query_type.value: rank for rank, (query_type, _) in enumerate(_QUERY_ROUTES)}
+
+# All routes in one pattern, one named group per type. The zero-width
+# lookahead tries every position, so a keyword can never hide one that
+# overlaps it; at a given position, alternation order is precedence order.
+_QUERY_KEYWORD_PATTERN = re.compile(
+    "(?=(?:"
+    + "|".join(
+        f"(?P<{query_type.value}>{'|'.join(map(re.escape, keywords))})"
+        for query_type, keywords in _QUERY_ROUTES
+    )
+    + "))",
+    re.IGNORECASE,
+)
 
 
 class RAGContext(BaseModel):
@@ -84,15 +169,245 @@ class RAGContext(BaseModel):
         if not self.chunks:
             return "No relevant context found."
 
-        context_parts = []
-        for i, chunk in enumerate(self.chunks[:5], 1):  # Max 5 chunks
-            context_parts.append(
-                f"[{i}] Source: {chunk.source}\n"
-                f"Type: {chunk.chunk_type}\n"
-                f"Content:\n{chunk.content}\n"
+        # Max 5 chunks
+        return _join_prompt_blocks(tuple(chunk.prompt_block for chunk in self.chunks[:5]))
+
+
+@lru_cache(maxsize=PROMPT_CONTEXT_CACHE_SIZE)
+def _join_prompt_blocks(blocks: Tuple[str, ...]) -> str:
+    """
+    Number and join chunk prompt blocks.
+
+    Similar errors retrieve the same top chunks, so assembled contexts are
+    memoized. Keys are the chunks' shared prompt_block strings, whose
+    hashes are cached on the objects, making a hit a tuple lookup.
+    """
+    return "\n---\n".join(f"[{i}] {block}" for i, block in enumerate(blocks, 1))
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache of query embeddings shared by all RAG providers.
+
+    Keys are the normalized-log signature used by LogAnalyzer, so the same
+    error reported with different timestamps, ids or run numbers is
+    embedded once. Thread-safe; embeddings are computed outside the lock.
+    """
+
+    def __init__(self, maxsize: int = QUERY_EMBEDDING_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str, embed: Callable[[str], List[float]]) -> List[float]:
+        """Return the cached embedding for a query, computing it on a miss."""
+        key = _log_signature(query)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                return embedding
+
+        embedding = embed(query)
+        with self._lock:
+            self._entries[key] = embedding
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return embedding
+
+
+_query_embedding_cache = QueryEmbeddingCache()
+
+
+class _VectorIndex:
+    """
+    Chroma HNSW collections of chunk embeddings, one per chunk type.
+
+    Chunks are embedded in batches with sentence-transformers and written
+    with their embeddings, so Chroma never embeds per insert. A collection
+    records a fingerprint of the chunks it holds and is rebuilt only when
+    they change, so restarts reuse the persisted index.
+    """
+
+    def __init__(self, path: str):
+        import chromadb
+        from sentence_transformers import SentenceTransformer
+
+        self._client = chromadb.PersistentClient(path=path)
+        self._model = SentenceTransformer(RAG_EMBEDDING_MODEL)
+        self._indexed: Dict[str, Tuple[Any, List[ContextChunk]]] = {}
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        return self._model.encode(
+            texts,
+            batch_size=RAG_EMBED_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).tolist()
+
+    def _embed_query(self, query: str) -> List[float]:
+        """Query embedding, reused for repeated (normalized) queries."""
+        return _query_embedding_cache.get(query, lambda text: self._embed([text])[0])
+
+    def _bulk_upsert(self, collection: Any, chunks: List[ContextChunk]) -> None:
+        """
+        Write chunks and their embeddings in RAG_UPSERT_BATCH_SIZE windows.
+
+        All texts are embedded in one encode() call; each window is then a
+        single Chroma transaction. Upsert keeps a retried build idempotent.
+        """
+        documents = [chunk.content for chunk in chunks]
+        embeddings = self._embed(documents)
+        for start in range(0, len(chunks), RAG_UPSERT_BATCH_SIZE):
+            end = min(start + RAG_UPSERT_BATCH_SIZE, len(chunks))
+            collection.upsert(
+                ids=[str(i) for i in range(start, end)],
+                documents=documents[start:end],
+                embeddings=embeddings[start:end],
             )
 
-        return "\n---\n".join(context_parts)
+    def index(self, chunk_type: str, chunks: List[ContextChunk]) -> None:
+        """(Re)build the collection for one chunk type if its chunks changed."""
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in chunks:
+            digest.update(chunk.content.encode())
+        fingerprint = digest.hexdigest()
+
+        name = f"rag_{chunk_type}"
+        try:
+            collection = self._client.get_collection(name)
+        except Exception:  # Missing collection; the error type varies by Chroma version
+            collection = None
+
+        stale = collection is not None and (
+            (collection.metadata or {}).get("fingerprint") != fingerprint
+            or collection.count() != len(chunks)
+        )
+        if stale:
+            self._client.delete_collection(name)
+
+        if collection is None or stale:
+            collection = self._client.create_collection(
+                name, metadata={"hnsw:space": "cosine", "fingerprint": fingerprint}
+            )
+            self._bulk_upsert(collection, chunks)
+            logger.info(f"Indexed {len(chunks)} {chunk_type} chunks for semantic retrieval")
+
+        self._indexed[chunk_type] = (collection, chunks)
+
+    def rank(
+        self,
+        query: str,
+        chunk_types: List[str],
+        max_chunks: int,
+    ) -> List[ContextChunk]:
+        """Nearest chunks to the query across the given types, best first."""
+        query_embeddings = [self._embed_query(query)]
+
+        ranked = []
+        for chunk_type in chunk_types:
+            if chunk_type not in self._indexed:
+                continue
+            collection, chunks = self._indexed[chunk_type]
+            result = collection.query(
+                query_embeddings=query_embeddings,
+                n_results=min(max_chunks, len(chunks)),
+                include=["distances"],
+            )
+            for doc_id, distance in zip(result["ids"][0], result["distances"][0]):
+                score = min(max(1.0 - distance, 0.0), 1.0)
+                ranked.append(chunks[int(doc_id)].scored(score))
+
+        # Top k of at most k per type, in O(n log k); ties keep type order
+        return heapq.nlargest(max_chunks, ranked, key=lambda c: c.relevance_score)
+
+
+def _yaml_sidecar_path(path: Path) -> Path:
+    """JSON sidecar in the YAML cache directory, keyed by the file's absolute path."""
+    digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:16]
+    return user_cache_dir(YAML_CACHE_SUBDIR) / f"{path.stem}-{digest}.json"
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """
+    Load a YAML file through a JSON sidecar in the per-user cache directory.
+
+    PERFORMANCE OPTIMIZATION:
+    Even with libyaml's C loader, YAML parsing is several times slower than
+    orjson. The sidecar records the YAML file's (st_mtime_ns, st_size) and
+    is used only while both match exactly, so a file restored with an
+    older mtime (cp -p, rsync, tar) is reparsed rather than served stale.
+    An unusable cache directory simply skips the sidecar. Only
+    JSON-representable YAML (no dates or non-string keys) round-trips
+    unchanged.
+    """
+    import yaml
+
+    stat = path.stat()
+    version = [stat.st_mtime_ns, stat.st_size]
+    json_path: Optional[Path] = None
+    try:
+        json_path = _yaml_sidecar_path(path)
+        cached = orjson.loads(json_path.read_bytes())
+        if cached["source"] == version:
+            return cached["data"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        pass
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=loader)
+
+    if json_path is not None:
+        staging = json_path.with_name(f"{json_path.name}.{threading.get_ident()}.tmp")
+        try:
+            staging.write_bytes(orjson.dumps({"source": version, "data": data}))
+            staging.replace(json_path)
+        except (OSError, TypeError):
+            staging.unlink(missing_ok=True)
+
+    return data
+
+
+# Historical error resolutions for similar-error matching.
+# In production: Load from database or log aggregator
+_ERROR_PATTERNS = (
+    {
+        "error": "Column 'X' not found in schema",
+        "root_cause": "Schema drift - new column added in source",
+        "resolution": "1. Update data contract\n2. Add column to Bronze schema\n3. Reprocess",
+        "category": "schema_drift",
+    },
+    {
+        "error": "Connection refused by Oracle",
+        "root_cause": "Database maintenance window or network issue",
+        "resolution": "1. Check Oracle status\n2. Verify network\n3. Retry with backoff",
+        "category": "connection",
+    },
+    {
+        "error": "Null values in required column",
+        "root_cause": "Data quality issue in source",
+        "resolution": "1. Quarantine records\n2. Notify source owner\n3. Review validation rules",
+        "category": "data_quality",
+    },
+    {
+        "error": "MERGE failed - duplicate keys",
+        "root_cause": "Business key collision in source data",
+        "resolution": "1. Check source deduplication\n2. Review business key definition\n3. Add tie-breaker column",
+        "category": "idempotency",
+    },
+)
+
+# Error pattern chunks are static, so they are built and serialized once
+_ERROR_HISTORY_CHUNKS: Tuple[ContextChunk, ...] = tuple(
+    ContextChunk(
+        content=orjson.dumps(pattern, option=orjson.OPT_INDENT_2).decode(),
+        source="error_history",
+        chunk_type="error_pattern",
+        metadata={"category": pattern["category"]},
+    )
+    for pattern in _ERROR_PATTERNS
+)
 
 
 class RAGContextProvider:
@@ -127,8 +442,16 @@ class RAGContextProvider:
         """
         self.settings = get_settings()
         self.project_root = Path(project_root or ".")
-        self._vector_store = None
+        self._vector_store: Optional[_VectorIndex] = None
+        self._vector_store_unavailable = False
         self._documents_loaded = False
+        # Parsed chunks per source, with the file (mtime, size) they were parsed at
+        self._cache: Dict[str, Tuple[Optional[Tuple[int, int]], List[ContextChunk]]] = {}
+        # One lock per source so independent sources can (re)load concurrently
+        self._cache_locks = {
+            key: threading.Lock() for key in ("contracts", "manifest", "error_history")
+        }
+        self._vector_store_lock = threading.Lock()
 
         logger.info(
             "RAGContextProvider initialized",
@@ -144,21 +467,140 @@ class RAGContextProvider:
     # DOCUMENT LOADING
     # =========================================================================
 
+    def _cached(
+        self,
+        key: str,
+        path: Optional[Path],
+        load: Callable[[], List[ContextChunk]],
+    ) -> List[ContextChunk]:
+        """
+        Return the chunks for a source, parsing it only when it has changed.
+
+        PERFORMANCE OPTIMIZATION:
+        Retrievers call the loaders on every query. Parsed chunks (with
+        their serialized content) are kept per source and reused until the
+        backing file's (mtime, size) changes, so repeated queries do no disk
+        reads or YAML/JSON parsing beyond one stat() - never a content hash,
+        which would re-read the whole manifest to check freshness.
+
+        The hit path is lock-free; a (re)parse holds the source's lock so
+        concurrent callers (e.g. parallel Airflow callbacks) parse and index
+        it once, while other sources load in parallel.
+        """
+        try:
+            stat = path.stat() if path is not None else None
+            version = (stat.st_mtime_ns, stat.st_size) if stat is not None else None
+        except FileNotFoundError:
+            version = None
+
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with self._cache_locks[key]:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            chunks = load()
+
+            vector_store = self._get_vector_store()
+            if vector_store is not None and chunks:
+                vector_store.index(chunks[0].chunk_type, chunks)
+
+            self._cache[key] = (version, chunks)
+
+        return chunks
+
+    def _load_sources(
+        self, *sources: Tuple[str, Callable[[], List[ContextChunk]]]
+    ) -> List[ContextChunk]:
+        """
+        Concatenate the chunks of independent (cache key, loader) sources.
+
+        PERFORMANCE OPTIMIZATION:
+        When any source has never been loaded, all but the first are loaded
+        on the shared loader pool while the first loads in the calling thread, overlapping
+        file reads and, in LLM mode, the GIL-releasing embedding of each
+        source's chunks. Once every source is cached the loaders are only
+        stat() checks, so they run inline without a thread hand-off.
+        """
+        if all(key in self._cache for key, _ in sources):
+            return [chunk for _, load in sources for chunk in load()]
+
+        futures = [_LOADER_POOL.submit(load) for _, load in sources[1:]]
+        chunks = list(sources[0][1]())
+        for future in futures:
+            chunks += future.result()
+        return chunks
+
+    @property
+    def data_contracts(self) -> List[ContextChunk]:
+        """Data contract chunks (cached, see _cached)."""
+        return self._load_data_contracts()
+
+    @property
+    def dbt_manifest(self) -> List[ContextChunk]:
+        """dbt model chunks (cached, see _cached)."""
+        return self._load_dbt_manifest()
+
+    @property
+    def error_history(self) -> List[ContextChunk]:
+        """Historical error pattern chunks (cached, see _cached)."""
+        return self._load_error_history()
+
+    def _get_vector_store(self) -> Optional[_VectorIndex]:
+        """
+        Lazy-initialize the semantic index (LLM mode only).
+
+        Falls back to keyword ranking when chromadb or sentence-transformers
+        is not installed or fails to start (e.g. a corrupt index or a model
+        that cannot be downloaded), so retrieval never fails because of the
+        index; mock mode never imports them.
+        """
+        if self._vector_store is not None or not self.is_enabled or self._vector_store_unavailable:
+            return self._vector_store
+
+        with self._vector_store_lock:
+            if self._vector_store is None and not self._vector_store_unavailable:
+                try:
+                    self._vector_store = _VectorIndex(
+                        str(self.project_root / RAG_VECTOR_STORE_PATH)
+                    )
+                    logger.info("RAG vector store initialized")
+                except ImportError:
+                    logger.warning("Vector store packages not installed, using keyword ranking")
+                    self._vector_store_unavailable = True
+                except Exception as e:
+                    logger.warning(f"Vector store unavailable, using keyword ranking: {e}")
+                    self._vector_store_unavailable = True
+
+        return self._vector_store
+
     def _load_data_contracts(self) -> List[ContextChunk]:
         """Load data contracts from YAML."""
+        contracts_path = self.project_root / "src/ingestion/data_contracts/contracts.yaml"
+        return self._cached(
+            "contracts", contracts_path, lambda: self._parse_data_contracts(contracts_path)
+        )
+
+    def _parse_data_contracts(self, contracts_path: Path) -> List[ContextChunk]:
+        """Parse data contracts into one chunk per table."""
         import yaml
 
-        contracts_path = self.project_root / "src/ingestion/data_contracts/contracts.yaml"
         chunks = []
 
         if contracts_path.exists():
-            with open(contracts_path) as f:
-                contracts = yaml.safe_load(f)
+            # libyaml's C dumper when available
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            contracts = _load_yaml_cached(contracts_path)
 
             for table_name, contract in contracts.items():
                 chunks.append(
                     ContextChunk(
-                        content=yaml.dump({table_name: contract}, default_flow_style=False),
+                        content=yaml.dump(
+                            {table_name: contract}, Dumper=dumper, default_flow_style=False
+                        ),
                         source=f"contracts.yaml#{table_name}",
                         chunk_type="contract",
                         metadata={
@@ -175,16 +617,44 @@ class RAGContextProvider:
     def _load_dbt_manifest(self) -> List[ContextChunk]:
         """Load dbt manifest for model documentation."""
         manifest_path = self.project_root / "dbt_project/target/manifest.json"
-        chunks = []
+        return self._cached(
+            "manifest", manifest_path, lambda: self._parse_dbt_manifest(manifest_path)
+        )
 
-        if manifest_path.exists():
-            with open(manifest_path) as f:
-                manifest = json.load(f)
+    @staticmethod
+    def _iter_manifest_models(manifest_path: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the dbt model nodes of a manifest.
 
-            for node_key, node in manifest.get("nodes", {}).items():
-                if not node_key.startswith("model."):
-                    continue
+        Manifests over MANIFEST_STREAM_THRESHOLD_BYTES are streamed with ijson
+        (when installed) one node at a time, so macros, tests and sources are
+        never held in memory together; smaller ones are decoded whole by
+        orjson, which is faster at that size.
+        """
+        with open(manifest_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > MANIFEST_STREAM_THRESHOLD_BYTES:
+                try:
+                    import ijson
+
+                    for node_key, node in ijson.kvitems(f, "nodes"):
+                        if node_key.startswith("model."):
+                            yield node
+                    return
+                except ImportError:
+                    pass
+
+            nodes = orjson.loads(f.read()).get("nodes", {})
+
+        for node_key, node in nodes.items():
+            if node_key.startswith("model."):
+                yield node
+
+    def _parse_dbt_manifest(self, manifest_path: Path) -> List[ContextChunk]:
+        """Parse the dbt manifest into one chunk per model."""
+        chunks = []
 
+        if manifest_path.exists():
+            for node in self._iter_manifest_models(manifest_path):
                 model_info = {
                     "name": node.get("name"),
                     "description": node.get("description", ""),
@@ -195,7 +665,7 @@ class RAGContextProvider:
 
                 chunks.append(
                     ContextChunk(
-                        content=json.dumps(model_info, indent=2),
+                        content=orjson.dumps(model_info, option=orjson.OPT_INDENT_2).decode(),
                         source=f"manifest.json#{node.get('name')}",
                         chunk_type="manifest",
                         metadata=model_info,
@@ -224,7 +694,7 @@ class RAGContextProvider:
             for model in mock_models:
                 chunks.append(
                     ContextChunk(
-                        content=json.dumps(model, indent=2),
+                        content=orjson.dumps(model, option=orjson.OPT_INDENT_2).decode(),
                         source=f"manifest.json#{model['name']}",
                         chunk_type="manifest",
                         metadata=model,
@@ -236,47 +706,11 @@ class RAGContextProvider:
 
     def _load_error_history(self) -> List[ContextChunk]:
         """Load historical error resolutions for similar error matching."""
-        # In production: Load from database or log aggregator
-        # For mock: Return sample error patterns
-
-        error_patterns = [
-            {
-                "error": "Column 'X' not found in schema",
-                "root_cause": "Schema drift - new column added in source",
-                "resolution": "1. Update data contract\n2. Add column to Bronze schema\n3. Reprocess",
-                "category": "schema_drift",
-            },
-            {
-                "error": "Connection refused by Oracle",
-                "root_cause": "Database maintenance window or network issue",
-                "resolution": "1. Check Oracle status\n2. Verify network\n3. Retry with backoff",
-                "category": "connection",
-            },
-            {
-                "error": "Null values in required column",
-                "root_cause": "Data quality issue in source",
-                "resolution": "1. Quarantine records\n2. Notify source owner\n3. Review validation rules",
-                "category": "data_quality",
-            },
-            {
-                "error": "MERGE failed - duplicate keys",
-                "root_cause": "Business key collision in source data",
-                "resolution": "1. Check source deduplication\n2. Review business key definition\n3. Add tie-breaker column",
-                "category": "idempotency",
-            },
-        ]
-
-        chunks = []
-        for pattern in error_patterns:
-            chunks.append(
-                ContextChunk(
-                    content=json.dumps(pattern, indent=2),
-                    source="error_history",
-                    chunk_type="error_pattern",
-                    metadata={"category": pattern["category"]},
-                )
-            )
+        return self._cached("error_history", None, self._parse_error_history)
 
+    def _parse_error_history(self) -> List[ContextChunk]:
+        """Historical error pattern chunks (built once at import)."""
+        chunks = list(_ERROR_HISTORY_CHUNKS)
         logger.info(f"Loaded {len(chunks)} error history chunks")
         return chunks
 
@@ -291,19 +725,15 @@ class RAGContextProvider:
         In production with LLM enabled, this uses an LLM call.
         In mock mode, uses keyword matching.
         """
-        query_lower = query.lower()
-
-        # Keyword-based classification (fast, no LLM needed)
-        if any(word in query_lower for word in ["error", "fail", "exception", "traceback"]):
-            return QueryType.ERROR_ANALYSIS
-        elif any(word in query_lower for word in ["schema", "column", "field", "type"]):
-            return QueryType.SCHEMA_QUESTION
-        elif any(word in query_lower for word in ["lineage", "upstream", "downstream", "depends"]):
-            return QueryType.LINEAGE_QUESTION
-        elif any(word in query_lower for word in ["what is", "explain", "document", "how does"]):
-            return QueryType.DOCUMENTATION
-        else:
-            return QueryType.GENERAL
+        # Keyword-based classification (fast, no LLM needed): a single
+        # scan keeps the best-ranked route, stopping at a top-ranked hit
+        best = len(_QUERY_ROUTES)
+        for match in _QUERY_KEYWORD_PATTERN.finditer(query):
+            best = min(best, _QUERY_PRECEDENCE[match.lastgroup])
+            if best == 0:
+                break
+
+        return _QUERY_ROUTES[best][0] if best < len(_QUERY_ROUTES) else QueryType.GENERAL
 
     # =========================================================================
     # CONTEXT RETRIEVAL
@@ -346,8 +776,13 @@ class RAGContextProvider:
         else:
             chunks = self._retrieve_general(query)
 
-        # Score and rank
-        ranked_chunks = self._rank_chunks(chunks, query)[:max_chunks]
+        # Score and rank: semantic nearest neighbours when indexed
+        vector_store = self._get_vector_store()
+        if vector_store is not None:
+            chunk_types = list(dict.fromkeys(c.chunk_type for c in chunks))
+            ranked_chunks = vector_store.rank(query, chunk_types, max_chunks)
+        else:
+            ranked_chunks = self._rank_chunks(chunks, query, max_chunks)
 
         # Estimate tokens (rough: 4 chars per token)
         total_content = sum(len(c.content) for c in ranked_chunks)
@@ -362,49 +797,62 @@ class RAGContextProvider:
 
     def _retrieve_for_error(self, query: str) -> List[ContextChunk]:
         """Retrieve context for error analysis."""
-        chunks = []
-        chunks.extend(self._load_error_history())
-        chunks.extend(self._load_data_contracts())  # Schema context helps
-        return chunks
+        return self.error_history + self.data_contracts  # Schema context helps
 
     def _retrieve_for_schema(self, query: str) -> List[ContextChunk]:
         """Retrieve context for schema questions."""
-        chunks = []
-        chunks.extend(self._load_data_contracts())
-        chunks.extend(self._load_dbt_manifest())
-        return chunks
+        return self._load_sources(
+            ("contracts", self._load_data_contracts), ("manifest", self._load_dbt_manifest)
+        )
 
     def _retrieve_for_lineage(self, query: str) -> List[ContextChunk]:
         """Retrieve context for lineage questions."""
-        return self._load_dbt_manifest()
+        return self.dbt_manifest
 
     def _retrieve_general(self, query: str) -> List[ContextChunk]:
         """Retrieve general context."""
-        chunks = []
-        chunks.extend(self._load_data_contracts())
-        chunks.extend(self._load_dbt_manifest())
-        return chunks
+        return self._load_sources(
+            ("contracts", self._load_data_contracts), ("manifest", self._load_dbt_manifest)
+        )
 
     def _rank_chunks(
         self,
         chunks: List[ContextChunk],
         query: str,
+        max_chunks: Optional[int] = None,
     ) -> List[ContextChunk]:
         """
-        Rank chunks by relevance to query.
+        Rank chunks by keyword overlap with the query, best first.
+
+        Used in mock mode, or when the vector store is unavailable; with
+        the LLM enabled, get_context() ranks by embedding similarity.
 
-        In production with LLM: Use embedding similarity.
-        In mock mode: Simple keyword matching.
+        PERFORMANCE OPTIMIZATION:
+        Scores are set intersections against each chunk's cached token
+        set, gathered into one array. The top max_chunks are selected in
+        O(N) with np.partition (ties keep retrieval order, as a stable sort
+        would), and only those chunks are copied to carry their score.
         """
-        query_words = set(query.lower().split())
+        query_words = frozenset(query.lower().split())
+        query_size = max(len(query_words), 1)
 
-        for chunk in chunks:
-            content_words = set(chunk.content.lower().split())
-            overlap = len(query_words & content_words)
-            chunk.relevance_score = min(overlap / max(len(query_words), 1), 1.0)
+        scores = np.fromiter(
+            (len(query_words & chunk.tokens) for chunk in chunks), np.float64, count=len(chunks)
+        )
+        np.minimum(scores / query_size, 1.0, out=scores)
+
+        k = len(chunks) if max_chunks is None else min(max_chunks, len(chunks))
+        if k < len(chunks):
+            threshold = np.partition(scores, len(chunks) - k)[len(chunks) - k]
+            above = np.flatnonzero(scores > threshold)
+            ties = np.flatnonzero(scores == threshold)[: k - len(above)]
+            top = np.concatenate((above, ties))
+        else:
+            top = np.arange(len(chunks))
+        top = top[np.lexsort((top, -scores[top]))]
 
-        # Sort by relevance
-        return sorted(chunks, key=lambda c: c.relevance_score, reverse=True)
+        # Score copies: loaded chunks are cached and shared between queries
+        return [chunks[i].scored(float(scores[i])) for i in top]
 
 
 # ============================================================================
@@ -32,11 +32,31 @@ CONFIGURATION:
     - SERVERLESS_MODE: true | false
 """
 
-from src.providers.compute import ComputeProvider, get_compute_provider
-from src.providers.llm import LLMProvider, get_llm_provider
-from src.providers.serverless import ServerlessProvider, get_serverless_provider
+from src.providers.compute import ComputeProvider, _compute_provider, get_compute_provider
+from src.providers.llm import LLMProvider, _llm_provider, clear_chat_cache, get_llm_provider
+from src.providers.serverless import (
+    ServerlessProvider,
+    _serverless_provider,
+    get_serverless_provider,
+)
 from src.providers.storage import StorageProvider, get_storage_provider
 
+
+def reset_provider_cache() -> None:
+    """
+    Drop the cached compute, LLM and serverless providers, and cached
+    chat responses.
+
+    The factories return one shared instance per provider name, configured
+    from the environment when first built; clear them to rebuild providers
+    (e.g. between tests, or after changing credentials in the environment).
+    """
+    _compute_provider.cache_clear()
+    _llm_provider.cache_clear()
+    _serverless_provider.cache_clear()
+    clear_chat_cache()
+
+
 __all__ = [
     # Storage
     "StorageProvider",
@@ -50,4 +70,6 @@ __all__ = [
     # Serverless
     "ServerlessProvider",
     "get_serverless_provider",
+    # Factory caching
+    "reset_provider_cache",
 ]
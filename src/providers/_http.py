@@ -0,0 +1,70 @@
+# ============================================================================
+# EDP-IO - Shared HTTP Settings for Cloud Providers
+# ============================================================================
+"""
+Connection-pool sizing and retry policy shared by the provider SDK clients.
+
+SDK defaults keep ~10 pooled connections per host and vary in how they
+retry throttling. Providers configure their clients from here so that
+concurrent calls (async variants, batched submissions) do not queue for a
+connection, and 429/5xx responses are retried with backoff, honoring
+Retry-After.
+"""
+
+from typing import Any, Tuple
+
+HTTP_POOL_CONNECTIONS = 32  # Distinct hosts kept in a requests session
+HTTP_POOL_MAXSIZE = 64  # Connections per host
+HTTP_TIMEOUT_SECONDS = 60
+
+HTTP_MAX_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5  # 0.5s, 1s, 2s, ... between attempts
+HTTP_RETRY_STATUSES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+HTTP_RETRY_TIMEOUT_SECONDS = 300  # For SDKs that bound retries by time
+
+
+def make_session(retry: bool = True) -> Any:
+    """
+    requests.Session with a large connection pool and, optionally, retries.
+
+    Args:
+        retry: Mount the shared Retry policy. Pass False for SDKs that run
+               their own retry policy on top (e.g. Azure), to avoid
+               multiplying attempts.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    max_retries = (
+        Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=HTTP_BACKOFF_FACTOR,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            respect_retry_after_header=True,
+        )
+        if retry
+        else 0
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=max_retries,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def boto_config() -> Any:
+    """botocore Config with the shared pool size and adaptive retries."""
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=HTTP_POOL_MAXSIZE,
+        connect_timeout=HTTP_TIMEOUT_SECONDS,
+        read_timeout=HTTP_TIMEOUT_SECONDS,
+        retries={"max_attempts": HTTP_MAX_RETRIES, "mode": "adaptive"},
+    )
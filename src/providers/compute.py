@@ -15,14 +15,49 @@ Compute providers handle cluster lifecycle and job submission,
 while the actual Spark code remains portable.
 """
 
+import asyncio
 import os
+import random
+import runpy
+import subprocess
+import sys
+import threading
+import time
+import uuid
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
+from src.providers._http import HTTP_POOL_MAXSIZE, HTTP_RETRY_TIMEOUT_SECONDS, HTTP_TIMEOUT_SECONDS
+
+# Job states after which a run no longer changes (Databricks life-cycle
+# states and the local provider's own)
+TERMINAL_JOB_STATES = frozenset(
+    {
+        "SUCCESS",
+        "FAILED",
+        "TERMINATED",
+        "SKIPPED",
+        "INTERNAL_ERROR",
+        "TIMEDOUT",
+        "CANCELED",
+        "CANCELLED",
+    }
+)
+
+# Status polling in wait_for_completion: exponential backoff with jitter
+JOB_POLL_INTERVAL_SECONDS = 2.0
+JOB_POLL_MAX_INTERVAL_SECONDS = 60.0
+JOB_POLL_BACKOFF = 1.5
+
 
 class ClusterState(str, Enum):
     """Cluster lifecycle states."""
@@ -129,12 +164,350 @@ class ComputeProvider(ABC):
         """Get a SparkSession connected to the cluster."""
         pass
 
+    def iter_clusters(self) -> Iterator[ClusterInfo]:
+        """
+        Yield clusters as the backend returns them.
+
+        Providers with paginated APIs override this so callers can start on
+        the first page before the rest is fetched; list_clusters is the
+        fully materialized form.
+        """
+        return iter(self.list_clusters())
+
+    def submit_jobs(self, configs: List[JobConfig]) -> List[JobRun]:
+        """
+        Submit several Spark jobs, returning their runs in input order.
+
+        Providers whose API can submit many tasks at once override this.
+        """
+        return [self.submit_job(config) for config in configs]
+
+    # -------------------------------------------------------------------------
+    # Async variants: the SDK calls block on network I/O, so they run in a
+    # worker thread and many jobs can be submitted or polled concurrently
+    # (e.g. with asyncio.gather)
+    # -------------------------------------------------------------------------
+
+    async def create_cluster_async(self, config: ClusterConfig) -> ClusterInfo:
+        """Async create_cluster."""
+        return await asyncio.to_thread(self.create_cluster, config)
+
+    async def submit_job_async(self, config: JobConfig) -> JobRun:
+        """Async submit_job."""
+        return await asyncio.to_thread(self.submit_job, config)
+
+    async def get_job_status_async(self, run_id: str) -> JobRun:
+        """Async get_job_status."""
+        return await asyncio.to_thread(self.get_job_status, run_id)
+
+    def wait_for_completion(
+        self,
+        run_id: str,
+        poll_interval: float = JOB_POLL_INTERVAL_SECONDS,
+        max_interval: float = JOB_POLL_MAX_INTERVAL_SECONDS,
+        timeout: Optional[float] = None,
+    ) -> JobRun:
+        """
+        Block until a job run reaches a terminal state and return it.
+
+        PERFORMANCE OPTIMIZATION:
+        The wait between status calls grows by JOB_POLL_BACKOFF up to
+        max_interval (with jitter so concurrent waiters spread out), so an
+        hour-long job costs tens of status requests instead of thousands
+        and stays clear of API throttling.
+
+        Raises:
+            TimeoutError: If the run is still active after timeout seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = poll_interval
+
+        while True:
+            run = self.get_job_status(run_id)
+            if run.state in TERMINAL_JOB_STATES:
+                return run
+
+            delay = _poll_delay(interval, max_interval, deadline, run_id)
+            time.sleep(delay)
+            interval *= JOB_POLL_BACKOFF
+
+    async def wait_for_completion_async(
+        self,
+        run_id: str,
+        poll_interval: float = JOB_POLL_INTERVAL_SECONDS,
+        max_interval: float = JOB_POLL_MAX_INTERVAL_SECONDS,
+        timeout: Optional[float] = None,
+    ) -> JobRun:
+        """
+        Async wait_for_completion: status calls run in a worker thread and
+        the backoff sleeps with asyncio.sleep, so the event loop stays free.
+        Cancelling the awaiting task stops waiting (the job keeps running).
+
+        PERFORMANCE OPTIMIZATION:
+        Waiters on the same event loop share one poller (_StatusMultiplexer),
+        so each run is polled once per interval however many tasks await
+        it; the first waiter's poll_interval/max_interval apply to the run.
+
+        Raises:
+            TimeoutError: If the run is still active after timeout seconds
+        """
+        waiter = _status_multiplexer().subscribe(self, run_id, poll_interval, max_interval)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Job run {run_id} did not finish before the timeout") from None
+
+
+def _poll_delay(
+    interval: float, max_interval: float, deadline: Optional[float], run_id: str
+) -> float:
+    """Jittered wait before the next status poll, capped by the deadline."""
+    delay = random.uniform(0.5, 1.0) * min(interval, max_interval)
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Job run {run_id} did not finish before the timeout")
+        delay = min(delay, remaining)
+    return delay
+
+
+class _StatusMultiplexer:
+    """
+    Shared status poller for wait_for_completion_async on one event loop.
+
+    Every (provider, run_id) being awaited is polled by a single background
+    task with its own backoff, and the result is fanned out to all waiters,
+    so status calls scale with distinct runs instead of waiters.
+    """
+
+    def __init__(self) -> None:
+        # (provider, run_id) -> futures of the tasks awaiting the run
+        self._subs: Dict[Tuple[ComputeProvider, str], List[asyncio.Future]] = {}
+        # (provider, run_id) -> [next poll time, current interval, max interval]
+        self._schedule: Dict[Tuple[ComputeProvider, str], List[float]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(
+        self, provider: ComputeProvider, run_id: str, poll_interval: float, max_interval: float
+    ) -> asyncio.Future:
+        """Future resolved with the run once it reaches a terminal state."""
+        key = (provider, run_id)
+        waiter = asyncio.get_running_loop().create_future()
+        waiter.add_done_callback(lambda done: self._unsubscribe(key, done))
+        self._subs.setdefault(key, []).append(waiter)
+        if key not in self._schedule:
+            # Poll new runs right away
+            self._schedule[key] = [time.monotonic(), poll_interval, max_interval]
+            self._wakeup.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll_loop())
+        return waiter
+
+    def _unsubscribe(self, key: Tuple[ComputeProvider, str], waiter: asyncio.Future) -> None:
+        """Forget a waiter that timed out or was cancelled; stop polling unwatched runs."""
+        waiters = self._subs.get(key)
+        if not waiters or not waiter.cancelled():
+            return
+        waiters.remove(waiter)
+        if not waiters:
+            del self._subs[key]
+            del self._schedule[key]
+            self._wakeup.set()
+
+    async def _poll_loop(self) -> None:
+        try:
+            while self._subs:
+                now = time.monotonic()
+                due = [key for key, (next_poll, _, _) in self._schedule.items() if next_poll <= now]
+                results = await asyncio.gather(
+                    *(provider.get_job_status_async(run_id) for provider, run_id in due),
+                    return_exceptions=True,
+                )
+                for key, result in zip(due, results):
+                    self._dispatch(key, result)
+
+                if self._schedule:
+                    self._wakeup.clear()
+                    next_poll = min(entry[0] for entry in self._schedule.values())
+                    try:
+                        await asyncio.wait_for(
+                            self._wakeup.wait(), max(0.0, next_poll - time.monotonic())
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+        except asyncio.CancelledError:
+            self._fail_all(None)
+            raise
+        except Exception as e:
+            # A poller bug must not leave waiters hanging until their timeout
+            self._fail_all(e)
+        finally:
+            self._task = None
+
+    def _fail_all(self, error: Optional[BaseException]) -> None:
+        """Fail (or, with no error, cancel) every pending waiter and forget all runs."""
+        subs, self._subs, self._schedule = self._subs, {}, {}
+        for waiters in subs.values():
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+                if error is None:
+                    waiter.cancel()
+                else:
+                    waiter.set_exception(error)
+
+    def _dispatch(self, key: Tuple[ComputeProvider, str], result: Any) -> None:
+        """Resolve the run's waiters if it is finished, else schedule its next poll."""
+        if key not in self._schedule:
+            return  # Every waiter left while the status call was in flight
+        # Waiters that timed out or were cancelled are done already
+        waiters = [waiter for waiter in self._subs.get(key, []) if not waiter.done()]
+        if isinstance(result, BaseException):
+            for waiter in waiters:
+                waiter.set_exception(result)
+        elif result.state in TERMINAL_JOB_STATES:
+            for waiter in waiters:
+                waiter.set_result(result)
+        elif waiters:
+            self._subs[key] = waiters
+            entry = self._schedule[key]
+            entry[0] = time.monotonic() + _poll_delay(entry[1], entry[2], None, key[1])
+            entry[1] *= JOB_POLL_BACKOFF
+            return
+
+        del self._subs[key]
+        del self._schedule[key]
+
+
+# One multiplexer per running event loop
+_STATUS_MULTIPLEXERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _StatusMultiplexer]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _status_multiplexer() -> _StatusMultiplexer:
+    """The running loop's multiplexer (asyncio objects are bound to one loop)."""
+    loop = asyncio.get_running_loop()
+    multiplexer = _STATUS_MULTIPLEXERS.get(loop)
+    if multiplexer is None:
+        multiplexer = _STATUS_MULTIPLEXERS[loop] = _StatusMultiplexer()
+    return multiplexer
+
 
 # ============================================================================
 # DATABRICKS IMPLEMENTATION (Multi-Cloud)
 # ============================================================================
 
 
+# One WorkspaceClient per (host, token), shared by all provider instances
+_WORKSPACE_CLIENTS: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+_WORKSPACE_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_workspace_client(host: Optional[str], token: Optional[str]) -> Any:
+    """
+    Shared WorkspaceClient for a workspace and credential.
+
+    PERFORMANCE OPTIMIZATION:
+    A client owns its HTTP session and resolved auth, so reusing it keeps
+    TLS connections and tokens warm across provider instances instead of
+    paying a handshake and auth exchange per factory call.
+    """
+    key = (host, token)
+    client = _WORKSPACE_CLIENTS.get(key)
+    if client is None:
+        with _WORKSPACE_CLIENTS_LOCK:
+            client = _WORKSPACE_CLIENTS.get(key)
+            if client is None:
+                from databricks.sdk import WorkspaceClient
+                from databricks.sdk.core import Config
+
+                client = WorkspaceClient(
+                    config=Config(
+                        host=host,
+                        token=token,
+                        http_timeout_seconds=HTTP_TIMEOUT_SECONDS,
+                        retry_timeout_seconds=HTTP_RETRY_TIMEOUT_SECONDS,
+                        max_connections_per_pool=HTTP_POOL_MAXSIZE,
+                    )
+                )
+                _WORKSPACE_CLIENTS[key] = client
+    return client
+
+
+# Databricks cluster state -> ClusterState (anything else maps to ERROR)
+_DBX_CLUSTER_STATE: Mapping[str, ClusterState] = MappingProxyType(
+    {
+        "PENDING": ClusterState.PENDING,
+        "RESTARTING": ClusterState.PENDING,
+        "RUNNING": ClusterState.RUNNING,
+        "RESIZING": ClusterState.RUNNING,
+        "TERMINATING": ClusterState.TERMINATING,
+        "TERMINATED": ClusterState.TERMINATED,
+    }
+)
+
+
+def _job_state_from_sdk(state: Any) -> str:
+    """
+    Job run state: the life-cycle state while a run is active, its result
+    (SUCCESS, FAILED, TIMEDOUT, CANCELED) once it has terminated.
+    """
+    if state.life_cycle_state.value == "TERMINATED" and state.result_state is not None:
+        return state.result_state.value
+    return state.life_cycle_state.value
+
+
+def _cluster_target(config: JobConfig) -> Tuple[Any, ...]:
+    """Key of the cluster a job runs on; equal keys can share one submission."""
+    if config.cluster_id:
+        return ("existing", config.cluster_id)
+    if config.new_cluster:
+        cluster = config.new_cluster
+        return ("new", cluster.spark_version, cluster.node_type, cluster.num_workers)
+    return ("default",)
+
+
+def _job_task(config: JobConfig, task_key: str) -> Dict[str, Any]:
+    """Databricks run task for a job (spark_python_task on its cluster)."""
+    task: Dict[str, Any] = {
+        "task_key": task_key,
+        "spark_python_task": {
+            "python_file": config.script_path,
+            "parameters": [f"{k}={v}" for k, v in config.parameters.items()],
+        },
+    }
+
+    if config.cluster_id:
+        task["existing_cluster_id"] = config.cluster_id
+    elif config.new_cluster:
+        task["new_cluster"] = {
+            "spark_version": config.new_cluster.spark_version,
+            "node_type_id": config.new_cluster.node_type,
+            "num_workers": config.new_cluster.num_workers,
+        }
+
+    return task
+
+
+def _cluster_info_from_sdk(cluster: Any) -> ClusterInfo:
+    """Build ClusterInfo from a databricks-sdk ClusterDetails object."""
+    return ClusterInfo(
+        cluster_id=cluster.cluster_id,
+        name=cluster.cluster_name,
+        state=_DBX_CLUSTER_STATE.get(cluster.state.value, ClusterState.ERROR),
+        spark_version=cluster.spark_version,
+        num_workers=cluster.num_workers or 0,
+        driver_node_type=cluster.driver_node_type_id,
+        created_at=(
+            datetime.fromtimestamp(cluster.start_time / 1000)
+            if cluster.start_time
+            else datetime.now()
+        ),
+    )
+
+
 class DatabricksProvider(ComputeProvider):
     """
     Databricks implementation - works on Azure, GCP, and AWS.
@@ -156,9 +529,7 @@ class DatabricksProvider(ComputeProvider):
     def _get_client(self):
         if self._client is None:
             try:
-                from databricks.sdk import WorkspaceClient
-
-                self._client = WorkspaceClient(host=self.host, token=self.token)
+                self._client = _get_workspace_client(self.host, self.token)
             except ImportError:
                 raise ImportError("databricks-sdk not installed")
         return self._client
@@ -195,33 +566,16 @@ class DatabricksProvider(ComputeProvider):
 
     def get_cluster(self, cluster_id: str) -> ClusterInfo:
         client = self._get_client()
-        cluster = client.clusters.get(cluster_id)
-
-        state_map = {
-            "PENDING": ClusterState.PENDING,
-            "RUNNING": ClusterState.RUNNING,
-            "TERMINATING": ClusterState.TERMINATING,
-            "TERMINATED": ClusterState.TERMINATED,
-        }
-
-        return ClusterInfo(
-            cluster_id=cluster.cluster_id,
-            name=cluster.cluster_name,
-            state=state_map.get(cluster.state.value, ClusterState.ERROR),
-            spark_version=cluster.spark_version,
-            num_workers=cluster.num_workers or 0,
-            driver_node_type=cluster.driver_node_type_id,
-            created_at=(
-                datetime.fromtimestamp(cluster.start_time / 1000)
-                if cluster.start_time
-                else datetime.now()
-            ),
-        )
+        return _cluster_info_from_sdk(client.clusters.get(cluster_id))
 
     def list_clusters(self) -> List[ClusterInfo]:
+        return list(self.iter_clusters())
+
+    def iter_clusters(self) -> Iterator[ClusterInfo]:
+        # clusters.list() already returns full cluster details and pages
+        # lazily: no get() round-trip per cluster, no upfront full listing
         client = self._get_client()
-        clusters = client.clusters.list()
-        return [self.get_cluster(c.cluster_id) for c in clusters]
+        return map(_cluster_info_from_sdk, client.clusters.list())
 
     def terminate_cluster(self, cluster_id: str) -> bool:
         client = self._get_client()
@@ -230,25 +584,7 @@ class DatabricksProvider(ComputeProvider):
 
     def submit_job(self, config: JobConfig) -> JobRun:
         client = self._get_client()
-
-        task = {
-            "task_key": "main",
-            "spark_python_task": {
-                "python_file": config.script_path,
-                "parameters": [f"{k}={v}" for k, v in config.parameters.items()],
-            },
-        }
-
-        if config.cluster_id:
-            task["existing_cluster_id"] = config.cluster_id
-        elif config.new_cluster:
-            task["new_cluster"] = {
-                "spark_version": config.new_cluster.spark_version,
-                "node_type_id": config.new_cluster.node_type,
-                "num_workers": config.new_cluster.num_workers,
-            }
-
-        run = client.jobs.submit(run_name=config.name, tasks=[task])
+        run = client.jobs.submit(run_name=config.name, tasks=[_job_task(config, "main")])
 
         return JobRun(
             run_id=str(run.run_id),
@@ -257,6 +593,49 @@ class DatabricksProvider(ComputeProvider):
             start_time=datetime.now(),
         )
 
+    def submit_jobs(self, configs: List[JobConfig]) -> List[JobRun]:
+        """
+        Submit jobs as one multi-task run per cluster target.
+
+        PERFORMANCE OPTIMIZATION:
+        Jobs bound for the same existing cluster, or for identical new
+        cluster specs, become parallel tasks of a single submission: one
+        REST call per group instead of one per job. Each returned JobRun
+        carries its task's run_id (pollable with get_job_status) and the
+        shared parent run as job_id.
+        """
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for i, config in enumerate(configs):
+            groups.setdefault(_cluster_target(config), []).append(i)
+
+        client = self._get_client()
+        runs: List[Optional[JobRun]] = [None] * len(configs)
+
+        for indices in groups.values():
+            if len(indices) == 1:
+                runs[indices[0]] = self.submit_job(configs[indices[0]])
+                continue
+
+            task_keys = [f"task_{n}" for n in range(len(indices))]
+            first = configs[indices[0]].name
+            submitted = client.jobs.submit(
+                run_name=f"{first} (+{len(indices) - 1} more)",
+                tasks=[_job_task(configs[i], key) for i, key in zip(indices, task_keys)],
+            )
+            parent = client.jobs.get_run(submitted.run_id)
+            task_run_ids = {task.task_key: task.run_id for task in parent.tasks or []}
+
+            started = datetime.now()
+            for i, key in zip(indices, task_keys):
+                runs[i] = JobRun(
+                    run_id=str(task_run_ids.get(key, submitted.run_id)),
+                    job_id=str(submitted.run_id),
+                    state="PENDING",
+                    start_time=started,
+                )
+
+        return runs
+
     def get_job_status(self, run_id: str) -> JobRun:
         client = self._get_client()
         run = client.jobs.get_run(int(run_id))
@@ -264,7 +643,7 @@ class DatabricksProvider(ComputeProvider):
         return JobRun(
             run_id=str(run.run_id),
             job_id=str(run.job_id),
-            state=run.state.life_cycle_state.value,
+            state=_job_state_from_sdk(run.state),
             start_time=datetime.fromtimestamp(run.start_time / 1000),
             end_time=datetime.fromtimestamp(run.end_time / 1000) if run.end_time else None,
         )
@@ -391,11 +770,67 @@ class AWSEMRProvider(ComputeProvider):
 # ============================================================================
 
 
+# Process-wide local SparkSession: starting the JVM takes seconds and two
+# concurrent starts can crash it, so every provider shares one session
+_LOCAL_SPARK: Optional[Any] = None
+_LOCAL_SPARK_LOCK = threading.Lock()
+
+# Local job scripts run in this process, one at a time: they share the
+# session above, and sys.argv is process-global
+_LOCAL_JOB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="edp-local-job")
+
+
+def _run_local_script(script_path: str, argv: List[str]) -> int:
+    """
+    Run a job script as __main__ and return its exit code.
+
+    Like `python script.py`, sys.argv is set to the script and its
+    arguments and the script's directory is put first on sys.path (so it
+    can import sibling modules); both are restored afterwards, and sibling
+    modules the script imported are dropped from sys.modules so the next
+    run picks up edits to them.
+    """
+    script_dir = os.path.dirname(os.path.abspath(script_path))
+    saved_argv, saved_path, saved_modules = sys.argv, sys.path[:], set(sys.modules)
+    sys.argv = [script_path] + argv
+    sys.path.insert(0, script_dir)
+    try:
+        runpy.run_path(script_path, run_name="__main__")
+    except SystemExit as exc:
+        if exc.code is None:
+            return 0
+        return exc.code if isinstance(exc.code, int) else 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - saved_modules:
+            module_file = getattr(sys.modules[name], "__file__", None)
+            if module_file and os.path.abspath(module_file).startswith(script_dir + os.sep):
+                del sys.modules[name]
+    return 0
+
+
+def _session_stopped(session: Any) -> bool:
+    """Whether spark.stop() was called on the session (e.g. by a job script)."""
+    return session.sparkContext._jsc is None
+
+
 class LocalSparkProvider(ComputeProvider):
-    """Local PySpark for development."""
+    """
+    Local PySpark for development.
+
+    Jobs run in this process by default (see submit_job). With
+    isolated=True, or LOCAL_JOB_ISOLATED=true, each job gets its own
+    Python process instead: slower to start, but a running job can be
+    cancelled and a crashing one cannot take the caller down with it.
+    """
 
-    def __init__(self):
-        self._spark = None
+    def __init__(self, isolated: Optional[bool] = None):
+        if isolated is None:
+            isolated = os.getenv("LOCAL_JOB_ISOLATED", "false").lower() == "true"
+        self.isolated = isolated
+        # Queued/running/finished local jobs: run_id -> (future or process, run as submitted)
+        self._runs: Dict[str, Tuple[Union[Future, subprocess.Popen], JobRun]] = {}
 
     def create_cluster(self, config: ClusterConfig) -> ClusterInfo:
         return ClusterInfo(
@@ -415,47 +850,132 @@ class LocalSparkProvider(ComputeProvider):
         return [self.get_cluster("local")]
 
     def terminate_cluster(self, cluster_id: str) -> bool:
-        if self._spark:
-            self._spark.stop()
-            self._spark = None
+        # Drop queued jobs, stop job processes and let in-process jobs finish
+        # before the session goes
+        futures = []
+        for job, _ in self._runs.values():
+            if isinstance(job, subprocess.Popen):
+                job.terminate()
+                job.wait()
+            else:
+                job.cancel()
+                futures.append(job)
+        wait_futures(futures)
+        self._runs.clear()
+
+        global _LOCAL_SPARK
+        with _LOCAL_SPARK_LOCK:
+            if _LOCAL_SPARK is not None:
+                _LOCAL_SPARK.stop()
+                _LOCAL_SPARK = None
         return True
 
     def submit_job(self, config: JobConfig) -> JobRun:
-        import subprocess
+        """
+        Queue the script to run in this process and return immediately.
+
+        PERFORMANCE OPTIMIZATION:
+        The script runs via runpy on a worker thread instead of a new Python
+        interpreter, so it skips interpreter start-up and its
+        SparkSession.builder.getOrCreate() reuses the session already running
+        in this process (get_spark_session()'s, or an earlier job's). Scripts
+        that never touch Spark start no JVM.
+        An uncaught exception or a non-zero sys.exit() marks the run FAILED.
+
+        In-process jobs share this interpreter, so:
+        - they run one at a time, since sys.argv is process-global;
+        - modules they import (other than sibling modules) stay imported;
+        - cancel_job() can only drop runs still queued;
+        - os._exit() or a crash in native code ends the calling process.
+        Use isolated=True for jobs that need any of these to hold; each job
+        then runs as `python script.py` in a child process, as on a cluster.
+
+        Like the cloud providers, the run is then polled with
+        get_job_status().
+        """
+        argv = [f"--{k}={v}" for k, v in config.parameters.items()]
+        if self.isolated:
+            job = subprocess.Popen(
+                [sys.executable, config.script_path] + argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        else:
+            job = _LOCAL_JOB_EXECUTOR.submit(_run_local_script, config.script_path, argv)
 
-        result = subprocess.run(
-            ["python", config.script_path] + [f"--{k}={v}" for k, v in config.parameters.items()],
-            capture_output=True,
-        )
-        return JobRun(
-            run_id="local-run",
+        run_info = JobRun(
+            run_id=f"local-{uuid.uuid4()}",
             job_id="local-job",
-            state="SUCCESS" if result.returncode == 0 else "FAILED",
+            state="RUNNING",
             start_time=datetime.now(),
-            end_time=datetime.now(),
         )
+        self._runs[run_info.run_id] = (job, run_info)
+        return run_info
 
     def get_job_status(self, run_id: str) -> JobRun:
-        return JobRun(run_id=run_id, job_id="local", state="SUCCESS", start_time=datetime.now())
+        if run_id not in self._runs:
+            return JobRun(run_id=run_id, job_id="local", state="SUCCESS", start_time=datetime.now())
+
+        job, run = self._runs[run_id]
+        if run.end_time is not None:
+            return run
+        if isinstance(job, subprocess.Popen):
+            returncode = job.poll()
+            if returncode is None:
+                return run
+            state = "SUCCESS" if returncode == 0 else "FAILED"
+        elif not job.done():
+            return run
+        elif job.cancelled():
+            state = "CANCELLED"
+        elif job.exception() is not None:
+            state = "FAILED"
+        else:
+            state = "SUCCESS" if job.result() == 0 else "FAILED"
+        run = run.model_copy(update={"state": state, "end_time": datetime.now()})
+        self._runs[run_id] = (job, run)
+        return run
 
     def cancel_job(self, run_id: str) -> bool:
+        if run_id not in self._runs:
+            return True
+
+        job, run = self._runs[run_id]
+        if isinstance(job, subprocess.Popen):
+            if job.poll() is not None:
+                return True
+            job.terminate()
+            job.wait()
+        elif job.done():
+            return True
+        # A script already running in this process cannot be interrupted
+        elif not job.cancel():
+            return False
+        self._runs[run_id] = (
+            job,
+            run.model_copy(update={"state": "CANCELLED", "end_time": datetime.now()}),
+        )
         return True
 
     def get_spark_session(self, cluster_id: Optional[str] = None):
-        if self._spark is None:
-            from pyspark.sql import SparkSession
-
-            self._spark = (
-                SparkSession.builder.appName("EDP-IO-Local")
-                .master("local[*]")
-                .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension")
-                .config(
-                    "spark.sql.catalog.spark_catalog",
-                    "org.apache.spark.sql.delta.catalog.DeltaCatalog",
-                )
-                .getOrCreate()
-            )
-        return self._spark
+        global _LOCAL_SPARK
+        if _LOCAL_SPARK is None or _session_stopped(_LOCAL_SPARK):
+            with _LOCAL_SPARK_LOCK:
+                # A job script may have stopped the shared session
+                if _LOCAL_SPARK is None or _session_stopped(_LOCAL_SPARK):
+                    from pyspark.sql import SparkSession
+
+                    _LOCAL_SPARK = (
+                        SparkSession.builder.appName("EDP-IO-Local")
+                        .master("local[*]")
+                        .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension")
+                        .config(
+                            "spark.sql.catalog.spark_catalog",
+                            "org.apache.spark.sql.delta.catalog.DeltaCatalog",
+                        )
+                        .getOrCreate()
+                    )
+        return _LOCAL_SPARK
 
 
 # ============================================================================
@@ -465,8 +985,15 @@ class LocalSparkProvider(ComputeProvider):
 
 def get_compute_provider(provider: Optional[str] = None) -> ComputeProvider:
     """Factory function to get the configured compute provider."""
-    provider = provider or os.getenv("COMPUTE_PROVIDER", "local")
+    return _compute_provider(provider or os.getenv("COMPUTE_PROVIDER", "local"))
+
 
+@lru_cache(maxsize=None)
+def _compute_provider(provider: str) -> ComputeProvider:
+    """
+    One provider instance per name, so clients, the local SparkSession and
+    local job handles are shared by every get_compute_provider() caller.
+    """
     if provider == "databricks":
         return DatabricksProvider()
     elif provider == "dataproc":
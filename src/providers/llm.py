@@ -5,12 +5,41 @@
 Cloud-agnostic LLM interface: Azure OpenAI, Vertex AI, Bedrock, Mock.
 """
 
+import hashlib
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+import numpy as np
+import pydantic_core
+from pydantic import BaseModel, ConfigDict
+
+from src.providers._http import HTTP_MAX_RETRIES, HTTP_POOL_MAXSIZE, HTTP_TIMEOUT_SECONDS
+
+AZURE_OPENAI_API_VERSION = "2024-02-15-preview"
+
+# Texts per embeddings request (the API accepts up to 2048 inputs)
+EMBED_BATCH_SIZE = 512
+AZURE_EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# Mock embeddings: MD5 bits folded into a fixed-size vector
+MOCK_EMBEDDING_DIM = 1536
+_MD5_BITS = 128
+
+# (h >> i) % 100 for all i at once, with h's bits as a 0/1 vector:
+# mod 4 is bits i and i+1; mod 25 is a matrix product with
+# 2**(j - i) % 25 (j >= i); the CRT recombines them as (25a + 76b) % 100
+_SHIFT = np.arange(_MD5_BITS)[None, :] - np.arange(_MD5_BITS)[:, None]
+_POW2_MOD25 = np.where(_SHIFT >= 0, np.power(2, _SHIFT.clip(0) % 20) % 25, 0)
+
+# chat_cached: temperature-0 responses kept in memory, most recent first out
+CHAT_CACHE_SIZE = 1024
+# Role of a marker message that opts a conversation out of the chat cache
+NO_CACHE_ROLE = "no-cache"
 
 
 class LLMMessage(BaseModel):
@@ -19,12 +48,18 @@ class LLMMessage(BaseModel):
 
 
 class LLMUsage(BaseModel):
+    # Frozen with LLMResponse: cached responses share their usage object
+    model_config = ConfigDict(frozen=True)
+
     input_tokens: int
     output_tokens: int
     total_tokens: int
 
 
 class LLMResponse(BaseModel):
+    # Frozen: chat_cached hands the same instance to every caller
+    model_config = ConfigDict(frozen=True)
+
     content: str
     model: str
     usage: LLMUsage
@@ -42,12 +77,110 @@ class LLMProvider(ABC):
     def embed(self, text: str) -> List[float]:
         pass
 
+    def embed_many(self, texts: List[str], batch_size: int = EMBED_BATCH_SIZE) -> List[List[float]]:
+        """
+        Embed several texts, in input order.
+
+        Providers with a batch endpoint override this to send batch_size
+        texts per request; the default embeds one text at a time.
+        """
+        return [self.embed(text) for text in texts]
+
+    def chat_cached(self, messages: List[LLMMessage], temperature: float = 0.0) -> LLMResponse:
+        """
+        chat() with repeated temperature-0 requests answered from memory.
+
+        PERFORMANCE OPTIMIZATION:
+        At temperature 0 the reply is treated as a function of model and
+        messages, so identical requests (agents re-asking the same prompt)
+        skip the network round-trip and token cost. Requests at any other
+        temperature always call chat(). Include a message with role
+        NO_CACHE_ROLE to bypass the cache; it is not sent to the model.
+        """
+        if any(m.role == NO_CACHE_ROLE for m in messages):
+            return self.chat([m for m in messages if m.role != NO_CACHE_ROLE], temperature)
+        if temperature != 0.0:
+            return self.chat(messages, temperature)
+
+        key = _chat_cache_key(self.model_name, messages, temperature)
+        with _CHAT_CACHE_LOCK:
+            response = _CHAT_CACHE.get(key)
+            if response is not None:
+                _CHAT_CACHE.move_to_end(key)
+                return response
+
+        response = self.chat(messages, temperature)
+        with _CHAT_CACHE_LOCK:
+            _CHAT_CACHE[key] = response
+            if len(_CHAT_CACHE) > CHAT_CACHE_SIZE:
+                _CHAT_CACHE.popitem(last=False)
+        return response
+
     @property
     @abstractmethod
     def model_name(self) -> str:
         pass
 
 
+# chat_cached responses, keyed by _chat_cache_key; shared by all providers
+_CHAT_CACHE: "OrderedDict[str, LLMResponse]" = OrderedDict()
+_CHAT_CACHE_LOCK = threading.Lock()
+
+
+def _chat_cache_key(model: str, messages: List[LLMMessage], temperature: float) -> str:
+    """
+    Content hash of a chat request.
+
+    pydantic_core serializes the messages straight to JSON bytes (fields in
+    declaration order), without model_dump() dicts and json.dumps.
+    """
+    payload = pydantic_core.to_json([model, messages, temperature])
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def clear_chat_cache() -> None:
+    """Drop every cached chat response."""
+    with _CHAT_CACHE_LOCK:
+        _CHAT_CACHE.clear()
+
+
+# One AzureOpenAI client per (endpoint, key), shared by all provider instances
+_AZURE_CLIENTS: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+_AZURE_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_azure_client(endpoint: Optional[str], api_key: Optional[str]) -> Any:
+    """
+    Shared AzureOpenAI client, so chat and embed calls reuse one pooled
+    httpx connection set instead of a TLS handshake per call.
+    """
+    key = (endpoint, api_key)
+    client = _AZURE_CLIENTS.get(key)
+    if client is None:
+        with _AZURE_CLIENTS_LOCK:
+            client = _AZURE_CLIENTS.get(key)
+            if client is None:
+                import httpx
+                from openai import AzureOpenAI
+
+                client = AzureOpenAI(
+                    azure_endpoint=endpoint,
+                    api_key=api_key,
+                    api_version=AZURE_OPENAI_API_VERSION,
+                    # The client retries 429/5xx itself, honoring Retry-After
+                    max_retries=HTTP_MAX_RETRIES,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=HTTP_POOL_MAXSIZE,
+                            max_keepalive_connections=HTTP_POOL_MAXSIZE // 2,
+                        ),
+                        timeout=HTTP_TIMEOUT_SECONDS,
+                    ),
+                )
+                _AZURE_CLIENTS[key] = client
+    return client
+
+
 class AzureOpenAIProvider(LLMProvider):
     """Azure OpenAI - uses AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_KEY."""
 
@@ -59,15 +192,16 @@ class AzureOpenAIProvider(LLMProvider):
     def model_name(self) -> str:
         return f"azure/{self.deployment}"
 
-    def chat(self, messages: List[LLMMessage], temperature: float = 0.0) -> LLMResponse:
-        from openai import AzureOpenAI
+    def _get_client(self):
+        if self._client is None:
+            self._client = _get_azure_client(
+                os.getenv("AZURE_OPENAI_ENDPOINT"), os.getenv("AZURE_OPENAI_KEY")
+            )
+        return self._client
 
-        client = AzureOpenAI(
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_key=os.getenv("AZURE_OPENAI_KEY"),
-            api_version="2024-02-15-preview",
-        )
-        start = datetime.now()
+    def chat(self, messages: List[LLMMessage], temperature: float = 0.0) -> LLMResponse:
+        client = self._get_client()
+        start = time.perf_counter()
         resp = client.chat.completions.create(
             model=self.deployment,
             messages=[{"role": m.role, "content": m.content} for m in messages],
@@ -81,19 +215,23 @@ class AzureOpenAIProvider(LLMProvider):
                 output_tokens=resp.usage.completion_tokens,
                 total_tokens=resp.usage.total_tokens,
             ),
-            latency_ms=(datetime.now() - start).total_seconds() * 1000,
+            latency_ms=(time.perf_counter() - start) * 1000.0,
         )
 
     def embed(self, text: str) -> List[float]:
-        from openai import AzureOpenAI
+        return self.embed_many([text])[0]
 
-        client = AzureOpenAI(
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_key=os.getenv("AZURE_OPENAI_KEY"),
-            api_version="2024-02-15-preview",
-        )
-        resp = client.embeddings.create(model="text-embedding-ada-002", input=text)
-        return resp.data[0].embedding
+    def embed_many(self, texts: List[str], batch_size: int = EMBED_BATCH_SIZE) -> List[List[float]]:
+        """One embeddings request per batch_size texts instead of one per text."""
+        client = self._get_client()
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), batch_size):
+            resp = client.embeddings.create(
+                model=AZURE_EMBEDDING_MODEL, input=texts[start : start + batch_size]
+            )
+            # Results carry their input index; keep input order explicitly
+            embeddings.extend(d.embedding for d in sorted(resp.data, key=lambda d: d.index))
+        return embeddings
 
 
 class GCPVertexProvider(LLMProvider):
@@ -162,16 +300,38 @@ class MockLLMProvider(LLMProvider):
         )
 
     def embed(self, text: str) -> List[float]:
-        import hashlib
+        return self.embed_many([text])[0]
 
-        h = int(hashlib.md5(text.encode()).hexdigest(), 16)
-        return [(h >> i) % 100 / 100.0 for i in range(1536)]
+    def embed_many(self, texts: List[str], batch_size: int = EMBED_BATCH_SIZE) -> List[List[float]]:
+        """
+        Deterministic MD5-based vectors: component i is ((h >> i) % 100) / 100.
+
+        Only the first 128 components can be non-zero (h has 128 bits). They
+        are computed for the whole batch with array operations instead of
+        big-int shifts per component (see _POW2_MOD25).
+        """
+        digests = b"".join(hashlib.md5(text.encode()).digest() for text in texts)
+        # bits[:, j] is bit j (least significant first) of each digest
+        bits = np.unpackbits(np.frombuffer(digests, np.uint8).reshape(-1, 16), axis=1)
+        bits = bits[:, ::-1].astype(np.int64)
+
+        mod4 = bits + 2 * np.pad(bits[:, 1:], ((0, 0), (0, 1)))
+        mod25 = (bits @ _POW2_MOD25.T) % 25
+
+        vectors = np.zeros((len(texts), MOCK_EMBEDDING_DIM))
+        vectors[:, :_MD5_BITS] = (25 * mod4 + 76 * mod25) % 100
+        vectors /= 100.0
+        return vectors.tolist()
 
 
 def get_llm_provider(provider: Optional[str] = None) -> LLMProvider:
     """Factory to get configured LLM provider."""
-    provider = provider or os.getenv("LLM_PROVIDER", "mock")
+    return _llm_provider(provider or os.getenv("LLM_PROVIDER", "mock"))
+
 
+@lru_cache(maxsize=None)
+def _llm_provider(provider: str) -> LLMProvider:
+    """One provider instance (and client) per name, shared by all callers."""
     if provider == "azure":
         return AzureOpenAIProvider()
     elif provider in ("gcp", "vertex"):
@@ -10,10 +10,12 @@ PROVIDERS:
 - AWS: Lambda, Fargate
 """
 
+import asyncio
 import os
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
 from pydantic import BaseModel
 
@@ -61,6 +63,25 @@ class ServerlessProvider(ABC):
     def delete_function(self, function_name: str) -> bool:
         pass
 
+    def iter_functions(self) -> Iterator[FunctionDeployment]:
+        """
+        Yield deployed functions as the backend returns them (providers with
+        paginated APIs override this to avoid listing everything upfront).
+        """
+        return iter(self.list_functions())
+
+    # Async variants run the blocking SDK call in a worker thread, so a
+    # fan-out (asyncio.gather over invoke_async) runs concurrently
+    async def deploy_function_async(
+        self, config: FunctionConfig, code_path: str
+    ) -> FunctionDeployment:
+        """Async deploy_function."""
+        return await asyncio.to_thread(self.deploy_function, config, code_path)
+
+    async def invoke_async(self, function_name: str, payload: Dict[str, Any]) -> InvocationResult:
+        """Async invoke."""
+        return await asyncio.to_thread(self.invoke, function_name, payload)
+
 
 class AzureFunctionsProvider(ServerlessProvider):
     """Azure Functions implementation."""
@@ -170,8 +191,12 @@ class MockServerlessProvider(ServerlessProvider):
 
 def get_serverless_provider(provider: Optional[str] = None) -> ServerlessProvider:
     """Factory to get configured serverless provider."""
-    provider = provider or os.getenv("SERVERLESS_PROVIDER", "mock")
+    return _serverless_provider(provider or os.getenv("SERVERLESS_PROVIDER", "mock"))
+
 
+@lru_cache(maxsize=None)
+def _serverless_provider(provider: str) -> ServerlessProvider:
+    """One provider instance per name, shared by all callers."""
     if provider == "azure":
         return AzureFunctionsProvider()
     elif provider == "gcp":
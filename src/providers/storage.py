@@ -16,14 +16,53 @@ FEATURES:
 - Generate signed URLs for temporary access
 """
 
+import asyncio
+import io
 import os
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterator, List, Optional
 
 from pydantic import BaseModel
 
+from src.providers._http import boto_config, make_session
+
+# Transfers move objects in blocks of this size, several blocks in flight,
+# so memory use does not grow with object size
+STORAGE_CHUNK_SIZE = 8 * 1024 * 1024
+STORAGE_MAX_CONCURRENCY = 8
+
+
+class _ChunkStream(io.RawIOBase):
+    """Readable raw stream over an iterator of byte chunks (e.g. an SDK download)."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0  # EOF
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        # Stop fetching further chunks
+        if hasattr(self._chunks, "close"):
+            self._chunks.close()
+        self._pending = memoryview(b"")
+        super().close()
+
 
 class StorageObject(BaseModel):
     """Metadata for a storage object."""
@@ -98,6 +137,34 @@ class StorageProvider(ABC):
         pass
 
     @abstractmethod
+    def open_read(
+        self,
+        remote_path: str,
+        container: Optional[str] = None,
+    ) -> BinaryIO:
+        """
+        Open an object as a readable binary stream.
+
+        Unlike download_bytes, the object is fetched in chunks as it is read,
+        so arbitrarily large objects can be processed in constant memory.
+        Close the stream (or use it as a context manager) when done.
+        """
+        pass
+
+    @abstractmethod
+    def iter_objects(
+        self,
+        prefix: str = "",
+        container: Optional[str] = None,
+    ) -> Iterator[StorageObject]:
+        """
+        Yield objects under a prefix, page by page as the backend lists them.
+
+        Callers can process the first page before the rest is fetched, and
+        stopping early stops the listing.
+        """
+        pass
+
     def list_objects(
         self,
         prefix: str = "",
@@ -105,7 +172,7 @@ class StorageProvider(ABC):
         max_results: int = 1000,
     ) -> List[StorageObject]:
         """List objects with optional prefix filter."""
-        pass
+        return list(islice(self.iter_objects(prefix, container), max_results))
 
     @abstractmethod
     def delete_object(
@@ -144,6 +211,26 @@ class StorageProvider(ABC):
         """Generate a temporary signed URL for access."""
         pass
 
+    # Async variants run the blocking transfer in a worker thread, so many
+    # uploads/downloads can proceed concurrently (e.g. with asyncio.gather)
+    async def upload_file_async(
+        self,
+        local_path: str,
+        remote_path: str,
+        container: Optional[str] = None,
+    ) -> str:
+        """Async upload_file."""
+        return await asyncio.to_thread(self.upload_file, local_path, remote_path, container)
+
+    async def download_file_async(
+        self,
+        remote_path: str,
+        local_path: str,
+        container: Optional[str] = None,
+    ) -> str:
+        """Async download_file."""
+        return await asyncio.to_thread(self.download_file, remote_path, local_path, container)
+
 
 # ============================================================================
 # AZURE IMPLEMENTATION
@@ -175,6 +262,7 @@ class AzureADLSProvider(StorageProvider):
         """Lazy initialization of Azure client."""
         if self._client is None:
             try:
+                from azure.core.pipeline.transport import RequestsTransport
                 from azure.identity import DefaultAzureCredential
                 from azure.storage.filedatalake import DataLakeServiceClient
 
@@ -182,6 +270,10 @@ class AzureADLSProvider(StorageProvider):
                 self._client = DataLakeServiceClient(
                     account_url=f"https://{self.account_name}.dfs.core.windows.net",
                     credential=credential,
+                    # Larger pool; the SDK's own retry policy stays in charge
+                    transport=RequestsTransport(
+                        session=make_session(retry=False), session_owner=False
+                    ),
                 )
             except ImportError:
                 raise ImportError("azure-storage-file-datalake not installed")
@@ -197,7 +289,12 @@ class AzureADLSProvider(StorageProvider):
         file_client = fs_client.get_file_client(remote_path)
 
         with open(local_path, "rb") as f:
-            file_client.upload_data(f, overwrite=True)
+            file_client.upload_data(
+                f,
+                overwrite=True,
+                chunk_size=STORAGE_CHUNK_SIZE,
+                max_concurrency=STORAGE_MAX_CONCURRENCY,
+            )
 
         return self.get_uri(remote_path, container)
 
@@ -212,9 +309,9 @@ class AzureADLSProvider(StorageProvider):
 
         Path(local_path).parent.mkdir(parents=True, exist_ok=True)
 
+        # Stream into the file instead of buffering the whole object
         with open(local_path, "wb") as f:
-            download = file_client.download_file()
-            f.write(download.readall())
+            file_client.download_file(max_concurrency=STORAGE_MAX_CONCURRENCY).readinto(f)
 
         return local_path
 
@@ -244,29 +341,31 @@ class AzureADLSProvider(StorageProvider):
         download = file_client.download_file()
         return download.readall()
 
-    def list_objects(
-        self, prefix: str = "", container: Optional[str] = None, max_results: int = 1000
-    ) -> List[StorageObject]:
+    def open_read(self, remote_path: str, container: Optional[str] = None) -> BinaryIO:
         container = self._get_container(container)
         client = self._get_client()
 
         fs_client = client.get_file_system_client(container)
-        paths = fs_client.get_paths(path=prefix)
+        file_client = fs_client.get_file_client(remote_path)
+        # StorageStreamDownloader is not a file object: adapt its lazily
+        # fetched chunks to a buffered, closable stream
+        downloader = file_client.download_file()
+        return io.BufferedReader(_ChunkStream(downloader.chunks()), STORAGE_CHUNK_SIZE)
+
+    def iter_objects(
+        self, prefix: str = "", container: Optional[str] = None
+    ) -> Iterator[StorageObject]:
+        container = self._get_container(container)
+        client = self._get_client()
 
-        objects = []
-        for path in paths:
+        fs_client = client.get_file_system_client(container)
+        for path in fs_client.get_paths(path=prefix):
             if not path.is_directory:
-                objects.append(
-                    StorageObject(
-                        key=path.name,
-                        size_bytes=path.content_length or 0,
-                        last_modified=path.last_modified,
-                    )
+                yield StorageObject(
+                    key=path.name,
+                    size_bytes=path.content_length or 0,
+                    last_modified=path.last_modified,
                 )
-            if len(objects) >= max_results:
-                break
-
-        return objects
 
     def delete_object(self, remote_path: str, container: Optional[str] = None) -> bool:
         container = self._get_container(container)
@@ -345,7 +444,7 @@ class GCPGCSProvider(StorageProvider):
         client = self._get_client()
 
         bucket = client.bucket(bucket_name)
-        blob = bucket.blob(remote_path)
+        blob = bucket.blob(remote_path, chunk_size=STORAGE_CHUNK_SIZE)
         blob.upload_from_filename(local_path)
 
         return self.get_uri(remote_path, bucket_name)
@@ -357,7 +456,7 @@ class GCPGCSProvider(StorageProvider):
         client = self._get_client()
 
         bucket = client.bucket(bucket_name)
-        blob = bucket.blob(remote_path)
+        blob = bucket.blob(remote_path, chunk_size=STORAGE_CHUNK_SIZE)
 
         Path(local_path).parent.mkdir(parents=True, exist_ok=True)
         blob.download_to_filename(local_path)
@@ -388,24 +487,27 @@ class GCPGCSProvider(StorageProvider):
         blob = bucket.blob(remote_path)
         return blob.download_as_bytes()
 
-    def list_objects(
-        self, prefix: str = "", container: Optional[str] = None, max_results: int = 1000
-    ) -> List[StorageObject]:
+    def open_read(self, remote_path: str, container: Optional[str] = None) -> BinaryIO:
         bucket_name = self._get_bucket(container)
         client = self._get_client()
 
         bucket = client.bucket(bucket_name)
-        blobs = bucket.list_blobs(prefix=prefix, max_results=max_results)
+        return bucket.blob(remote_path).open("rb", chunk_size=STORAGE_CHUNK_SIZE)
 
-        return [
-            StorageObject(
+    def iter_objects(
+        self, prefix: str = "", container: Optional[str] = None
+    ) -> Iterator[StorageObject]:
+        bucket_name = self._get_bucket(container)
+        client = self._get_client()
+
+        bucket = client.bucket(bucket_name)
+        for blob in bucket.list_blobs(prefix=prefix):
+            yield StorageObject(
                 key=blob.name,
                 size_bytes=blob.size or 0,
                 last_modified=blob.updated,
                 content_type=blob.content_type,
             )
-            for blob in blobs
-        ]
 
     def delete_object(self, remote_path: str, container: Optional[str] = None) -> bool:
         bucket_name = self._get_bucket(container)
@@ -472,18 +574,29 @@ class AWSS3Provider(StorageProvider):
             try:
                 import boto3
 
-                self._client = boto3.client("s3", region_name=self.region)
+                self._client = boto3.client("s3", region_name=self.region, config=boto_config())
             except ImportError:
                 raise ImportError("boto3 not installed")
         return self._client
 
+    @staticmethod
+    def _transfer_config():
+        """Multipart, concurrent transfers for upload_file/download_file."""
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=STORAGE_CHUNK_SIZE,
+            multipart_chunksize=STORAGE_CHUNK_SIZE,
+            max_concurrency=STORAGE_MAX_CONCURRENCY,
+        )
+
     def upload_file(
         self, local_path: str, remote_path: str, container: Optional[str] = None
     ) -> str:
         bucket = self._get_bucket(container)
         client = self._get_client()
 
-        client.upload_file(local_path, bucket, remote_path)
+        client.upload_file(local_path, bucket, remote_path, Config=self._transfer_config())
         return self.get_uri(remote_path, bucket)
 
     def download_file(
@@ -493,7 +606,7 @@ class AWSS3Provider(StorageProvider):
         client = self._get_client()
 
         Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-        client.download_file(bucket, remote_path, local_path)
+        client.download_file(bucket, remote_path, local_path, Config=self._transfer_config())
         return local_path
 
     def upload_bytes(
@@ -517,22 +630,27 @@ class AWSS3Provider(StorageProvider):
         response = client.get_object(Bucket=bucket, Key=remote_path)
         return response["Body"].read()
 
-    def list_objects(
-        self, prefix: str = "", container: Optional[str] = None, max_results: int = 1000
-    ) -> List[StorageObject]:
+    def open_read(self, remote_path: str, container: Optional[str] = None) -> BinaryIO:
         bucket = self._get_bucket(container)
         client = self._get_client()
 
-        response = client.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=max_results)
+        # StreamingBody reads from the open HTTP response as it is consumed
+        return client.get_object(Bucket=bucket, Key=remote_path)["Body"]
 
-        return [
-            StorageObject(
-                key=obj["Key"],
-                size_bytes=obj["Size"],
-                last_modified=obj["LastModified"],
-            )
-            for obj in response.get("Contents", [])
-        ]
+    def iter_objects(
+        self, prefix: str = "", container: Optional[str] = None
+    ) -> Iterator[StorageObject]:
+        bucket = self._get_bucket(container)
+        client = self._get_client()
+
+        paginator = client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield StorageObject(
+                    key=obj["Key"],
+                    size_bytes=obj["Size"],
+                    last_modified=obj["LastModified"],
+                )
 
     def delete_object(self, remote_path: str, container: Optional[str] = None) -> bool:
         bucket = self._get_bucket(container)
@@ -624,25 +742,24 @@ class MockStorageProvider(StorageProvider):
     def download_bytes(self, remote_path: str, container: Optional[str] = None) -> bytes:
         return self._get_path(remote_path, container).read_bytes()
 
-    def list_objects(
-        self, prefix: str = "", container: Optional[str] = None, max_results: int = 1000
-    ) -> List[StorageObject]:
+    def open_read(self, remote_path: str, container: Optional[str] = None) -> BinaryIO:
+        return open(self._get_path(remote_path, container), "rb")
+
+    def iter_objects(
+        self, prefix: str = "", container: Optional[str] = None
+    ) -> Iterator[StorageObject]:
         base = self._get_path("", container)
         if not base.exists():
-            return []
+            return
 
-        objects = []
         for path in base.rglob(f"{prefix}*"):
             if path.is_file():
                 stat = path.stat()
-                objects.append(
-                    StorageObject(
-                        key=str(path.relative_to(base)),
-                        size_bytes=stat.st_size,
-                        last_modified=datetime.fromtimestamp(stat.st_mtime),
-                    )
+                yield StorageObject(
+                    key=str(path.relative_to(base)),
+                    size_bytes=stat.st_size,
+                    last_modified=datetime.fromtimestamp(stat.st_mtime),
                 )
-        return objects[:max_results]
 
     def delete_object(self, remote_path: str, container: Optional[str] = None) -> bool:
         path = self._get_path(remote_path, container)
@@ -17,7 +17,9 @@ PRODUCTION NOTES:
 - This module would not change - only environment configuration
 """
 
+import os
 from functools import lru_cache
+from pathlib import Path
 from typing import Literal
 
 from pydantic import Field
@@ -107,6 +109,24 @@ class Settings(BaseSettings):
         description="Azure OpenAI deployment/model name.",
     )
 
+    # -------------------------------------------------------------------------
+    # LLM Metrics
+    # -------------------------------------------------------------------------
+    metrics_durable: bool = Field(
+        default=False,
+        description="fsync the LLM metrics log after each flushed batch (slower, crash-safe).",
+    )
+
+    metrics_hot_cap: int = Field(
+        default=50_000,
+        description="Most recent LLM call records kept in memory; older ones are read from disk.",
+    )
+
+    metrics_retention_days: int = Field(
+        default=90,
+        description="Days of LLM metrics loaded at startup and kept in the analytics index.",
+    )
+
     # -------------------------------------------------------------------------
     # Data Lake Configuration
     # -------------------------------------------------------------------------
@@ -166,6 +186,11 @@ class Settings(BaseSettings):
         description="Local path for Gold layer.",
     )
 
+    bronze_bucket_count: int = Field(
+        default=128,
+        description="Partition count used when clustering Bronze tables on distribute_by keys.",
+    )
+
     # -------------------------------------------------------------------------
     # Logging Configuration
     # -------------------------------------------------------------------------
@@ -248,6 +273,29 @@ def get_settings() -> Settings:
     return Settings()
 
 
+def user_cache_dir(name: str) -> Path:
+    """
+    Private per-user cache directory for derived artifacts, created on use.
+
+    Lives under $EDP_IO_CACHE_DIR, else $XDG_CACHE_HOME/edp-io, else
+    ~/.cache/edp-io - never a shared location such as /tmp, where another
+    local user could read the cache or plant entries in it. Directories are
+    created with mode 0700.
+
+    Args:
+        name: Subdirectory for one kind of artifact (e.g. "yaml")
+    """
+    root = os.getenv("EDP_IO_CACHE_DIR")
+    if root:
+        base = Path(root)
+    else:
+        base = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "edp-io"
+    base.mkdir(mode=0o700, parents=True, exist_ok=True)
+    path = base / name
+    path.mkdir(mode=0o700, exist_ok=True)
+    return path
+
+
 # ============================================================================
 # Module-level convenience exports
 # ============================================================================
@@ -85,6 +85,19 @@ class TestRetailMockDataGenerator:
             assert item["product_id"] in product_ids
             assert any(o["order_id"] == item["order_id"] for o in orders)
 
+    def test_orders_priced_from_added_products(self):
+        """Test a catalog registered with add_products prices generated order items."""
+        from src.ingestion.mock_data import RetailMockDataGenerator
+
+        products = RetailMockDataGenerator(seed=42).generate_products(20)
+        generator = RetailMockDataGenerator(seed=42)
+        generator.add_products(products)
+
+        _, order_items = generator.generate_orders(50, ["CUST-000001"])
+
+        prices = {p["product_id"]: p["unit_price"] for p in products}
+        assert all(item["unit_price"] == prices[item["product_id"]] for item in order_items)
+
     def test_deterministic_with_seed(self):
         """Test generator produces same customer IDs with same seed."""
         from src.ingestion.mock_data import RetailMockDataGenerator
@@ -168,3 +181,24 @@ class TestDataContracts:
             required = ["customer_id", "first_name", "last_name", "email"]
             for field in required:
                 assert field in customer_fields, f"Missing required field: {field}"
+
+
+class TestSQLServerIngestion:
+    """Tests for SQL Server ingestion helpers."""
+
+    def test_identifier_validation_accepts_qualified_names(self):
+        """Test plain and schema-qualified identifiers are accepted."""
+        from src.ingestion.sqlserver_ingest import _validate_identifier
+
+        assert _validate_identifier("dbo.OrderItems") == "dbo.OrderItems"
+        assert _validate_identifier("updated_at") == "updated_at"
+
+    def test_identifier_validation_rejects_injection(self):
+        """Test SQL fragments are rejected before interpolation."""
+        import pytest
+
+        from src.ingestion.sqlserver_ingest import _validate_identifier
+
+        for bad in ["dbo.Orders; DROP TABLE x", "Orders --", "a.b.c", "(SELECT 1)"]:
+            with pytest.raises(ValueError):
+                _validate_identifier(bad)
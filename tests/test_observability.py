@@ -77,6 +77,208 @@ class TestLogAnalyzer:
         result = analyzer.analyze("Null values detected in required field")
         assert result.error_type == ErrorType.DATA_QUALITY
 
+    def test_analyze_batch_groups_duplicates(self, mock_settings):
+        """Test logs differing only in volatile tokens are analyzed once."""
+        mock_settings.enable_llm_observability = False
+
+        from src.observability.log_analyzer import ErrorType, LogAnalyzer, _log_signature
+
+        logs = [
+            "2024-01-15T02:00:01Z Connection refused (session 0x1f3a)",
+            "Column 'loyalty_points' not found",
+            "2024-01-15T02:05:17Z Connection refused (session 0x2b4c)",
+        ]
+        results = LogAnalyzer().analyze_batch(logs)
+
+        assert [r.error_type for r in results] == [
+            ErrorType.CONNECTION_FAILURE,
+            ErrorType.SCHEMA_DRIFT,
+            ErrorType.CONNECTION_FAILURE,
+        ]
+        assert _log_signature(logs[0]) == _log_signature(logs[2])
+        assert _log_signature(logs[0]) != _log_signature(logs[1])
+
+    def test_analyze_batch_inside_running_loop(self, mock_settings):
+        """Test analyze_batch works from a coroutine without nesting asyncio.run."""
+        import asyncio
+        from types import SimpleNamespace
+
+        mock_settings.enable_llm_observability = True
+
+        from src.observability.log_analyzer import ErrorType, LogAnalyzer
+
+        content = (
+            '{"error_type": "ConnectionFailure", "root_cause": "Listener down", '
+            '"business_impact": "HIGH", "recommended_action": "Restart listener", '
+            '"confidence_score": 0.9}'
+        )
+        calls = []
+
+        def create(**params):
+            calls.append(params)
+            message = SimpleNamespace(content=content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        analyzer = LogAnalyzer()
+        analyzer.settings = mock_settings
+        analyzer._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        async def caller():
+            return analyzer.analyze_batch(
+                [
+                    "Connection refused (pid 48213)",
+                    "Listener closed",
+                    "Connection refused (pid 51877)",
+                ]
+            )
+
+        results = asyncio.run(caller())
+
+        assert len(calls) == 2
+        assert [r.error_type for r in results] == [ErrorType.CONNECTION_FAILURE] * 3
+        assert results[0] is results[2]
+
+    def test_analyze_batch_async_bounds_in_flight_requests(self, mock_settings):
+        """Test batched requests and per-log fallbacks share the concurrency limit."""
+        import asyncio
+        from types import SimpleNamespace
+
+        mock_settings.enable_llm_observability = True
+
+        from src.observability.log_analyzer import LogAnalyzer
+
+        content = (
+            '{"error_type": "Timeout", "root_cause": "Slow query", '
+            '"business_impact": "LOW", "recommended_action": "Retry", '
+            '"confidence_score": 0.8}'
+        )
+        in_flight = peak = 0
+
+        async def create(**params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            message = SimpleNamespace(content=content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        analyzer = LogAnalyzer()
+        analyzer.settings = mock_settings
+        analyzer._get_async_client = lambda: client
+
+        logs = [f"Query timed out in step {name}" for name in "abcdefghijklmnopqrstuvwxyz"]
+        results = asyncio.run(analyzer.analyze_batch_async(logs, concurrency=3))
+
+        assert len(results) == len(logs)
+        assert peak == 3
+
+    def test_async_clients_are_owned_by_their_loop(self, mock_settings, monkeypatch):
+        """Test closing one loop's client leaves another loop's client open."""
+        import asyncio
+        import sys
+        from types import SimpleNamespace
+
+        mock_settings.enable_llm_observability = True
+
+        class FakeAsyncClient:
+            def __init__(self, **kwargs):
+                self.closed = False
+
+            async def close(self):
+                self.closed = True
+
+        monkeypatch.setitem(
+            sys.modules, "openai", SimpleNamespace(AsyncAzureOpenAI=FakeAsyncClient)
+        )
+        monkeypatch.setitem(
+            sys.modules,
+            "httpx",
+            SimpleNamespace(AsyncClient=lambda **kwargs: None, Limits=lambda **kwargs: None),
+        )
+        monkeypatch.setenv("AZURE_OPENAI_KEY", "test-key")
+
+        from src.observability.log_analyzer import LogAnalyzer
+
+        analyzer = LogAnalyzer()
+        analyzer.settings = mock_settings
+
+        async def get_client():
+            return analyzer._get_async_client()
+
+        async def close_client():
+            await analyzer.aclose()
+
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(get_client())
+            assert loop.run_until_complete(get_client()) is first
+
+            other = asyncio.run(get_client())
+            assert other is not first
+
+            loop.run_until_complete(close_client())
+            assert first.closed
+            assert not other.closed
+        finally:
+            loop.close()
+
+    def test_analyze_async_falls_back_without_touching_templates(self, mock_settings):
+        """Test a failing LLM call returns a low-confidence copy of the mock."""
+        import asyncio
+
+        mock_settings.enable_llm_observability = True
+
+        from src.observability.log_analyzer import MOCK_RESPONSES, LogAnalyzer
+
+        analyzer = LogAnalyzer()
+        analyzer.settings = mock_settings
+
+        def broken_client():
+            raise RuntimeError("endpoint unreachable")
+
+        analyzer._get_async_client = broken_client
+        result = asyncio.run(analyzer.analyze_async("Connection refused"))
+
+        assert result.confidence_score == 0.2
+        assert "endpoint unreachable" in result.additional_context
+        assert MOCK_RESPONSES["connection"].confidence_score != 0.2
+
+    def test_analyze_memoizes_repeated_errors(self, mock_settings):
+        """Test logs differing only in volatile tokens reuse one LLM analysis."""
+        from types import SimpleNamespace
+
+        mock_settings.enable_llm_observability = True
+
+        from src.observability.log_analyzer import LogAnalyzer
+
+        calls = []
+        content = (
+            '{"error_type": "ConnectionFailure", "root_cause": "Listener down", '
+            '"business_impact": "HIGH", "recommended_action": "Restart listener", '
+            '"confidence_score": 0.9}'
+        )
+
+        def create(**params):
+            calls.append(params)
+            message = SimpleNamespace(content=content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        analyzer = LogAnalyzer()
+        analyzer.settings = mock_settings
+        analyzer._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        first = analyzer.analyze("2024-01-15T02:00:01Z Connection refused (pid 48213)")
+        second = analyzer.analyze("2024-01-15T03:00:09Z Connection refused (pid 51877)")
+
+        assert len(calls) == 1
+        assert second is first
+
 
 class TestSchemaDriftDetector:
     """Tests for schema drift detection."""
@@ -205,3 +407,574 @@ class TestDocGenerator:
 
         assert "dim" in doc.model_name
         assert len(doc.business_rules) > 0
+
+    def test_mock_docs_do_not_share_lists(self, mock_settings):
+        """Test mutating one mock doc does not leak into later ones."""
+        mock_settings.enable_llm_observability = False
+
+        from src.observability.doc_generator import DocGenerator
+
+        generator = DocGenerator()
+        first = generator.generate_model_doc("dim_customer")
+        first.business_rules.append("Injected rule")
+        first.columns.append({"name": "injected"})
+
+        second = generator.generate_model_doc("dim_customer")
+
+        assert "Injected rule" not in second.business_rules
+        assert {"name": "injected"} not in second.columns
+
+    def test_generate_all_preserves_manifest_order(self, mock_settings):
+        """Test generate_all documents every model in manifest order."""
+        mock_settings.enable_llm_observability = False
+
+        from src.observability.doc_generator import DocGenerator
+
+        generator = DocGenerator()
+        docs = generator.generate_all()
+
+        assert [d.model_name for d in docs] == ["stg_customers", "fact_sales"]
+
+    def test_generate_all_inside_running_loop(self, mock_settings):
+        """Test generate_all works from a coroutine without nesting asyncio.run."""
+        import asyncio
+        from types import SimpleNamespace
+
+        mock_settings.enable_llm_observability = True
+
+        from src.observability.doc_generator import DocGenerator
+
+        generator = DocGenerator()
+        generator.settings = mock_settings
+
+        async def close():
+            pass
+
+        async def llm_generate(client, model_name, info, raw_code):
+            return generator._get_mock_doc(model_name, info)
+
+        generator._new_async_client = lambda: SimpleNamespace(close=close)
+        generator._llm_generate_async = llm_generate
+
+        async def caller():
+            return generator.generate_all()
+
+        docs = asyncio.run(caller())
+
+        assert [d.model_name for d in docs] == ["stg_customers", "fact_sales"]
+
+    def test_manifest_loads_only_model_nodes(self, mock_settings, tmp_path):
+        """Test manifest parsing keeps model nodes with only the fields used."""
+        import json
+
+        from src.observability.doc_generator import DocGenerator
+
+        (tmp_path / "target").mkdir()
+        manifest = {
+            "macros": {"macro.edp_io.scd2": {"macro_sql": "..."}},
+            "nodes": {
+                "model.edp_io.stg_orders": {
+                    "name": "stg_orders",
+                    "schema": "silver",
+                    "raw_code": "SELECT 1",
+                    "compiled_code": "SELECT 1",
+                    "depends_on": {"nodes": ["source.bronze.orders"], "macros": []},
+                    "columns": {"order_id": {"description": "PK"}},
+                },
+                "test.edp_io.not_null_order_id": {"name": "not_null_order_id"},
+            },
+        }
+        (tmp_path / "target" / "manifest.json").write_text(json.dumps(manifest))
+
+        nodes = DocGenerator(str(tmp_path))._load_manifest()["nodes"]
+
+        assert list(nodes) == ["model.edp_io.stg_orders"]
+        assert "compiled_code" not in nodes["model.edp_io.stg_orders"]
+        assert list(nodes["model.edp_io.stg_orders"]["columns"]) == ["order_id"]
+
+    def test_manifest_cache_tracks_manifest_changes(self, mock_settings, tmp_path):
+        """Test the msgpack manifest cache is reused, then replaced on change."""
+        import json
+        import os
+
+        from src.observability.doc_generator import DocGenerator
+
+        target = tmp_path / "target"
+        target.mkdir()
+        manifest_path = target / "manifest.json"
+        manifest_path.write_text(json.dumps({"nodes": {"model.edp_io.a": {"name": "a"}}}))
+
+        DocGenerator(str(tmp_path))._load_manifest()
+
+        # Same mtime and size: served from the cache without parsing the JSON
+        stat = manifest_path.stat()
+        manifest_path.write_bytes(b"x" * stat.st_size)
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        nodes = DocGenerator(str(tmp_path))._load_manifest()["nodes"]
+        assert list(nodes) == ["model.edp_io.a"]
+
+        manifest_path.write_text(json.dumps({"nodes": {"model.edp_io.b": {"name": "b"}}}))
+        nodes = DocGenerator(str(tmp_path))._load_manifest()["nodes"]
+
+        assert list(nodes) == ["model.edp_io.b"]
+        assert len(list(target.glob(".manifest_slim.*.msgpack"))) == 1
+
+    def test_generate_all_select_and_exclude(self, mock_settings, tmp_path):
+        """Test select globs, +upstream expansion and exclude filtering."""
+        import json
+
+        mock_settings.enable_llm_observability = False
+
+        from src.observability.doc_generator import DocGenerator
+
+        def model(name, parents=()):
+            return {
+                "name": name,
+                "schema": "gold",
+                "depends_on": {"nodes": [f"model.edp_io.{p}" for p in parents]},
+            }
+
+        (tmp_path / "target").mkdir()
+        manifest = {
+            "nodes": {
+                "model.edp_io.stg_orders": model("stg_orders"),
+                "model.edp_io.stg_customers": model("stg_customers"),
+                "model.edp_io.dim_customer": model("dim_customer", ["stg_customers"]),
+                "model.edp_io.fact_sales": model("fact_sales", ["stg_orders", "dim_customer"]),
+            }
+        }
+        (tmp_path / "target" / "manifest.json").write_text(json.dumps(manifest))
+        generator = DocGenerator(str(tmp_path))
+
+        def names(**kwargs):
+            return [doc.model_name for doc in generator.generate_all(**kwargs)]
+
+        assert names(select=["stg_*"]) == ["stg_orders", "stg_customers"]
+        assert names(select=["+dim_customer"]) == ["stg_customers", "dim_customer"]
+        assert names(select=["+fact_sales"], exclude=["stg_*"]) == ["dim_customer", "fact_sales"]
+
+    def test_doc_cache_roundtrip(self, tmp_path):
+        """Test the doc cache keys on the full request body."""
+        from src.observability.doc_generator import DocCache
+
+        cache = DocCache(tmp_path / "target" / "doc_cache.sqlite")
+        params = {"model": "gpt-4o", "messages": [{"role": "user", "content": "SELECT 1"}]}
+        key = DocCache.key_for(params)
+
+        assert cache.get(key) is None
+        cache.put(key, '{"summary": "s"}')
+        assert cache.get(key) == '{"summary": "s"}'
+
+        changed = {**params, "messages": [{"role": "user", "content": "SELECT 2"}]}
+        assert DocCache.key_for(changed) != key
+
+    def test_export_markdown(self, mock_settings, tmp_path):
+        """Test markdown export renders layers and model sections."""
+        mock_settings.enable_llm_observability = False
+
+        from src.observability.doc_generator import DocGenerator
+
+        generator = DocGenerator()
+        output = tmp_path / "models.md"
+        generator.export_markdown(generator.generate_all(), str(output))
+
+        content = output.read_text()
+        assert content.startswith("# EDP-IO Data Model Documentation\n")
+        assert content.index("## Silver Layer") < content.index("## Gold Layer")
+        assert "### stg_customers" in content
+        assert "**Key Transformations:**\n- Data type standardization\n" in content
+        assert "```sql\n-- Get current customers" in content
+
+    def test_parallel_render_keeps_order_and_bounds_pending_chunks(self, mock_settings):
+        """Test parallel rendering yields in order with few chunks outstanding."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_settings.enable_llm_observability = False
+
+        from src.observability.doc_generator import (
+            DocGenerator,
+            _render_model,
+            _render_parallel,
+        )
+
+        generator = DocGenerator()
+        docs = [generator._get_mock_doc(f"stg_table_{i}", {}) for i in range(300)]
+        submitted = 0
+
+        class CountingPool(ThreadPoolExecutor):
+            def submit(self, fn, *args):
+                nonlocal submitted
+                submitted += 1
+                return super().submit(fn, *args)
+
+        with CountingPool(max_workers=2) as pool:
+            rendered = _render_parallel(pool, docs, max_in_flight=3)
+            first = next(rendered)
+            assert submitted == 3
+            sections = [first, *rendered]
+
+        assert sections == [_render_model(doc) for doc in docs]
+
+
+class TestLLMMetricsStore:
+    """Tests for the LLM metrics store."""
+
+    @staticmethod
+    def _metric(call_id, role=None, cost=0.01):
+        from datetime import datetime, timezone
+
+        from src.observability.llm_metrics import LLMCallMetrics, LLMModel, LLMRole
+
+        return LLMCallMetrics(
+            call_id=call_id,
+            timestamp=datetime.now(timezone.utc),
+            role=role or LLMRole.LOG_ANALYZER,
+            model=LLMModel.GPT4,
+            input_tokens=100,
+            output_tokens=50,
+            total_tokens=150,
+            latency_ms=120.0,
+            cost_usd=cost,
+        )
+
+    def test_metrics_persist_and_reload(self, tmp_path):
+        """Test metrics added from several threads are persisted and reloaded."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.observability.llm_metrics import LLMMetricsStore, LLMRole
+
+        path = str(tmp_path / "llm_metrics")
+        store = LLMMetricsStore(path)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: store.add(self._metric(f"call_{i}")), range(25)))
+        store.add(self._metric("drift", role=LLMRole.SCHEMA_DRIFT))
+        store.flush()
+
+        reloaded = LLMMetricsStore(path)
+        assert len(reloaded.get_all()) == 26
+        assert [m.call_id for m in reloaded.get_by_role(LLMRole.SCHEMA_DRIFT)] == ["drift"]
+
+    def test_flusher_survives_failed_batch(self, tmp_path):
+        """Test a batch that fails to persist neither kills the flusher nor hangs flush()."""
+        from src.observability.llm_metrics import LLMMetricsStore
+
+        store = LLMMetricsStore(str(tmp_path / "llm_metrics"))
+        persist = store._persist
+        calls = []
+
+        def fail_once(batch):
+            calls.append(len(batch))
+            if len(calls) == 1:
+                raise OSError("disk full")
+            persist(batch)
+
+        store._persist = fail_once
+        store.add(self._metric("lost"))
+        assert store.flush(timeout=5)
+
+        store.add(self._metric("kept"))
+        assert store.flush(timeout=5)
+        assert store._flusher.is_alive()
+        assert [m.call_id for m in LLMMetricsStore(str(tmp_path / "llm_metrics")).get_all()] == [
+            "kept"
+        ]
+
+    def test_close_persists_and_stops_flusher(self, tmp_path, monkeypatch):
+        """Test close() persists pending metrics, ends the thread and drops the exit hook."""
+        from types import SimpleNamespace
+
+        import pytest
+
+        from src.observability import llm_metrics
+
+        hooks = []
+        monkeypatch.setattr(
+            llm_metrics,
+            "atexit",
+            SimpleNamespace(register=hooks.append, unregister=hooks.remove),
+        )
+        store = llm_metrics.LLMMetricsStore(str(tmp_path / "llm_metrics"))
+        for i in range(15):
+            store.add(self._metric(f"call_{i}"))
+
+        assert store.close(timeout=5)
+        assert store.close(timeout=5)
+        assert not store._flusher.is_alive()
+        assert hooks == []
+        with pytest.raises(RuntimeError):
+            store.add(self._metric("late"))
+        assert len(llm_metrics.LLMMetricsStore(str(tmp_path / "llm_metrics")).get_all()) == 15
+
+    def test_naive_timestamp_normalized_and_readable_at_once(self, tmp_path):
+        """Test add() converts naive timestamps to UTC and indexes before returning."""
+        from dataclasses import replace
+        from datetime import datetime, timezone
+
+        from src.observability.llm_metrics import LLMMetricsStore
+
+        store = LLMMetricsStore(str(tmp_path / "llm_metrics"))
+        naive = datetime.now()
+        store.add(replace(self._metric("naive"), timestamp=naive))
+
+        [metric] = store.get_all()
+        assert metric.timestamp == naive.astimezone(timezone.utc)
+        assert len(store.columns().timestamp_ns) == 1
+        assert store.flush(timeout=5)
+        assert len(LLMMetricsStore(str(tmp_path / "llm_metrics")).get_all()) == 1
+
+    def test_legacy_json_store_migrated_once(self, tmp_path):
+        """Test a pre-partition llm_metrics.json history is imported, then set aside."""
+        import json
+
+        from src.observability.llm_metrics import LLMMetricsStore
+
+        legacy = tmp_path / "llm_metrics.json"
+        legacy.write_text(json.dumps([self._metric(f"old_{i}").to_dict() for i in range(3)]))
+
+        store = LLMMetricsStore(str(tmp_path / "llm_metrics"))
+        assert [m.call_id for m in store.get_all()] == ["old_0", "old_1", "old_2"]
+        assert not legacy.exists()
+        assert (tmp_path / "llm_metrics.json.migrated").exists()
+
+        assert len(LLMMetricsStore(str(tmp_path / "llm_metrics")).get_all()) == 3
+
+    def test_analytics_aggregates(self, tmp_path):
+        """Test summary, per-role and per-model aggregations."""
+        from src.observability.llm_metrics import LLMAnalytics, LLMMetricsStore, LLMRole
+
+        store = LLMMetricsStore(str(tmp_path / "llm_metrics"))
+        store.add(self._metric("a", cost=0.01))
+        store.add(self._metric("b", cost=0.03))
+        store.add(self._metric("c", role=LLMRole.SCHEMA_DRIFT, cost=0.02))
+        store.flush()
+
+        analytics = LLMAnalytics(store)
+        summary = analytics.get_summary()
+        by_role = analytics.get_by_role()
+        trend = analytics.get_daily_trend()
+
+        assert summary["total_calls"] == 3
+        assert summary["total_tokens"] == 450
+        assert summary["success_rate"] == 100.0
+        assert summary["avg_confidence"] is None
+        assert by_role["log_analyzer"]["calls"] == 2
+        assert abs(by_role["log_analyzer"]["cost_usd"] - 0.04) < 1e-9
+        assert set(by_role) == {"log_analyzer", "schema_drift"}
+        assert [day["calls"] for day in trend] == [3]
+        assert abs(analytics.get_cost_breakdown()["gpt-4"] - 0.06) < 1e-9
+        assert analytics.get_latency_percentiles() == {"p50": 120.0, "p95": 120.0, "p99": 120.0}
+        assert analytics.get_latency_percentiles(role=LLMRole.DOC_GENERATOR)["p99"] is None
+
+    def test_hot_window_evicts_to_day_partitions(self, tmp_path, monkeypatch):
+        """Test evicted metrics stay queryable from their day partitions."""
+        from dataclasses import replace
+        from datetime import datetime, timedelta, timezone
+
+        from src.observability import llm_metrics
+        from src.utils.config import get_settings
+
+        settings = get_settings().model_copy(update={"metrics_hot_cap": 2})
+        monkeypatch.setattr(llm_metrics, "get_settings", lambda: settings)
+
+        store = llm_metrics.LLMMetricsStore(str(tmp_path / "llm_metrics"))
+        now = datetime.now(timezone.utc)
+        for days_ago in (2, 1, 0):
+            metric = self._metric(f"call_{days_ago}")
+            store.add(replace(metric, timestamp=now - timedelta(days=days_ago)))
+        store.flush()
+
+        assert [m.call_id for m in store.get_all()] == ["call_1", "call_0"]
+        # Past days are sealed (compressed); today stays plain JSONL
+        assert len(list((tmp_path / "llm_metrics").glob("*.jsonl"))) == 1
+        assert len(list((tmp_path / "llm_metrics").glob("*.jsonl.zst"))) == 2
+
+        history = store.get_by_timerange(now - timedelta(days=3))
+        assert [m.call_id for m in history] == ["call_2", "call_1", "call_0"]
+        assert store.get_by_timerange(now - timedelta(hours=1)) == store.get_all()[1:]
+
+        reloaded = llm_metrics.LLMMetricsStore(str(tmp_path / "llm_metrics"))
+        assert len(reloaded.columns().timestamp_ns) == 3
+
+    def test_corrupt_records_cost_only_themselves(self, tmp_path):
+        """Test a bad line skips one record and a bad partition skips one day."""
+        from dataclasses import replace
+        from datetime import datetime, timedelta, timezone
+
+        import zstandard
+
+        from src.observability.llm_metrics import LLMMetricsStore
+
+        root = tmp_path / "llm_metrics"
+        store = LLMMetricsStore(str(root))
+        now = datetime.now(timezone.utc)
+        for call_id, days_ago in [("old_a", 1), ("old_b", 1), ("new_a", 0), ("new_b", 0)]:
+            store.add(replace(self._metric(call_id), timestamp=now - timedelta(days=days_ago)))
+        store.flush()
+
+        # Garbage between two sealed records, a torn line at the end of today's
+        # partition, and a partition whose only record misses its fields
+        [sealed] = root.glob("*.jsonl.zst")
+        lines = zstandard.ZstdDecompressor().decompress(sealed.read_bytes()).splitlines(True)
+        sealed.write_bytes(
+            zstandard.ZstdCompressor().compress(lines[0] + b"\xff{oops\n" + lines[1])
+        )
+        [today] = root.glob("*.jsonl")
+        with open(today, "ab") as f:
+            f.write(b'{"call_id": "torn", "timest')
+        (root / (now - timedelta(days=2)).strftime("%Y-%m-%d.jsonl")).write_text(
+            '{"call_id": "x"}\n'
+        )
+
+        reloaded = LLMMetricsStore(str(root))
+
+        assert [m.call_id for m in reloaded.get_all()] == ["old_a", "old_b", "new_a", "new_b"]
+        assert len(reloaded.columns().timestamp_ns) == 4
+
+    def test_append_after_torn_tail_starts_new_line(self, tmp_path):
+        """Test records appended after a crash mid-write are not glued to the torn line."""
+        from datetime import datetime, timedelta, timezone
+
+        from src.observability.llm_metrics import LLMMetricsStore
+
+        root = tmp_path / "llm_metrics"
+        store = LLMMetricsStore(str(root))
+        store.add(self._metric("before"))
+        store.flush()
+        [today] = root.glob("*.jsonl")
+        with open(today, "ab") as f:
+            f.write(b'{"call_id": "torn", "timest')
+        bad_day = datetime.now(timezone.utc) - timedelta(days=2)
+        (root / bad_day.strftime("%Y-%m-%d.jsonl")).write_text('{"call_id": "x"}\n')
+
+        store = LLMMetricsStore(str(root))
+        store.add(self._metric("after"))
+        store.add(self._metric("later"))
+        store.flush()
+
+        reloaded = LLMMetricsStore(str(root))
+        assert [m.call_id for m in reloaded.get_all()] == ["before", "after", "later"]
+        history = reloaded.get_by_timerange(bad_day - timedelta(days=1))
+        assert [m.call_id for m in history] == ["before", "after", "later"]
+
+
+class TestRAGContextProvider:
+    """Tests for RAG context retrieval."""
+
+    def test_vector_store_failure_falls_back_to_keywords(self, mock_settings, monkeypatch):
+        """Test a vector store that fails to start is tried once, then keyword ranking is used."""
+        import sys
+        from types import SimpleNamespace
+
+        from src.observability.rag_context import RAGContextProvider
+
+        attempts = []
+
+        def broken_client(path):
+            attempts.append(path)
+            raise RuntimeError("index is corrupt")
+
+        monkeypatch.setitem(
+            sys.modules, "chromadb", SimpleNamespace(PersistentClient=broken_client)
+        )
+        monkeypatch.setitem(
+            sys.modules, "sentence_transformers", SimpleNamespace(SentenceTransformer=object)
+        )
+        mock_settings.enable_llm_observability = True
+        provider = RAGContextProvider()
+        provider.settings = mock_settings
+
+        assert provider._get_vector_store() is None
+        assert provider._get_vector_store() is None
+        assert len(attempts) == 1
+        assert provider.get_context("Connection refused by Oracle").chunks
+
+    def test_documents_cached_until_file_changes(self, mock_settings, tmp_path):
+        """Test loaders reparse only when the source file's mtime changes."""
+        import os
+
+        from src.observability.rag_context import RAGContextProvider
+
+        contracts = tmp_path / "src/ingestion/data_contracts/contracts.yaml"
+        contracts.parent.mkdir(parents=True)
+        contracts.write_text("customers:\n  owner: crm-team\n")
+
+        provider = RAGContextProvider(str(tmp_path))
+        first = provider._load_data_contracts()
+        assert provider._load_data_contracts() is first
+
+        contracts.write_text("customers:\n  owner: crm-team\norders:\n  owner: erp-team\n")
+        os.utime(contracts, ns=(0, contracts.stat().st_mtime_ns + 10**9))
+
+        assert [c.metadata["table"] for c in provider._load_data_contracts()] == [
+            "customers",
+            "orders",
+        ]
+
+    def test_yaml_loaded_through_json_sidecar(self, tmp_path, monkeypatch):
+        """Test parsed YAML is cached as JSON and reused only for the same file version."""
+        import json
+        import os
+
+        from src.observability import rag_context
+
+        monkeypatch.setenv("EDP_IO_CACHE_DIR", str(tmp_path / "cache"))
+        source = tmp_path / "contracts.yaml"
+        source.write_text("customers:\n  owner: crm-team\n")
+        assert rag_context._load_yaml_cached(source) == {"customers": {"owner": "crm-team"}}
+        assert not (tmp_path / "contracts.json").exists()
+
+        sidecar = rag_context._yaml_sidecar_path(source)
+        assert sidecar.parent == tmp_path / "cache" / rag_context.YAML_CACHE_SUBDIR
+        assert sidecar.parent.stat().st_mode & 0o777 == 0o700
+        cached = json.loads(sidecar.read_text())
+        cached["data"]["customers"]["owner"] = "from-sidecar"
+        sidecar.write_text(json.dumps(cached))
+        assert rag_context._load_yaml_cached(source)["customers"]["owner"] == "from-sidecar"
+
+        # Restored with an older mtime (cp -p): still reparsed
+        source.write_text("customers:\n  owner: billing-team\n")
+        os.utime(source, ns=(0, 0))
+        assert rag_context._load_yaml_cached(source)["customers"]["owner"] == "billing-team"
+
+    def test_providers_share_loader_threads(self, mock_settings):
+        """Test creating and using many providers does not add threads per provider."""
+        import threading
+
+        from src.observability.rag_context import RAGContextProvider
+
+        RAGContextProvider().get_context("Connection refused by Oracle")
+        baseline = threading.active_count()
+        for _ in range(10):
+            RAGContextProvider().get_context("Connection refused by Oracle")
+
+        assert threading.active_count() <= baseline
+
+    def test_ranking_leaves_cached_chunks_untouched(self, mock_settings):
+        """Test relevance scores are set on copies, not the shared chunks."""
+        from src.observability.rag_context import QueryType, RAGContextProvider
+
+        provider = RAGContextProvider()
+        context = provider.get_context("Connection refused by Oracle", QueryType.ERROR_ANALYSIS)
+
+        assert context.chunks[0].relevance_score > 0
+        assert all(c.relevance_score == 0.0 for c in provider._load_error_history())
+
+    def test_query_embedding_cache_reuses_normalized_queries(self):
+        """Test repeated errors differing only in volatile tokens embed once."""
+        from src.observability.rag_context import QueryEmbeddingCache
+
+        cache = QueryEmbeddingCache(maxsize=1)
+        calls = []
+
+        def embed(text):
+            calls.append(text)
+            return [float(len(calls))]
+
+        first = cache.get("2024-01-15T02:00:01Z Connection refused (pid 48213)", embed)
+        again = cache.get("2024-01-16T09:30:00Z Connection refused (pid 51877)", embed)
+        cache.get("Column 'loyalty_points' not found", embed)  # Evicts the first entry
+
+        assert again == first
+        assert cache.get("2024-01-17T00:00:00Z Connection refused (pid 60001)", embed) != first
+        assert len(calls) == 3
@@ -0,0 +1,505 @@
+# ============================================================================
+# EDP-IO - Provider Tests
+# ============================================================================
+"""
+Tests for the cloud provider abstractions, using the mock and local providers.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+
+def _fake_compute_provider(states):
+    """ComputeProvider whose runs report the given states, then stay on the last."""
+    from src.providers.compute import ComputeProvider, JobRun
+
+    class FakeComputeProvider(ComputeProvider):
+        def __init__(self):
+            self.calls = []
+            self._lock = threading.Lock()
+
+        def get_job_status(self, run_id):
+            with self._lock:
+                self.calls.append(run_id)
+                seen = self.calls.count(run_id)
+            if isinstance(states, Exception):
+                raise states
+            state = states[min(seen, len(states)) - 1]
+            return JobRun(run_id=run_id, job_id="job", state=state, start_time=datetime.now())
+
+        create_cluster = get_cluster = list_clusters = terminate_cluster = None
+        submit_job = cancel_job = get_spark_session = None
+
+    FakeComputeProvider.__abstractmethods__ = frozenset()
+    return FakeComputeProvider()
+
+
+class TestJobPolling:
+    """Tests for wait_for_completion and the shared async status poller."""
+
+    def test_wait_for_completion_backs_off(self, monkeypatch):
+        """Test waits grow by JOB_POLL_BACKOFF (with jitter) up to max_interval."""
+        from src.providers import compute
+
+        delays = []
+        monkeypatch.setattr(compute.time, "sleep", delays.append)
+        provider = _fake_compute_provider(["PENDING"] * 5 + ["SUCCESS"])
+
+        run = provider.wait_for_completion("r1", poll_interval=1.0, max_interval=2.0)
+
+        assert run.state == "SUCCESS"
+        assert len(provider.calls) == 6
+        caps = [min(1.0 * compute.JOB_POLL_BACKOFF**i, 2.0) for i in range(5)]
+        assert all(cap / 2 <= delay <= cap for delay, cap in zip(delays, caps))
+
+    def test_wait_for_completion_times_out(self):
+        """Test a run that never finishes raises TimeoutError after the timeout."""
+        provider = _fake_compute_provider(["RUNNING"])
+
+        with pytest.raises(TimeoutError):
+            provider.wait_for_completion("r1", poll_interval=0.01, timeout=0.05)
+
+    def test_async_variants_run_in_worker_threads(self):
+        """Test *_async methods return the blocking call's result from a worker thread."""
+        provider = _fake_compute_provider(["RUNNING"])
+        get_job_status = provider.get_job_status
+        threads = []
+
+        def record(run_id):
+            threads.append(threading.get_ident())
+            return get_job_status(run_id)
+
+        provider.get_job_status = record
+        run = asyncio.run(provider.get_job_status_async("r1"))
+
+        assert run.state == "RUNNING"
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_async_waiters_share_one_poll_per_run(self):
+        """Test many waiters on few runs cost status calls per run, not per waiter."""
+        provider = _fake_compute_provider(["RUNNING", "RUNNING", "SUCCESS"])
+
+        async def wait_all():
+            return await asyncio.gather(
+                *(
+                    provider.wait_for_completion_async(r, poll_interval=0.01)
+                    for r in ["a", "b"] * 25
+                )
+            )
+
+        runs = asyncio.run(wait_all())
+
+        assert {run.state for run in runs} == {"SUCCESS"}
+        assert sorted(provider.calls) == ["a"] * 3 + ["b"] * 3
+
+    def test_async_waiter_cancellation_and_errors(self):
+        """Test a cancelled waiter leaves the others polling, and errors reach every waiter."""
+        from src.providers import compute
+
+        provider = _fake_compute_provider(["RUNNING"] * 3 + ["SUCCESS"])
+        failing = _fake_compute_provider(RuntimeError("API down"))
+
+        async def scenario():
+            cancelled = asyncio.create_task(provider.wait_for_completion_async("r", 0.01))
+            kept = asyncio.create_task(provider.wait_for_completion_async("r", 0.01))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+
+            errors = await asyncio.gather(
+                failing.wait_for_completion_async("x"),
+                failing.wait_for_completion_async("x"),
+                return_exceptions=True,
+            )
+            with pytest.raises(TimeoutError):
+                await _fake_compute_provider(["RUNNING"]).wait_for_completion_async(
+                    "slow", poll_interval=0.01, timeout=0.05
+                )
+            return await kept, cancelled.cancelled(), errors, compute._status_multiplexer()
+
+        run, was_cancelled, errors, multiplexer = asyncio.run(scenario())
+
+        assert run.state == "SUCCESS"
+        assert was_cancelled
+        assert [str(e) for e in errors] == ["API down", "API down"]
+        assert failing.calls == ["x"]
+        assert not multiplexer._subs
+
+    def test_async_waiters_get_poller_failures(self):
+        """Test a failure in the poller itself reaches the waiters instead of hanging them."""
+        provider = _fake_compute_provider(["RUNNING"])
+        provider.get_job_status_async = lambda run_id: asyncio.sleep(0)  # Returns None
+
+        async def wait_all():
+            return await asyncio.gather(
+                provider.wait_for_completion_async("a", timeout=5),
+                provider.wait_for_completion_async("b", timeout=5),
+                return_exceptions=True,
+            )
+
+        errors = asyncio.run(wait_all())
+
+        assert [type(e) for e in errors] == [AttributeError, AttributeError]
+
+
+class TestLocalSparkProvider:
+    """Tests for local job runs, in-process and isolated."""
+
+    def _run(self, provider, script, **parameters):
+        from src.providers.compute import JobConfig
+
+        run = provider.submit_job(
+            JobConfig(name="job", script_path=str(script), parameters=parameters)
+        )
+        return provider.wait_for_completion(run.run_id, poll_interval=0.01)
+
+    def test_job_state_transitions(self, tmp_path):
+        """Test exit codes and exceptions map to SUCCESS/FAILED, with argv set."""
+        from src.providers.compute import LocalSparkProvider
+
+        (tmp_path / "ok.py").write_text(
+            "import sys\nassert sys.argv[1:] == ['--day=2024-01-15'], sys.argv\n"
+        )
+        (tmp_path / "exits.py").write_text("import sys\nsys.exit(3)\n")
+        (tmp_path / "raises.py").write_text("raise ValueError('bad input')\n")
+
+        provider = LocalSparkProvider()
+
+        assert self._run(provider, tmp_path / "ok.py", day="2024-01-15").state == "SUCCESS"
+        assert self._run(provider, tmp_path / "exits.py").state == "FAILED"
+        assert self._run(provider, tmp_path / "raises.py").state == "FAILED"
+
+    def test_job_imports_sibling_modules(self, tmp_path):
+        """Test sibling imports work during the run and are forgotten after it."""
+        import sys
+
+        from src.providers.compute import LocalSparkProvider
+
+        (tmp_path / "job_helper.py").write_text("VALUE = 7\n")
+        (tmp_path / "job.py").write_text(
+            "import sys\nimport job_helper\nsys.exit(job_helper.VALUE - 7)\n"
+        )
+        path_before = list(sys.path)
+
+        assert self._run(LocalSparkProvider(), tmp_path / "job.py").state == "SUCCESS"
+        assert sys.path == path_before
+        assert "job_helper" not in sys.modules
+
+        # The next run sees the edited sibling module
+        (tmp_path / "job_helper.py").write_text("VALUE = 70\n")
+        assert self._run(LocalSparkProvider(), tmp_path / "job.py").state == "FAILED"
+
+    def test_cancel_only_drops_queued_runs(self, tmp_path):
+        """Test a queued run can be cancelled, a running one cannot."""
+        from src.providers.compute import JobConfig, LocalSparkProvider
+
+        started = tmp_path / "started"
+        (tmp_path / "slow.py").write_text(
+            f"import pathlib, time\npathlib.Path({str(started)!r}).touch()\ntime.sleep(0.3)\n"
+        )
+        provider = LocalSparkProvider()
+        config = JobConfig(name="slow", script_path=str(tmp_path / "slow.py"))
+
+        running = provider.submit_job(config)
+        queued = provider.submit_job(config)
+        while not started.exists():
+            time.sleep(0.01)
+
+        assert provider.cancel_job(queued.run_id)
+        assert provider.get_job_status(queued.run_id).state == "CANCELLED"
+        assert not provider.cancel_job(running.run_id)
+        assert provider.wait_for_completion(running.run_id, poll_interval=0.01).state == "SUCCESS"
+
+    def test_isolated_job_can_be_cancelled_while_running(self, tmp_path):
+        """Test isolated jobs run in a child process that cancel_job stops."""
+        from src.providers.compute import JobConfig, LocalSparkProvider
+
+        (tmp_path / "exits.py").write_text("import os\nos._exit(0)\n")
+        (tmp_path / "slow.py").write_text("import time\ntime.sleep(30)\n")
+        provider = LocalSparkProvider(isolated=True)
+
+        assert self._run(provider, tmp_path / "exits.py").state == "SUCCESS"
+        run = provider.submit_job(JobConfig(name="slow", script_path=str(tmp_path / "slow.py")))
+        assert provider.get_job_status(run.run_id).state == "RUNNING"
+        assert provider.cancel_job(run.run_id)
+        assert provider.get_job_status(run.run_id).state == "CANCELLED"
+
+    def test_stopped_session_is_replaced(self, monkeypatch):
+        """Test a session stopped by a job script is not handed out again."""
+        import sys
+        from types import SimpleNamespace
+
+        from src.providers import compute
+
+        def new_session():
+            return SimpleNamespace(sparkContext=SimpleNamespace(_jsc=object()))
+
+        class Builder:
+            def __getattr__(self, name):
+                return lambda *args: self
+
+            def getOrCreate(self):
+                return new_session()
+
+        fake_sql = SimpleNamespace(SparkSession=SimpleNamespace(builder=Builder()))
+        monkeypatch.setitem(sys.modules, "pyspark", SimpleNamespace(sql=fake_sql))
+        monkeypatch.setitem(sys.modules, "pyspark.sql", fake_sql)
+        monkeypatch.setattr(compute, "_LOCAL_SPARK", None)
+        provider = compute.LocalSparkProvider()
+
+        session = provider.get_spark_session()
+        assert provider.get_spark_session() is session
+
+        session.sparkContext._jsc = None  # What spark.stop() leaves behind
+        assert provider.get_spark_session() is not session
+
+
+class TestLLMProvider:
+    """Tests for the mock LLM provider, chat cache and provider factories."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_providers(self):
+        from src.providers import reset_provider_cache
+
+        reset_provider_cache()
+        yield
+        reset_provider_cache()
+
+    def _counting_provider(self):
+        from src.providers.llm import MockLLMProvider
+
+        class CountingProvider(MockLLMProvider):
+            calls = 0
+
+            def chat(self, messages, temperature=0.0):
+                CountingProvider.calls += 1
+                return super().chat(messages, temperature)
+
+        return CountingProvider()
+
+    def test_azure_embed_many_batches_in_input_order(self):
+        """Test embed_many sends batch_size texts per request and keeps input order."""
+        from types import SimpleNamespace
+
+        from src.providers.llm import AzureOpenAIProvider
+
+        requests = []
+
+        def create(model, input):
+            requests.append(list(input))
+            data = [
+                SimpleNamespace(index=i, embedding=[float(len(t))]) for i, t in enumerate(input)
+            ]
+            # The API tags results with their input index; return them reversed
+            return SimpleNamespace(data=data[::-1])
+
+        provider = AzureOpenAIProvider()
+        provider._client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+
+        vectors = provider.embed_many(["a", "bb", "ccc", "dddd", "eeeee"], batch_size=2)
+
+        assert vectors == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert requests == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+    def test_default_embed_many_embeds_each_text(self):
+        """Test the base embed_many is embed() per text, in order."""
+        from src.providers.llm import LLMProvider, MockLLMProvider
+
+        provider = MockLLMProvider()
+        texts = ["orders", "customers"]
+
+        assert LLMProvider.embed_many(provider, texts) == [provider.embed(t) for t in texts]
+
+    def test_chat_cached_reuses_temperature_zero_responses(self):
+        """Test identical temperature-0 requests call chat() once."""
+        from src.providers.llm import LLMMessage
+
+        provider = self._counting_provider()
+        messages = [LLMMessage(role="user", content="Explain this error")]
+
+        first = provider.chat_cached(messages)
+        again = provider.chat_cached([LLMMessage(role="user", content="Explain this error")])
+        provider.chat_cached([LLMMessage(role="user", content="Something else")])
+
+        assert again is first
+        assert provider.calls == 2
+
+    def test_chat_cached_bypasses(self):
+        """Test non-zero temperature and the NO_CACHE_ROLE marker always call chat()."""
+        from src.providers.llm import NO_CACHE_ROLE, LLMMessage
+
+        provider = self._counting_provider()
+        messages = [LLMMessage(role="user", content="hi")]
+        sent = []
+        original_chat = type(provider).chat
+
+        def record(self, msgs, temperature=0.0):
+            sent.append([m.role for m in msgs])
+            return original_chat(self, msgs, temperature)
+
+        type(provider).chat = record
+        provider.chat_cached(messages, temperature=0.7)
+        provider.chat_cached(messages, temperature=0.7)
+        provider.chat_cached(messages + [LLMMessage(role=NO_CACHE_ROLE, content="")])
+        provider.chat_cached(messages + [LLMMessage(role=NO_CACHE_ROLE, content="")])
+
+        assert provider.calls == 4
+        assert sent[-1] == ["user"]
+
+    def test_chat_cache_is_bounded_and_responses_frozen(self, monkeypatch):
+        """Test the least recently used entry is evicted and cached responses are frozen."""
+        from pydantic import ValidationError
+
+        from src.providers import llm
+        from src.providers.llm import LLMMessage
+
+        monkeypatch.setattr(llm, "CHAT_CACHE_SIZE", 2)
+        provider = self._counting_provider()
+        ask = lambda text: provider.chat_cached([LLMMessage(role="user", content=text)])
+
+        first = ask("a")
+        ask("b")
+        ask("a")  # Refreshes "a"
+        ask("c")  # Evicts "b"
+        ask("a")
+        ask("b")
+
+        assert provider.calls == 4
+        with pytest.raises(ValidationError):
+            first.content = "changed"
+
+    def test_cached_response_usage_is_frozen(self):
+        """Test the nested usage of a shared cached response cannot be changed."""
+        from pydantic import ValidationError
+
+        from src.providers.llm import LLMMessage, MockLLMProvider
+
+        response = MockLLMProvider().chat_cached([LLMMessage(role="user", content="hi")])
+
+        with pytest.raises(ValidationError):
+            response.usage.total_tokens = 999
+
+    def test_chat_cache_key_depends_on_request_content(self):
+        """Test the cache key is stable for equal requests and differs otherwise."""
+        from src.providers.llm import LLMMessage, _chat_cache_key
+
+        messages = [LLMMessage(role="user", content="hi")]
+        key = _chat_cache_key("mock/gpt-4", messages, 0.0)
+
+        assert key == _chat_cache_key("mock/gpt-4", [LLMMessage(role="user", content="hi")], 0.0)
+        others = {
+            _chat_cache_key("azure/gpt-4", messages, 0.0),
+            _chat_cache_key("mock/gpt-4", messages, 0.5),
+            _chat_cache_key("mock/gpt-4", [LLMMessage(role="system", content="hi")], 0.0),
+        }
+        assert key not in others and len(others) == 3
+
+    def test_mock_embed_many_matches_reference(self):
+        """Test the vectorized mock embeddings equal ((md5 >> i) % 100) / 100."""
+        from src.providers.llm import MOCK_EMBEDDING_DIM, MockLLMProvider
+
+        texts = ["", "orders", "Connection refused by Oracle", "ção"]
+        vectors = MockLLMProvider().embed_many(texts)
+
+        for text, vector in zip(texts, vectors):
+            h = int(hashlib.md5(text.encode()).hexdigest(), 16)
+            expected = [((h >> i) % 100) / 100.0 for i in range(MOCK_EMBEDDING_DIM)]
+            assert vector == expected
+        assert MockLLMProvider().embed("orders") == vectors[1]
+
+    def test_reset_provider_cache(self):
+        """Test factories share one instance until the cache is reset."""
+        from src.providers import get_llm_provider, reset_provider_cache
+
+        provider = get_llm_provider("mock")
+        assert get_llm_provider("mock") is provider
+
+        reset_provider_cache()
+        assert get_llm_provider("mock") is not provider
+
+    def test_reset_provider_cache_clears_chat_cache(self):
+        """Test cached chat responses are dropped with the providers."""
+        from src.providers import get_llm_provider, reset_provider_cache
+        from src.providers.llm import LLMMessage
+
+        messages = [LLMMessage(role="user", content="hi")]
+        cached = get_llm_provider("mock").chat_cached(messages)
+        reset_provider_cache()
+
+        assert get_llm_provider("mock").chat_cached(messages) is not cached
+
+
+class TestStorageProvider:
+    """Tests for the storage interface, using the mock (local filesystem) provider."""
+
+    def test_async_transfers_round_trip(self, tmp_path):
+        """Test upload_file_async/download_file_async move the file through storage."""
+        from src.providers.storage import MockStorageProvider
+
+        provider = MockStorageProvider(str(tmp_path / "store"))
+        source = tmp_path / "orders.csv"
+        source.write_bytes(b"order_id\nORD-1\n")
+
+        async def round_trip():
+            await provider.upload_file_async(str(source), "bronze/orders.csv")
+            return await provider.download_file_async(
+                "bronze/orders.csv", str(tmp_path / "copy.csv")
+            )
+
+        assert open(asyncio.run(round_trip()), "rb").read() == source.read_bytes()
+
+    def test_open_read_streams_object(self, tmp_path):
+        """Test open_read returns a closable binary stream over the object."""
+        from src.providers.storage import MockStorageProvider
+
+        provider = MockStorageProvider(str(tmp_path))
+        provider.upload_bytes(b"x" * 1000, "raw/blob.bin")
+
+        with provider.open_read("raw/blob.bin") as stream:
+            assert stream.read(10) == b"x" * 10
+            assert len(stream.read()) == 990
+
+    def test_azure_open_read_wraps_downloader_chunks(self):
+        """Test the Azure stream reads across chunk boundaries and stops fetching on close."""
+        from types import SimpleNamespace
+
+        from src.providers.storage import AzureADLSProvider
+
+        fetched = []
+
+        def chunks():
+            for chunk in (b"abc", b"", b"defg", b"hi"):
+                fetched.append(chunk)
+                yield chunk
+
+        downloader = SimpleNamespace(chunks=chunks)
+        file_client = SimpleNamespace(download_file=lambda: downloader)
+        fs_client = SimpleNamespace(get_file_client=lambda path: file_client)
+        provider = AzureADLSProvider(account_name="acct")
+        provider._client = SimpleNamespace(get_file_system_client=lambda name: fs_client)
+
+        with provider.open_read("raw/blob.bin") as stream:
+            assert stream.read() == b"abcdefghi"
+        with provider.open_read("raw/blob.bin") as stream:
+            fetched.clear()
+            assert stream.raw.read(2) == b"ab"
+        assert fetched == [b"abc"]
+        assert stream.closed
+
+    def test_list_objects_is_bounded_view_of_iter_objects(self, tmp_path):
+        """Test list_objects materializes at most max_results of iter_objects."""
+        from src.providers.storage import MockStorageProvider
+
+        provider = MockStorageProvider(str(tmp_path))
+        for i in range(5):
+            provider.upload_bytes(b"row", f"logs/day-{i}.jsonl")
+
+        keys = {obj.key for obj in provider.iter_objects("day-")}
+
+        assert len(keys) == 5
+        assert len(provider.list_objects("day-", max_results=2)) == 2
+        assert {obj.key for obj in provider.list_objects("day-")} == keys